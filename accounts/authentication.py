@@ -0,0 +1,99 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from commons.db.routers import pin_if_recent_writer
+
+
+# 캐시에 저장하는 유저 컬럼 (바꾸면 SNAPSHOT_VERSION 을 올려 이전 형식의 캐시를 사용하지 않도록 함)
+# email: User.__str__ 과 게임 등록/문의 메일 발송에서 사용
+SNAPSHOT_VERSION = 2
+SNAPSHOT_FIELDS = {"id", "email", "nickname", "is_staff", "is_active", "image"}
+SNAPSHOT_KEY = "accounts:user_snapshot:v{version}:{user_id}"
+
+
+def snapshot_key(user_id):
+    return SNAPSHOT_KEY.format(version=SNAPSHOT_VERSION, user_id=user_id)
+
+
+def _snapshot_attnames():
+    # Model.from_db 는 값이 concrete_fields 순서라고 가정하므로 모델 필드 순서대로 나열
+    return [
+        field.attname for field in get_user_model()._meta.concrete_fields
+        if field.name in SNAPSHOT_FIELDS
+    ]
+
+
+def invalidate_user_snapshot(user_id):
+    """
+    유저 정보 변경/삭제 시 캐시된 스냅샷 삭제
+    커밋 전에 다른 요청이 이전 값을 다시 캐시할 수 있으므로 커밋 이후에도 한 번 더 삭제
+    """
+    key = snapshot_key(user_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def get_snapshot_user(user_id):
+    """
+    캐시된 스냅샷으로 만든 User 인스턴스 (없으면 스냅샷 컬럼만 조회하여 캐시)
+    스냅샷에 없는 필드(password, introduce 등)는 처음 접근할 때 DB 에서 불러옴 (Django deferred field)
+    반환값: User, 존재하지 않으면 None
+    """
+    attnames = _snapshot_attnames()
+    key = snapshot_key(user_id)
+    values = cache.get(key)
+    if values is None:
+        values = get_user_model().objects.filter(pk=user_id).values_list(*attnames).first()
+        if values is None:
+            return None
+        cache.set(key, values, settings.USER_SNAPSHOT_TIMEOUT)
+    return get_user_model().from_db(DEFAULT_DB_ALIAS, attnames, values)
+
+
+def get_active_user(request, user_id, fields=()):
+    """
+    user_id 의 활성 회원, 로그인한 본인이면 인증 단계에서 불러온 request.user 를 그대로 사용
+    fields: 스냅샷에 없는 컬럼 중 이 요청에서 쓰는 컬럼 (한 번의 쿼리로 함께 불러옴)
+    반환값: User, 없거나 탈퇴한 회원이면 User.DoesNotExist
+    """
+    user = request.user
+    if not (user.is_authenticated and user.pk == user_id and user.is_active):
+        return get_user_model().objects.get(pk=user_id, is_active=True)
+    deferred = user.get_deferred_fields().intersection(fields)
+    if deferred:
+        user.refresh_from_db(fields=deferred)
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication 과 동일하게 토큰을 검증하되, 유저는 매 요청 DB 대신 캐시된 스냅샷에서 불러옴
+    비밀번호 변경 토큰 무효화(CHECK_REVOKE_TOKEN)를 쓰는 경우에는 기존 방식으로 조회
+    """
+
+    def get_user(self, validated_token):
+        # 최근에 데이터를 변경한 유저는 이번 요청을 primary DB 에서 읽음 (commons.db.routers)
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is not None:
+            pin_if_recent_writer(user_id)
+
+        if api_settings.CHECK_REVOKE_TOKEN or api_settings.USER_ID_FIELD != "id":
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = get_snapshot_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
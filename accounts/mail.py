@@ -0,0 +1,229 @@
+import base64
+import logging
+import os
+import pickle
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from google.auth.transport.requests import Request
+from google_auth_oauthlib.flow import InstalledAppFlow
+from googleapiclient.discovery import build
+
+from .models import OutboundEmail
+
+
+logger = logging.getLogger(__name__)
+
+# Gmail API 인증 관련 상수 값
+SCOPES = ['https://www.googleapis.com/auth/gmail.send']
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # 현재 파일의 디렉토리를 기준으로 절대 경로 설정
+CLIENT_SECRET_FILE = os.path.join(BASE_DIR, 'client_secret.json')
+TOKEN_FILE = 'token.pickle'
+
+# 이메일 템플릿 {이름: (제목, 본문)}, 본문은 발송 시점에 context + secrets 로 채움
+EMAIL_TEMPLATES = {
+    "verification_code": ("Sparta Games 메일 주소 인증 번호", "이메일 인증 코드는  {code}  입니다."),
+}
+# 인증 번호 등 DB 에 남기지 않는 값 (EMAIL_DISPATCH_MAX_AGE 뒤 만료)
+OUTBOUND_SECRETS_KEY = "accounts:outbound_secrets:{pk}"
+
+
+def get_credentials():
+    creds = None
+    if os.path.exists(TOKEN_FILE):
+        with open(TOKEN_FILE, 'rb') as token:
+            creds = pickle.load(token)
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            flow = InstalledAppFlow.from_client_secrets_file(CLIENT_SECRET_FILE, SCOPES)
+            creds = flow.run_local_server(port=0, access_type="offline")
+        with open(TOKEN_FILE, 'wb') as token:
+            pickle.dump(creds, token)
+    return creds
+
+
+# 프로세스 별 Gmail API 클라이언트
+# token.pickle 읽기와 클라이언트 생성은 처음 한 번만 하고, 만료된 access 토큰은 요청 시 클라이언트가 refresh 토큰으로 갱신
+# (httplib2 커넥션은 스레드 간 공유할 수 없으므로 Celery prefork 워커처럼 프로세스 당 스레드 1개에서 사용)
+_lock = threading.Lock()
+_services = {}
+
+
+def get_gmail_service():
+    pid = os.getpid()
+    service = _services.get(pid)
+    if service is None:
+        with _lock:
+            service = _services.get(pid)
+            if service is None:
+                _services.clear()
+                service = _services[pid] = build('gmail', 'v1', credentials=get_credentials(), cache_discovery=False)
+    return service
+
+
+class GmailAPIBackend(BaseEmailBackend):
+    """
+    Gmail API 로 발송하는 Django 이메일 백엔드 (EMAIL_BACKEND)
+    로컬/테스트에서는 EMAIL_BACKEND 를 SMTP, 파일(filebased), locmem 백엔드로 바꿔서 사용
+    """
+
+    def send_messages(self, email_messages):
+        sent = 0
+        for message in email_messages:
+            raw = base64.urlsafe_b64encode(message.message().as_bytes()).decode()
+            try:
+                get_gmail_service().users().messages().send(userId='me', body={'raw': raw}).execute()
+                sent += 1
+            except Exception:
+                if not self.fail_silently:
+                    raise
+        return sent
+
+
+def secrets_key(pk):
+    return OUTBOUND_SECRETS_KEY.format(pk=pk)
+
+
+def render_email(row, secrets):
+    """
+    대기열 행으로 EmailMessage 생성
+    secrets 가 만료되어 본문을 채울 수 없으면 KeyError
+    """
+    subject, body = EMAIL_TEMPLATES[row.template]
+    return EmailMessage(subject, body.format(**row.context, **secrets), settings.DEFAULT_FROM_EMAIL, [row.to])
+
+
+def queue_email(to, template, context=None, secrets=None):
+    """
+    이메일을 발송 대기열(OutboundEmail)에 저장하고, 커밋 이후 Celery 태스크로 발송
+    요청은 발송을 기다리지 않음
+    template: EMAIL_TEMPLATES 의 이름, context: 본문에 넣을 값 (DB 에 저장)
+    secrets: 본문에 넣을 값 중 DB 에 남기면 안 되는 값 (인증 번호 등, 캐시에만 저장)
+    """
+    from .tasks import dispatch_emails
+
+    row = OutboundEmail.objects.create(to=to, template=template, context=context or {})
+    if secrets:
+        try:
+            cache.set(secrets_key(row.pk), secrets, settings.EMAIL_DISPATCH_MAX_AGE)
+        except Exception:
+            # 캐시 장애 → 비밀 값을 DB 에 남기지 않도록 대기열을 거치지 않고 커밋 이후 바로 발송
+            message = render_email(row, secrets)
+            row.delete()
+            transaction.on_commit(lambda: get_connection().send_messages([message]))
+            return
+    transaction.on_commit(lambda: dispatch_emails.delay())
+
+
+def _send_batch(rows):
+    """
+    반환값: (발송한 pk 목록, 실패한 행 목록, 비밀 값이 만료되어 보낼 수 없는 pk 목록)
+    """
+    sent, failed, expired = [], [], []
+    try:
+        secrets = cache.get_many([secrets_key(row.pk) for row in rows])
+        with get_connection() as connection:
+            for row in rows:
+                try:
+                    message = render_email(row, secrets.get(secrets_key(row.pk), {}))
+                except KeyError:
+                    expired.append(row.pk)
+                    continue
+                try:
+                    connection.send_messages([message])
+                    sent.append(row.pk)
+                except Exception as e:
+                    row.last_error = str(e)[:255]
+                    failed.append(row)
+    except Exception as e:
+        # 캐시 조회 또는 연결(인증) 실패 → 아직 보내지 않은 이메일 모두 실패 처리
+        done = set(sent) | set(expired) | {row.pk for row in failed}
+        for row in rows:
+            if row.pk not in done:
+                row.last_error = str(e)[:255]
+                failed.append(row)
+    return sent, failed, expired
+
+
+def purge_outbox():
+    """
+    EMAIL_DISPATCH_MAX_AGE 가 지난 이메일(인증 번호가 만료/재발급됨)과 EMAIL_DISPATCH_MAX_ATTEMPTS 회 실패한 이메일 삭제
+    실패로 삭제하는 이메일은 마지막 에러를 경고 로그로 남김
+    반환값: 삭제한 행 수
+    """
+    now = timezone.now()
+    cutoff = now - timedelta(seconds=settings.EMAIL_DISPATCH_MAX_AGE)
+    # 마지막 시도로 발송 중인(점유된) 이메일은 제외
+    exhausted = OutboundEmail.objects.filter(
+        Q(leased_until__isnull=True) | Q(leased_until__lt=now),
+        attempts__gte=settings.EMAIL_DISPATCH_MAX_ATTEMPTS,
+    )
+    for pk, template, last_error in exhausted.values_list("pk", "template", "last_error"):
+        logger.warning("email dropped after max attempts (outbound %s, %s): %s", pk, template, last_error)
+    deleted, _ = OutboundEmail.objects.filter(
+        Q(created_at__lt=cutoff) | Q(pk__in=exhausted.values("pk"))
+    ).delete()
+    return deleted
+
+
+def _claim_batch(last_pk, cutoff):
+    """
+    발송할 이메일을 최대 EMAIL_DISPATCH_BATCH_SIZE 개 점유 (leased_until 설정, 시도 횟수 증가) 후 바로 커밋
+    다른 워커가 점유 중인 행은 건너뜀 (select_for_update skip_locked + leased_until)
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        rows = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(Q(leased_until__isnull=True) | Q(leased_until__lt=now))
+            .filter(pk__gt=last_pk, attempts__lt=settings.EMAIL_DISPATCH_MAX_ATTEMPTS, created_at__gte=cutoff)
+            .order_by("pk")[:settings.EMAIL_DISPATCH_BATCH_SIZE]
+        )
+        if rows:
+            OutboundEmail.objects.filter(pk__in=[row.pk for row in rows]).update(
+                leased_until=now + timedelta(seconds=settings.EMAIL_DISPATCH_LEASE),
+                attempts=F("attempts") + 1,
+            )
+    return rows
+
+
+def dispatch_pending_emails():
+    """
+    발송 대기열의 이메일을 EMAIL_DISPATCH_BATCH_SIZE 개씩, 배치 당 연결 1개로 발송
+    발송된 이메일과 비밀 값(인증 번호 등)이 만료된 이메일은 삭제하고, 실패한 이메일은 시도 횟수를 늘려 다음 실행에서 재시도 (EMAIL_DISPATCH_MAX_ATTEMPTS 회까지)
+    오래되었거나 재시도를 모두 쓴 이메일은 먼저 삭제 (purge_outbox)
+    발송(네트워크 호출)은 트랜잭션 밖에서 하고, 그동안 다른 워커는 점유된 행을 건너뜀 (_claim_batch)
+    반환값: (발송 수, 실패 수)
+    """
+    purge_outbox()
+    batch_size = settings.EMAIL_DISPATCH_BATCH_SIZE
+    cutoff = timezone.now() - timedelta(seconds=settings.EMAIL_DISPATCH_MAX_AGE)
+    sent_cnt = failed_cnt = 0
+    last_pk = 0
+    while True:
+        rows = _claim_batch(last_pk, cutoff)
+        if not rows:
+            break
+        sent, failed, expired = _send_batch(rows)
+        OutboundEmail.objects.filter(pk__in=sent + expired).delete()
+        for row in failed:
+            row.leased_until = None
+        OutboundEmail.objects.bulk_update(failed, ["last_error", "leased_until"])
+        if sent or expired:
+            cache.delete_many([secrets_key(pk) for pk in sent + expired])
+        sent_cnt += len(sent)
+        failed_cnt += len(failed)
+        last_pk = rows[-1].pk
+        if len(rows) < batch_size:
+            break
+    return sent_cnt, failed_cnt
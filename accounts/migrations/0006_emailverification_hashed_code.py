@@ -0,0 +1,23 @@
+# Generated by Django 4.2 on 2026-10-19 06:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_outboundemail'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailverification',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='emailverification',
+            name='verification_code',
+            field=models.CharField(max_length=64),
+        ),
+    ]
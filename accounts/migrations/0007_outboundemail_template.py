@@ -0,0 +1,38 @@
+# Generated by Django 4.2 on 2026-10-19 08:10
+
+from django.db import migrations, models
+
+
+def delete_queued_emails(apps, schema_editor):
+    # 기존 대기열 행은 본문에 인증 번호가 평문으로 들어있으므로 삭제 (이미 만료된 인증 번호)
+    apps.get_model('accounts', 'OutboundEmail').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_emailverification_hashed_code'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_queued_emails, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='outboundemail',
+            name='body',
+        ),
+        migrations.RemoveField(
+            model_name='outboundemail',
+            name='subject',
+        ),
+        migrations.AddField(
+            model_name='outboundemail',
+            name='template',
+            field=models.CharField(default='', max_length=50),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='outboundemail',
+            name='context',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-19 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_outboundemail_template'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboundemail',
+            name='leased_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
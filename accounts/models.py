@@ -1,5 +1,6 @@
 from datetime import timedelta
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
 from django.utils import timezone
@@ -61,6 +62,17 @@ class User(AbstractUser):
     def __str__(self):
         return self.email
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # 인증 시 사용하는 캐시된 유저 스냅샷 무효화 (accounts.authentication)
+        from .authentication import invalidate_user_snapshot
+        invalidate_user_snapshot(self.pk)
+
+    def delete(self, *args, **kwargs):
+        from .authentication import invalidate_user_snapshot
+        invalidate_user_snapshot(self.pk)
+        return super().delete(*args, **kwargs)
+
 
 # follower가 following을 팔로우하는 것
 class Follow(models.Model):
@@ -69,14 +81,27 @@ class Follow(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
 
-# 이메일 및 인증 코드를 저장
+# 이메일 및 인증 코드(해시)를 저장 - 캐시 서버 장애 시에만 사용 (accounts.verification)
 class EmailVerification(models.Model):
     email = models.EmailField(unique=True)
-    verification_code = models.CharField(max_length=6)
+    verification_code = models.CharField(max_length=64)
+    attempts = models.PositiveSmallIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def is_expired(self):
-        return timezone.now() > self.created_at + timedelta(minutes=5)
+        return timezone.now() > self.created_at + timedelta(seconds=settings.EMAIL_VERIFICATION_TTL)
+
+
+# 발송 대기 중인 이메일 (accounts.mail.queue_email 로 생성, 발송되면 삭제)
+# 본문은 발송 시점에 템플릿으로 만들고, 인증 번호 등 비밀 값은 저장하지 않음 (캐시에만 보관)
+class OutboundEmail(models.Model):
+    to = models.EmailField()
+    template = models.CharField(max_length=50)
+    context = models.JSONField(default=dict, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.CharField(max_length=255, blank=True)
+    leased_until = models.DateTimeField(null=True, blank=True)  # 발송 워커 점유 만료 시각 (발송 중인 행 중복 발송 방지)
+    created_at = models.DateTimeField(auto_now_add=True)
 
 
 class BotCnt(models.Model):
@@ -0,0 +1,210 @@
+import os
+import threading
+
+import jwt
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from spartagames import config
+
+
+GOOGLE_METADATA_KEY = "accounts:oauth:google:metadata"
+GOOGLE_JWKS_KEY = "accounts:oauth:google:jwks"
+GOOGLE_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
+
+
+class ProviderError(Exception):
+    """
+    소셜 로그인 제공자 요청 실패 (연결/타임아웃/응답 오류) 또는 ID 토큰 검증 실패
+    """
+    pass
+
+
+# 프로세스 별 requests.Session
+# 로그인 요청마다 새 커넥션(TCP+TLS)을 맺지 않도록 제공자 호스트 별 커넥션을 유지하여 재사용
+_lock = threading.Lock()
+_sessions = {}
+
+
+def _build_session():
+    retry = Retry(
+        total=settings.SOCIAL_LOGIN_RETRIES,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        # 인가 코드는 한 번만 쓸 수 있으므로 POST 는 요청이 전달되지 않은 연결 실패만 재시도
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=len(settings.SOCIAL_LOGIN_ENDPOINTS),
+        pool_maxsize=settings.SOCIAL_LOGIN_POOL_SIZE,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_http_session():
+    pid = os.getpid()
+    session = _sessions.get(pid)
+    if session is None:
+        with _lock:
+            session = _sessions.get(pid)
+            if session is None:
+                _sessions.clear()  # 부모 프로세스에서 만든 커넥션은 사용하지 않음
+                session = _sessions[pid] = _build_session()
+    return session
+
+
+def request_json(method, url, **kwargs):
+    """
+    공용 세션으로 요청 후 JSON 응답 반환 (연결/읽기 타임아웃 적용)
+    """
+    try:
+        response = get_http_session().request(
+            method, url,
+            timeout=(settings.SOCIAL_LOGIN_CONNECT_TIMEOUT, settings.SOCIAL_LOGIN_READ_TIMEOUT),
+            **kwargs
+        )
+        return response.json()
+    except (requests.RequestException, ValueError) as e:
+        raise ProviderError(f"소셜 로그인 제공자 요청 실패 ({e.__class__.__name__})") from e
+
+
+def endpoint(name):
+    return settings.SOCIAL_LOGIN_ENDPOINTS[name]
+
+
+def _cached_json(key, url, refresh=False):
+    data = None if refresh else cache.get(key)
+    if data is None:
+        data = request_json("GET", url)
+        cache.set(key, data, settings.SOCIAL_LOGIN_METADATA_TIMEOUT)
+    return data
+
+
+def google_metadata():
+    """
+    구글 OpenID 설정 (token_endpoint, jwks_uri 등), SOCIAL_LOGIN_METADATA_TIMEOUT 동안 캐시
+    """
+    return _cached_json(GOOGLE_METADATA_KEY, endpoint("google_discovery"))
+
+
+def _google_signing_key(kid):
+    # 캐시된 공개키에 kid 가 없으면 키가 교체된 것이므로 한 번만 다시 받음
+    jwks_uri = google_metadata()["jwks_uri"]
+    for refresh in (False, True):
+        jwks = _cached_json(GOOGLE_JWKS_KEY, jwks_uri, refresh=refresh)
+        for key in jwks.get("keys", []):
+            if key.get("kid") == kid:
+                return jwt.PyJWK(key).key
+    raise ProviderError("구글 ID 토큰의 서명 키를 찾을 수 없습니다.")
+
+
+def verify_google_id_token(id_token):
+    """
+    구글 ID 토큰을 tokeninfo 요청 없이 공개키(JWKS)로 직접 검증
+    서명(RS256), 만료, 발급자(iss), 대상(aud = client_id) 확인 후 claims 반환
+    """
+    try:
+        header = jwt.get_unverified_header(id_token)
+        claims = jwt.decode(
+            id_token,
+            _google_signing_key(header.get("kid")),
+            algorithms=["RS256"],
+            audience=config.GOOGLE_AUTH["client_id"],
+            leeway=30,
+        )
+    except jwt.PyJWTError as e:
+        raise ProviderError(f"유효하지 않은 구글 ID 토큰입니다. ({e})") from e
+    issuers = {google_metadata().get("issuer"), *GOOGLE_ISSUERS}
+    if claims.get("iss") not in issuers:
+        raise ProviderError("유효하지 않은 구글 ID 토큰입니다. (Invalid issuer)")
+    return claims
+
+
+def google_tokens(code):
+    return request_json(
+        "POST", google_metadata()["token_endpoint"],
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        data={
+            "code": code,
+            "client_id": config.GOOGLE_AUTH["client_id"],
+            "client_secret": config.GOOGLE_AUTH["client_secret"],
+            "redirect_uri": config.GOOGLE_AUTH["redirect_uri"],
+            "grant_type": "authorization_code"
+        },
+    )
+
+
+def naver_tokens(code):
+    return request_json(
+        "GET", endpoint("naver_token"),
+        params={
+            "grant_type": "authorization_code",
+            "client_id": config.NAVER_AUTH["client_id"],
+            "client_secret": config.NAVER_AUTH["client_secret"],
+            "code": code,
+            "state": config.NAVER_AUTH["state"],
+        },
+    )
+
+
+def naver_profile(access_token):
+    return request_json(
+        "GET", endpoint("naver_profile"),
+        headers={"Authorization": "Bearer " + access_token},
+    )
+
+
+def kakao_tokens(code):
+    return request_json(
+        "POST", endpoint("kakao_token"),
+        headers={"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"},
+        data={
+            "code": code,
+            "client_id": config.KAKAO_AUTH["client_id"],
+            "redirect_uri": config.KAKAO_AUTH["redirect_uri"],
+            "grant_type": "authorization_code"
+        },
+    )
+
+
+def kakao_profile(access_token):
+    return request_json(
+        "GET", endpoint("kakao_profile"),
+        headers={
+            "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
+            "Authorization": "Bearer " + access_token,
+        },
+    )
+
+
+def discord_tokens(code):
+    return request_json(
+        "POST", endpoint("discord_token"),
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        data={
+            "code": code,
+            "client_id": config.DISCORD_AUTH["client_id"],
+            "client_secret": config.DISCORD_AUTH["client_secret"],
+            "redirect_uri": config.DISCORD_AUTH["redirect_uri"],
+            "grant_type": "authorization_code",
+            "scope": 'identify, email',
+        },
+    )
+
+
+def discord_profile(access_token):
+    return request_json(
+        "GET", endpoint("discord_profile"),
+        headers={
+            "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
+            "Authorization": "Bearer " + access_token,
+        },
+    )
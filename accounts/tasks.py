@@ -1,8 +1,10 @@
 import requests
 
 from celery import shared_task
+from celery.exceptions import Retry
 
 from spartagames.config import ADMIN_USER_EMAIL, ADMIN_STAFF_EMAIL
+from .mail import dispatch_pending_emails
 
 
 @shared_task
@@ -19,3 +21,22 @@ def routine_email_by_token():
         resp = requests.post("https://sparta-games.net/accounts/api/email/", data=data)
     except Exception as e:
         print(e)
+
+
+@shared_task(bind=True, max_retries=5)
+def dispatch_emails(self):
+    """
+    이메일 발송 대기열 저장 시 커밋 이후 실행 (+ 5분마다 남은 이메일 발송)
+    대기 중인 이메일을 배치로 발송하고, 실패한 이메일이 있으면 지수 백오프로 재시도
+    """
+    try:
+        sent, failed = dispatch_pending_emails()
+        if failed:
+            if self.request.retries >= self.max_retries:
+                return f"Error in dispatching emails: {failed} failed, {sent} sent"
+            raise self.retry(countdown=2 ** self.request.retries * 5)
+        return f"Dispatched {sent} emails"
+    except Retry:
+        raise
+    except Exception as e:
+        return f"Error in dispatching emails: {str(e)}"
@@ -1,3 +1,413 @@
-from django.test import TestCase
+import json
+import re
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import urlparse
 
-# Create your tests here.
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from games.models import GameCategory
+from spartagames import config
+from . import oauth
+from .authentication import CachedJWTAuthentication, get_active_user
+from .mail import dispatch_pending_emails, queue_email, secrets_key
+from .models import EmailVerification, OutboundEmail
+from .verification import (
+    CODE_EXPIRED, CODE_INVALID, CODE_LOCKED, CODE_MISSING, CODE_VALID, check_code, issue_code,
+)
+
+
+class FakeProvider:
+    """
+    로컬 가짜 소셜 로그인 제공자 (구글 OpenID 설정/JWKS/토큰, 카카오 토큰/프로필)
+    경로별 요청 횟수를 hits 에 기록
+    """
+
+    def __init__(self):
+        self.hits = Counter()
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.kid = "key-1"
+        self.claims = {}
+        provider = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body):
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                path = urlparse(self.path).path
+                provider.hits[path] += 1
+                if path == "/google/.well-known/openid-configuration":
+                    self._send({
+                        "issuer": "https://accounts.google.com",
+                        "token_endpoint": provider.url("/google/token"),
+                        "jwks_uri": provider.url("/google/certs"),
+                    })
+                elif path == "/google/certs":
+                    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(provider.private_key.public_key()))
+                    self._send({"keys": [{**jwk, "kid": provider.kid, "alg": "RS256", "use": "sig"}]})
+                elif path == "/kakao/me":
+                    self._send({"kakao_account": {"email": "kakao@example.com"}})
+
+            def do_POST(self):
+                path = urlparse(self.path).path
+                provider.hits[path] += 1
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if path == "/google/token":
+                    self._send({"access_token": "access", "id_token": provider.id_token()})
+                elif path == "/kakao/token":
+                    self._send({"access_token": "access"})
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server.server_port}{path}"
+
+    def id_token(self):
+        now = int(time.time())
+        claims = {
+            "iss": "https://accounts.google.com",
+            "aud": config.GOOGLE_AUTH["client_id"],
+            "sub": "1234",
+            "email": "google@example.com",
+            "iat": now,
+            "exp": now + 600,
+            **self.claims,
+        }
+        return jwt.encode(claims, self.private_key, algorithm="RS256", headers={"kid": self.kid})
+
+    def endpoints(self):
+        return {
+            "google_discovery": self.url("/google/.well-known/openid-configuration"),
+            "naver_token": self.url("/naver/token"),
+            "naver_profile": self.url("/naver/me"),
+            "kakao_token": self.url("/kakao/token"),
+            "kakao_profile": self.url("/kakao/me"),
+            "discord_token": self.url("/discord/token"),
+            "discord_profile": self.url("/discord/me"),
+        }
+
+
+class SocialLoginTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.provider = FakeProvider()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.provider.server.shutdown()
+        cls.provider.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        self.provider.hits.clear()
+        self.provider.claims = {}
+        self.provider.kid = "key-1"
+        self.client = APIClient()
+        settings_override = override_settings(SOCIAL_LOGIN_ENDPOINTS=self.provider.endpoints())
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def google_login(self):
+        return self.client.get(reverse("accounts:google_callback"), HTTP_AUTHORIZATION="code")
+
+    def test_google_id_token_verified_locally(self):
+        get_user_model().objects.create_user(
+            email="google@example.com", nickname="google", password="pw1234!!", login_type="GOOGLE"
+        )
+        for _ in range(2):
+            response = self.google_login()
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["data"]["user"]["email"], "google@example.com")
+
+        # OpenID 설정과 공개키는 캐시되어 한 번만 요청
+        self.assertEqual(self.provider.hits["/google/token"], 2)
+        self.assertEqual(self.provider.hits["/google/.well-known/openid-configuration"], 1)
+        self.assertEqual(self.provider.hits["/google/certs"], 1)
+
+    def test_google_key_rotation(self):
+        self.google_login()
+        self.provider.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.provider.kid = "key-2"
+
+        response = self.google_login()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["email"], "google@example.com")
+        self.assertEqual(self.provider.hits["/google/certs"], 2)
+
+    def test_google_invalid_audience(self):
+        self.provider.claims = {"aud": "other-client"}
+        response = self.google_login()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error_code"], "THIRD_FAIL")
+
+    def test_kakao_login(self):
+        response = self.client.get(reverse("accounts:kakao_callback"), HTTP_AUTHORIZATION="code")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["email"], "kakao@example.com")
+
+    def test_shared_session(self):
+        self.assertIs(oauth.get_http_session(), oauth.get_http_session())
+
+    def test_provider_unreachable(self):
+        with override_settings(SOCIAL_LOGIN_ENDPOINTS={
+            **self.provider.endpoints(), "kakao_token": "http://127.0.0.1:9/token"
+        }, SOCIAL_LOGIN_RETRIES=0):
+            oauth._sessions.clear()
+            with self.assertRaises(oauth.ProviderError):
+                oauth.kakao_tokens("code")
+        oauth._sessions.clear()
+
+
+class EmailQueueTest(TestCase):
+    """
+    테스트에서는 EMAIL_BACKEND 가 locmem 백엔드로 바뀌어 mail.outbox 에 저장됨
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_verification_email_queued(self):
+        with mock.patch("accounts.tasks.dispatch_emails.delay") as delay, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = APIClient().post(
+                reverse("accounts:email_verification"), {"email": "new@example.com", "is_new": "true"}
+            )
+        self.assertEqual(response.status_code, 200)
+        delay.assert_called_once_with()
+        self.assertEqual(len(mail.outbox), 0)
+        # 대기열에는 인증 번호를 저장하지 않음
+        row = OutboundEmail.objects.get()
+        self.assertEqual((row.template, row.context), ("verification_code", {}))
+
+        self.assertEqual(dispatch_pending_emails(), (1, 0))
+        self.assertEqual(mail.outbox[0].to, ["new@example.com"])
+        code = re.search(r"\d{6}", mail.outbox[0].body).group()
+        self.assertEqual(check_code("new@example.com", code), CODE_VALID)
+        self.assertFalse(OutboundEmail.objects.exists())
+
+    @override_settings(EMAIL_DISPATCH_BATCH_SIZE=2, EMAIL_DISPATCH_MAX_ATTEMPTS=2)
+    def test_batches_and_retries(self):
+        with mock.patch("accounts.tasks.dispatch_emails.delay"):
+            for i in range(3):
+                queue_email(f"user{i}@example.com", "verification_code", secrets={"code": str(i)})
+
+        backend = "django.core.mail.backends.locmem.EmailBackend.send_messages"
+        with mock.patch(backend, side_effect=[1, Exception("rejected"), 1]):
+            self.assertEqual(dispatch_pending_emails(), (2, 1))
+        failed = OutboundEmail.objects.get()
+        self.assertEqual((failed.to, failed.attempts, failed.last_error), ("user1@example.com", 1, "rejected"))
+
+        with mock.patch(backend, side_effect=Exception("rejected")):
+            self.assertEqual(dispatch_pending_emails(), (0, 1))
+        self.assertEqual(OutboundEmail.objects.get().attempts, 2)
+        # 최대 시도 횟수를 넘긴 이메일은 발송하지 않고 경고 로그와 함께 삭제
+        with self.assertLogs("accounts.mail", "WARNING") as logs:
+            self.assertEqual(dispatch_pending_emails(), (0, 0))
+        self.assertIn("rejected", logs.output[0])
+        self.assertFalse(OutboundEmail.objects.exists())
+
+    def test_stale_emails_dropped(self):
+        with mock.patch("accounts.tasks.dispatch_emails.delay"):
+            queue_email("user1@example.com", "verification_code", secrets={"code": "123456"})
+            queue_email("user2@example.com", "verification_code", secrets={"code": "654321"})
+        # 유효 시간이 지난 이메일(인증 번호 만료)은 캐시에 값이 남아 있어도 보내지 않음
+        OutboundEmail.objects.filter(to="user1@example.com").update(
+            created_at=timezone.now() - timedelta(seconds=settings.EMAIL_DISPATCH_MAX_AGE + 1)
+        )
+        self.assertEqual(dispatch_pending_emails(), (1, 0))
+        self.assertEqual([m.to for m in mail.outbox], [["user2@example.com"]])
+        self.assertFalse(OutboundEmail.objects.exists())
+
+    def test_leased_emails_skipped(self):
+        with mock.patch("accounts.tasks.dispatch_emails.delay"):
+            queue_email("user1@example.com", "verification_code", secrets={"code": "123456"})
+            queue_email("user2@example.com", "verification_code", secrets={"code": "654321"})
+        # 다른 워커가 발송 중인 이메일은 건너뛰고, 점유가 만료된(워커가 죽은) 이메일은 다시 발송
+        now = timezone.now()
+        OutboundEmail.objects.filter(to="user1@example.com").update(leased_until=now + timedelta(seconds=60), attempts=1)
+        OutboundEmail.objects.filter(to="user2@example.com").update(leased_until=now - timedelta(seconds=1), attempts=1)
+
+        def send_messages(messages):
+            # 발송 중에는 행이 점유된 상태로 커밋되어 있음
+            row = OutboundEmail.objects.get(to=messages[0].to[0])
+            self.assertEqual(row.attempts, 2)
+            self.assertGreater(row.leased_until, now)
+            raise Exception("rejected")
+
+        with mock.patch("django.core.mail.backends.locmem.EmailBackend.send_messages", side_effect=send_messages):
+            self.assertEqual(dispatch_pending_emails(), (0, 1))
+        row = OutboundEmail.objects.get(to="user2@example.com")
+        self.assertEqual((row.attempts, row.leased_until, row.last_error), (2, None, "rejected"))
+        self.assertEqual(OutboundEmail.objects.get(to="user1@example.com").attempts, 1)
+
+    def test_expired_secrets_not_sent(self):
+        with mock.patch("accounts.tasks.dispatch_emails.delay"):
+            queue_email("user1@example.com", "verification_code", secrets={"code": "123456"})
+            queue_email("user2@example.com", "verification_code", secrets={"code": "654321"})
+        # 캐시에서 만료/삭제된 인증 번호는 보내지 않고 대기열에서 삭제
+        cache.delete(secrets_key(OutboundEmail.objects.get(to="user1@example.com").pk))
+        self.assertEqual(dispatch_pending_emails(), (1, 0))
+        self.assertEqual([(m.to, m.body) for m in mail.outbox], [(["user2@example.com"], "이메일 인증 코드는  654321  입니다.")])
+        self.assertFalse(OutboundEmail.objects.exists())
+
+    def test_cache_unavailable_sends_without_queue(self):
+        with mock.patch("accounts.mail.cache.set", side_effect=ConnectionError), \
+                self.captureOnCommitCallbacks(execute=True):
+            queue_email("user1@example.com", "verification_code", secrets={"code": "123456"})
+        self.assertFalse(OutboundEmail.objects.exists())
+        self.assertEqual(mail.outbox[0].body, "이메일 인증 코드는  123456  입니다.")
+
+
+@override_settings(EMAIL_VERIFICATION_MAX_ATTEMPTS=3)
+class VerificationCodeTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_cache_store(self):
+        code = issue_code("user@example.com")
+        self.assertFalse(EmailVerification.objects.exists())
+        self.assertNotIn(code, str(cache.get("accounts:verification:user@example.com")))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(check_code("user@example.com", code), CODE_VALID)
+            self.assertEqual(check_code("user@example.com", "000000" if code != "000000" else "111111"), CODE_INVALID)
+        self.assertEqual(check_code("user@example.com", code, consume=True), CODE_VALID)
+        self.assertEqual(check_code("user@example.com", code), CODE_MISSING)
+
+    def test_attempts_limit(self):
+        code = issue_code("user@example.com")
+        wrong = "000000" if code != "000000" else "111111"
+        self.assertEqual(check_code("user@example.com", wrong), CODE_INVALID)
+        self.assertEqual(check_code("user@example.com", wrong), CODE_INVALID)
+        self.assertEqual(check_code("user@example.com", wrong), CODE_LOCKED)
+        # 폐기된 인증 번호는 맞게 입력해도 사용할 수 없음
+        self.assertEqual(check_code("user@example.com", code), CODE_MISSING)
+
+        # 재발급 시 시도 횟수 초기화
+        code = issue_code("user@example.com")
+        self.assertEqual(check_code("user@example.com", wrong if wrong != code else "222222"), CODE_INVALID)
+        self.assertEqual(check_code("user@example.com", code), CODE_VALID)
+
+    def test_expired(self):
+        with mock.patch("accounts.verification.time.time", return_value=time.time() - 301):
+            code = issue_code("user@example.com")
+        self.assertEqual(check_code("user@example.com", code), CODE_EXPIRED)
+
+    def test_db_fallback(self):
+        with mock.patch("accounts.verification.cache.set_many", side_effect=ConnectionError):
+            code = issue_code("user@example.com")
+        verification = EmailVerification.objects.get()
+        self.assertNotEqual(verification.verification_code, code)
+
+        wrong = "000000" if code != "000000" else "111111"
+        with mock.patch("accounts.verification.cache.get", side_effect=ConnectionError):
+            self.assertEqual(check_code("user@example.com", wrong), CODE_INVALID)
+            self.assertEqual(check_code("user@example.com", code, consume=True), CODE_VALID)
+        self.assertFalse(EmailVerification.objects.exists())
+
+    def test_signup_consumes_code(self):
+        GameCategory.objects.create(name="Action")
+        code = issue_code("new@example.com")
+        data = {
+            "email": "new@example.com", "nickname": "newbie", "login_type": "DEFAULT",
+            "password": "pass1234!", "password_check": "pass1234!", "is_maker": False, "game_category": "Action", "code": code,
+        }
+        wrong = "000000" if code != "000000" else "111111"
+        response = APIClient().post(reverse("accounts:signup"), {**data, "code": wrong})
+        self.assertEqual((response.status_code, response.json()["message"]), (400, "잘못된 인증 번호입니다."))
+
+        response = APIClient().post(reverse("accounts:signup"), data)
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(check_code("new@example.com", code), CODE_MISSING)
+
+        response = APIClient().post(reverse("accounts:signup"), {**data, "email": "other@example.com", "nickname": "other1"})
+        self.assertEqual(response.json()["message"], "해당 이메일로 인증을 시도한 적이 없습니다.")
+
+
+class CachedJWTAuthenticationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        # 회원 삭제 시 관련 데이터는 관리자 계정으로 이관됨
+        for email, nickname in ((config.ADMIN_STAFF_EMAIL, "staff"), (config.ADMIN_USER_EMAIL, "admin")):
+            get_user_model().objects.create_user(email=email, nickname=nickname, login_type="DEFAULT")
+        self.user = get_user_model().objects.create_user(
+            email="member@example.com", nickname="snapshot", password="pw1234!!", login_type="DEFAULT"
+        )
+        self.request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+    def authenticate(self):
+        user, _ = CachedJWTAuthentication().authenticate(self.request)
+        return user
+
+    def test_snapshot_cached(self):
+        with self.assertNumQueries(1):
+            self.authenticate()
+        with self.assertNumQueries(0):
+            user = self.authenticate()
+            self.assertEqual((user.pk, user.nickname, user.is_active), (self.user.pk, "snapshot", True))
+            self.assertEqual(str(user), "member@example.com")
+        # 스냅샷에 없는 필드는 접근할 때 DB 에서 불러옴
+        with self.assertNumQueries(1):
+            self.assertEqual(user.login_type, "DEFAULT")
+
+    def test_get_active_user(self):
+        self.authenticate()
+        self.request.user = self.authenticate()
+        # 본인: 인증한 유저 재사용, 스냅샷에 없는 컬럼은 한 번에 불러옴
+        with self.assertNumQueries(0):
+            self.assertIs(get_active_user(self.request, self.user.pk), self.request.user)
+        with self.assertNumQueries(1):
+            user = get_active_user(self.request, self.user.pk, fields=("login_type", "password"))
+            self.assertEqual(user.login_type, "DEFAULT")
+            self.assertTrue(user.check_password("pw1234!!"))
+
+        # 다른 회원/탈퇴 회원은 DB 에서 조회
+        other = get_user_model().objects.get(email=config.ADMIN_STAFF_EMAIL)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_active_user(self.request, other.pk), other)
+        other.is_active = False
+        other.save()
+        with self.assertRaises(get_user_model().DoesNotExist):
+            get_active_user(self.request, other.pk)
+
+    def test_invalidated_on_save_and_delete(self):
+        self.authenticate()
+        self.user.nickname = "renamed"
+        self.user.save()
+        self.assertEqual(self.authenticate().nickname, "renamed")
+
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+        self.user.delete()
+        with self.assertRaisesMessage(AuthenticationFailed, "User not found"):
+            self.authenticate()
@@ -0,0 +1,135 @@
+import random
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare, salted_hmac
+from rest_framework import status
+
+from spartagames.utils import std_response
+from .models import EmailVerification
+
+
+CODE_KEY = "accounts:verification:{email}"
+ATTEMPTS_KEY = "accounts:verification:{email}:attempts"
+
+# check_code 결과
+CODE_VALID = "valid"
+CODE_MISSING = "missing"    # 인증을 요청한 적 없음
+CODE_EXPIRED = "expired"
+CODE_INVALID = "invalid"    # 인증 번호 불일치
+CODE_LOCKED = "locked"      # 불일치 횟수 초과 → 인증 번호 폐기
+
+FAIL_MESSAGES = {
+    CODE_MISSING: "유효하지 않은 이메일입니다.",
+    CODE_EXPIRED: "인증 번호가 만료되었습니다.",
+    CODE_INVALID: "잘못된 인증 번호입니다",
+    CODE_LOCKED: "인증 시도 횟수를 초과했습니다. 인증 번호를 다시 요청해주세요.",
+}
+
+
+def _hash(email, code):
+    return salted_hmac("accounts.verification", f"{email}:{code}").hexdigest()
+
+
+def _ttl():
+    return settings.EMAIL_VERIFICATION_TTL
+
+
+def issue_code(email):
+    """
+    새 인증 번호 발급 (기존 인증 번호와 시도 횟수는 초기화)
+    캐시에는 해시만 저장하고, 만료 후 EMAIL_VERIFICATION_TTL 만큼 더 남겨 '만료' 응답을 구분한 뒤 자동 삭제
+    캐시 서버 장애 시 EmailVerification 테이블에 저장
+    반환값: 인증 번호 (이메일 본문용)
+    """
+    code = ''.join(random.choices('0123456789', k=6))
+    entry = {"hash": _hash(email, code), "expires_at": time.time() + _ttl()}
+    try:
+        cache.set_many({
+            CODE_KEY.format(email=email): entry,
+            ATTEMPTS_KEY.format(email=email): 0,
+        }, _ttl() * 2)
+    except Exception:
+        # 캐시 서버 장애 → DB 에 저장 (만료된 행도 함께 정리)
+        EmailVerification.objects.filter(
+            Q(email=email) | Q(created_at__lt=timezone.now() - timedelta(seconds=_ttl()))
+        ).delete()
+        EmailVerification.objects.create(email=email, verification_code=entry["hash"])
+    return code
+
+
+def discard_code(email):
+    try:
+        cache.delete_many([CODE_KEY.format(email=email), ATTEMPTS_KEY.format(email=email)])
+    except Exception:
+        pass
+    EmailVerification.objects.filter(email=email).delete()
+
+
+def _check_db(email, code, consume):
+    verification = EmailVerification.objects.filter(email=email).first()
+    if verification is None:
+        return CODE_MISSING
+    if verification.is_expired():
+        verification.delete()
+        return CODE_EXPIRED
+    if constant_time_compare(verification.verification_code, _hash(email, code or "")):
+        if consume:
+            verification.delete()
+        return CODE_VALID
+
+    rows = EmailVerification.objects.filter(pk=verification.pk)
+    rows.update(attempts=F("attempts") + 1)
+    if rows.filter(attempts__gte=settings.EMAIL_VERIFICATION_MAX_ATTEMPTS).delete()[0]:
+        return CODE_LOCKED
+    return CODE_INVALID
+
+
+def check_code(email, code, consume=False):
+    """
+    인증 번호 확인 (캐시 키 1개 조회, 캐시에 없을 때만 DB 확인)
+    불일치할 때마다 시도 횟수를 원자적으로 증가시키고, EMAIL_VERIFICATION_MAX_ATTEMPTS 에 도달하면 인증 번호 폐기
+    consume=True 이면 확인 후 인증 번호 삭제 (회원가입/비밀번호 변경 완료 시)
+    반환값: CODE_* 중 하나
+    """
+    code_key, attempts_key = CODE_KEY.format(email=email), ATTEMPTS_KEY.format(email=email)
+    try:
+        entry = cache.get(code_key)
+    except Exception:
+        entry = None
+    if entry is None:
+        return _check_db(email, code, consume)
+
+    if time.time() > entry["expires_at"]:
+        return CODE_EXPIRED
+    if constant_time_compare(entry["hash"], _hash(email, code or "")):
+        if consume:
+            discard_code(email)
+        return CODE_VALID
+
+    try:
+        attempts = cache.incr(attempts_key)
+    except ValueError:
+        # 시도 횟수 키만 먼저 사라진 경우
+        attempts = settings.EMAIL_VERIFICATION_MAX_ATTEMPTS
+    if attempts >= settings.EMAIL_VERIFICATION_MAX_ATTEMPTS:
+        cache.delete_many([code_key, attempts_key])
+        return CODE_LOCKED
+    return CODE_INVALID
+
+
+def verification_failed_response(result, messages=None):
+    """
+    check_code 실패 결과에 대한 응답
+    messages: 기존 API 별 문구가 FAIL_MESSAGES 와 다른 경우 {결과: 문구}
+    """
+    return std_response(
+        message=(messages or {}).get(result, FAIL_MESSAGES[result]),
+        status="error" if result == CODE_MISSING else "fail",
+        error_code="CLIENT_FAIL",
+        status_code=status.HTTP_400_BAD_REQUEST
+    )
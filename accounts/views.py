@@ -1,20 +1,10 @@
-import os
-import pickle
-import base64
-import random
 import re
-import requests
 import urllib.parse
 
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404
 
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from email.mime.text import MIMEText
-
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -26,9 +16,10 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView
 
-from spartagames import config
 from spartagames.utils import std_response
-from .models import EmailVerification
+from . import oauth
+from .mail import queue_email
+from .verification import CODE_INVALID, CODE_MISSING, CODE_VALID, check_code, issue_code, verification_failed_response
 
 
 class AlertException(Exception):
@@ -211,25 +202,13 @@ class SignUpAPIView(APIView):
                     error_code="CLIENT_FAIL",
                     status_code=status.HTTP_400_BAD_REQUEST
                 )
-            try:
-                verification = EmailVerification.objects.get(email=email)
-            except:
-                return std_response(
-                    message="해당 이메일로 인증을 시도한 적이 없습니다.",
-                    status="error",
-                    error_code="CLIENT_FAIL",
-                    status_code=status.HTTP_400_BAD_REQUEST
-                )
-            if verification.verification_code == code:
-                # 기존 이메일 인증 데이터 삭제
-                EmailVerification.objects.filter(email=email).delete()
-            else:
-                return std_response(
-                    message="잘못된 인증 번호입니다.",
-                    status="fail",
-                    error_code="CLIENT_FAIL",
-                    status_code=status.HTTP_400_BAD_REQUEST
-                )
+            # 인증 번호 확인 후 삭제
+            result = check_code(email, code, consume=True)
+            if result != CODE_VALID:
+                return verification_failed_response(result, messages={
+                    CODE_MISSING: "해당 이메일로 인증을 시도한 적이 없습니다.",
+                    CODE_INVALID: "잘못된 인증 번호입니다.",
+                })
             
             # DB에 유저 등록
             user = get_user_model().objects.create_user(
@@ -287,17 +266,7 @@ def google_login_callback(request):
     try:
         authorization_code = request.META.get('HTTP_AUTHORIZATION')
         decoded_code = urllib.parse.unquote(authorization_code)
-        url = "https://oauth2.googleapis.com/token"
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        data = {
-            "code": decoded_code,
-            "client_id": config.GOOGLE_AUTH["client_id"],
-            "client_secret": config.GOOGLE_AUTH["client_secret"],
-            "redirect_uri": config.GOOGLE_AUTH["redirect_uri"],
-            "grant_type": "authorization_code"
-        }
-        tokens_request = requests.post(url, headers=headers, data=data)
-        tokens_json = tokens_request.json()
+        tokens_json = oauth.google_tokens(decoded_code)
     except Exception as e:
         messages.error(request, e)
         # 유저에게 알림
@@ -311,8 +280,8 @@ def google_login_callback(request):
     # token 유효성 확인 및 로그인 진행, 유저 정보 전달
     try:
         id_token = tokens_json["id_token"]
-        profile_request = requests.get(f'https://www.googleapis.com/oauth2/v3/tokeninfo?id_token={id_token}')
-        profile_json = profile_request.json()
+        # tokeninfo 요청 없이 구글 공개키로 직접 검증
+        profile_json = oauth.verify_google_id_token(id_token)
 
         email = profile_json.get('email', None)
 
@@ -371,7 +340,7 @@ def google_login_callback(request):
             error_code="THIRD_FAIL",
             status_code=status.HTTP_406_NOT_ACCEPTABLE
         )
-    except TokenException as e:
+    except (TokenException, oauth.ProviderError) as e:
         print(e)
         # 개발 단계에서 확인
         return std_response(
@@ -387,16 +356,7 @@ def google_login_callback(request):
 def naver_login_callback(request):
     try:
         authorization_code = request.META.get('HTTP_AUTHORIZATION')
-        url = "https://nid.naver.com/oauth2.0/token"
-        data = {
-            "grant_type": "authorization_code",
-            "client_id": config.NAVER_AUTH["client_id"],
-            "client_secret": config.NAVER_AUTH["client_secret"],
-            "code": authorization_code,
-            "state": config.NAVER_AUTH["state"],
-        }
-        tokens_request = requests.get(url, params=data)
-        tokens_json = tokens_request.json()
+        tokens_json = oauth.naver_tokens(authorization_code)
     except Exception as e:
         messages.error(request, e)
         # 유저에게 알림
@@ -409,12 +369,7 @@ def naver_login_callback(request):
 
     try:
         access_token = tokens_json["access_token"]
-        url = "https://openapi.naver.com/v1/nid/me"
-        headers = {
-            "Authorization": "Bearer " + access_token,
-        }
-        profile_request = requests.get(url, headers=headers)
-        profile_json = profile_request.json().get("response", None)
+        profile_json = oauth.naver_profile(access_token).get("response", None)
 
         email = profile_json.get('email', None)
 
@@ -473,7 +428,7 @@ def naver_login_callback(request):
             error_code="THIRD_FAIL",
             status_code=status.HTTP_406_NOT_ACCEPTABLE
         )
-    except TokenException as e:
+    except (TokenException, oauth.ProviderError) as e:
         print(e)
         # 개발 단계에서 확인
         return std_response(
@@ -490,16 +445,7 @@ def kakao_login_callback(request):
     # Authorization code를 token으로 전환
     try:
         authorization_code = request.META.get('HTTP_AUTHORIZATION')
-        url = "https://kauth.kakao.com/oauth/token"
-        headers = {"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"}
-        data = {
-            "code": authorization_code,
-            "client_id": config.KAKAO_AUTH["client_id"],
-            "redirect_uri": config.KAKAO_AUTH["redirect_uri"],
-            "grant_type": "authorization_code"
-        }
-        tokens_request = requests.post(url, headers=headers, data=data)
-        tokens_json = tokens_request.json()
+        tokens_json = oauth.kakao_tokens(authorization_code)
     except Exception as e:
         messages.error(request, e)
         # 유저에게 알림
@@ -513,13 +459,7 @@ def kakao_login_callback(request):
     # token 유효성 확인 및 로그인 진행, 유저 정보 전달
     try:
         access_token = tokens_json["access_token"]
-        url = "https://kapi.kakao.com/v2/user/me"
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
-            "Authorization": "Bearer " + access_token,
-        }
-        profile_request = requests.get(url, headers=headers)
-        profile_json = profile_request.json()
+        profile_json = oauth.kakao_profile(access_token)
         
         account = profile_json.get('kakao_account', None)
         email = account["email"]
@@ -581,7 +521,7 @@ def kakao_login_callback(request):
             error_code="THIRD_FAIL",
             status_code=status.HTTP_406_NOT_ACCEPTABLE
         )
-    except TokenException as e:
+    except (TokenException, oauth.ProviderError) as e:
         print(e)
         # 개발 단계에서 확인
         return std_response(
@@ -598,18 +538,7 @@ def discord_login_callback(request):
     # Authorization code를 token으로 전환
     try:
         authorization_code = request.META.get('HTTP_AUTHORIZATION')
-        url = "https://discord.com/api/oauth2/token"
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        data = {
-            "code": authorization_code,
-            "client_id": config.DISCORD_AUTH["client_id"],
-            "client_secret": config.DISCORD_AUTH["client_secret"],
-            "redirect_uri": config.DISCORD_AUTH["redirect_uri"],
-            "grant_type": "authorization_code",
-            "scope": 'identify, email',
-        }
-        tokens_request = requests.post(url, headers=headers, data=data)
-        tokens_json = tokens_request.json()
+        tokens_json = oauth.discord_tokens(authorization_code)
     except Exception as e:
         print(e)
         messages.error(request, e)
@@ -624,13 +553,7 @@ def discord_login_callback(request):
     # token 유효성 확인 및 로그인 진행, 유저 정보 전달
     try:
         access_token = tokens_json["access_token"]
-        url = "https://discordapp.com/api/users/@me"
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
-            "Authorization": "Bearer " + access_token,
-        }
-        profile_request = requests.get(url, headers=headers)
-        profile_json = profile_request.json()
+        profile_json = oauth.discord_profile(access_token)
         
         email = profile_json.get('email', None)
         # nickname = profile_json.get('username', None)
@@ -690,7 +613,7 @@ def discord_login_callback(request):
             error_code="THIRD_FAIL",
             status_code=status.HTTP_406_NOT_ACCEPTABLE
         )
-    except TokenException as e:
+    except (TokenException, oauth.ProviderError) as e:
         print(e)
         # 개발 단계에서 확인
         return std_response(
@@ -701,27 +624,6 @@ def discord_login_callback(request):
         )
 
 
-# 이메일 인증 관련 상수 값
-SCOPES = ['https://www.googleapis.com/auth/gmail.send']
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # 현재 파일의 디렉토리를 기준으로 절대 경로 설정
-CLIENT_SECRET_FILE = os.path.join(BASE_DIR, 'client_secret.json')
-
-def get_credentials():
-    creds = None
-    if os.path.exists('token.pickle'):
-        with open('token.pickle', 'rb') as token:
-            creds = pickle.load(token)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(CLIENT_SECRET_FILE, SCOPES)
-            creds = flow.run_local_server(port=0, access_type="offline")
-        with open('token.pickle', 'wb') as token:
-            pickle.dump(creds, token)
-    return creds
-
-
 @api_view(('POST',))
 @renderer_classes((JSONRenderer,))
 def email_verification(request):
@@ -764,39 +666,12 @@ def email_verification(request):
             status_code=status.HTTP_400_BAD_REQUEST
         )
     
-    # 기존 이메일 인증 데이터 삭제=>여기서 이미 삭제 하기에 아래에는 필요가 없음(뭐가 있든 지우고 있기때문)
-    EmailVerification.objects.filter(email=email).delete()
-    
-    creds = get_credentials()
-    service = build('gmail', 'v1', credentials=creds)
-
-    code = ''.join(random.choices('0123456789', k=6))
-    message = MIMEText(f"이메일 인증 코드는  {code}  입니다.")
-    message['from'] = 'sparta.games.master@gmail.com'
-    message['to'] = email
-    message['subject'] = "Sparta Games 메일 주소 인증 번호"
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-
-    message = {
-        'raw': raw
-    }
-
-    try:
-        message = (service.users().messages().send(userId='me', body=message).execute())
-    except Exception as e:
-        print(f'An error occurred: {e}')
-        return std_response(
-            message=f"이메일 전송 중 에러가 발생했습니다. ({str(e)})",
-            status="error",
-            error_code="THIRD_FAIL",
-            status_code=status.HTTP_400_BAD_REQUEST
-        )
-    
-    # 이메일 인증 데이터 저장
-    EmailVerification.objects.create(email=email, verification_code=code)
+    # 인증 번호 발급 (기존 인증 번호는 무효화) 후 이메일은 Celery 태스크로 발송 (요청은 발송을 기다리지 않음)
+    code = issue_code(email)
+    queue_email(to=email, template="verification_code", secrets={"code": code})
     
     return std_response(
-        message=f"인증번호를 발송했습니다. (이메일 message id: {message['id']})",
+        message="인증번호를 발송했습니다.",
         status="success",
         status_code=status.HTTP_200_OK
     )
@@ -808,37 +683,15 @@ def verify_code(request):
     email = request.data.get('email')
     code = request.data.get('code')
 
-    try:
-        verification = EmailVerification.objects.get(email=email)
-    except EmailVerification.DoesNotExist:
-        return std_response(
-            message="유효하지 않은 이메일입니다.",
-            status="error",
-            error_code="CLIENT_FAIL",
-            status_code=status.HTTP_400_BAD_REQUEST
-        )
+    result = check_code(email, code)
+    if result != CODE_VALID:
+        return verification_failed_response(result)
 
-    if verification.is_expired():
-        return std_response(
-            message="인증 번호가 만료되었습니다.",
-            status="fail",
-            error_code="CLIENT_FAIL",
-            status_code=status.HTTP_400_BAD_REQUEST
-        )
-
-    if verification.verification_code == code:
-        return std_response(
-            message=f"이메일 인증이 완료되었습니다.",
-            status="success",
-            status_code=status.HTTP_200_OK
-        )
-    else:
-        return std_response(
-            message="잘못된 인증 번호입니다",
-            status="fail",
-            error_code="CLIENT_FAIL",
-            status_code=status.HTTP_400_BAD_REQUEST
-        )
+    return std_response(
+        message=f"이메일 인증이 완료되었습니다.",
+        status="success",
+        status_code=status.HTTP_200_OK
+    )
 
 
 # # 회원가입 또는 로그인을 처리하는 함수
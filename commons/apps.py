@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CommonsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'commons'
+
+    def ready(self):
+        if settings.PROFILING_ENABLED:
+            from .profiling import install
+            install()
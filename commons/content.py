@@ -0,0 +1,211 @@
+import hashlib
+import html
+import re
+import threading
+from collections import OrderedDict
+from html.entities import html5
+from html.parser import HTMLParser
+from typing import NamedTuple
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+
+
+# BeautifulSoup(html.parser).get_text() 에서 제외되는 영역
+TEXT_EXCLUDED_TAGS = frozenset(("script", "style", "template", "rt", "rp"))
+# 닫는 태그가 없는 태그 (BeautifulSoup HTMLTreeBuilder 와 같은 목록)
+VOID_TAGS = frozenset((
+    "area", "base", "basefont", "bgsound", "br", "col", "command", "embed", "frame", "hr", "image", "img",
+    "input", "isindex", "keygen", "link", "menuitem", "meta", "nextid", "param", "source", "spacer", "track", "wbr",
+))
+
+_NEWLINES_RE = re.compile(r'[\n\r\t]+')
+_SPACES_RE = re.compile(r'\s+')
+_NOT_LOADED = object()
+
+# 최근 파싱 결과 (본문 해시 → ParsedContent), 본문(최대 50만 자) 자체는 키로 들고 있지 않음
+PARSE_CACHE_SIZE = 8
+_parse_lock = threading.Lock()
+_parse_cache = OrderedDict()
+
+
+class ParsedContent(NamedTuple):
+    text: str           # 검색용 텍스트 (공백 정리 후)
+    srcs: tuple         # <img src> 목록 (문서 순서, 원본 값)
+    text_length: int    # 태그를 제외한 본문 길이 (원본 기준)
+    tag_length: int     # 태그/주석 등 마크업 길이
+
+
+class ContentParser(HTMLParser):
+    """
+    HTML 본문을 한 번만 토큰화하여 텍스트, 이미지 src, 길이 통계를 함께 수집 (트리를 만들지 않음)
+    텍스트는 BeautifulSoup(content, "html.parser").get_text() 와 같은 결과를 내도록 엔티티/제외 태그 처리를 맞춤
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.parts = []
+        self.srcs = []
+        self.text_length = 0
+        self.open_tags = []
+        self.excluded_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "img":
+            # 중복 속성은 마지막 값 사용 (BeautifulSoup 과 동일)
+            src = dict(attrs).get("src")
+            if src:
+                self.srcs.append(src)
+        if tag in VOID_TAGS:
+            return
+        self.open_tags.append(tag)
+        if tag in TEXT_EXCLUDED_TAGS:
+            self.excluded_depth += 1
+
+    def handle_endtag(self, tag):
+        # 열린 적 없는 닫는 태그는 무시, 바깥 태그가 닫히면 안쪽 태그도 함께 닫힘
+        if tag not in self.open_tags:
+            return
+        while self.open_tags:
+            name = self.open_tags.pop()
+            if name in TEXT_EXCLUDED_TAGS:
+                self.excluded_depth -= 1
+            if name == tag:
+                break
+
+    def handle_data(self, data):
+        self.text_length += len(data)
+        if not self.excluded_depth:
+            self.parts.append(data)
+
+    def handle_entityref(self, name):
+        self.text_length += len(name) + 2
+        if not self.excluded_depth:
+            # 알 수 없는 엔티티는 '&name' 그대로 (BeautifulSoup 과 동일)
+            self.parts.append(html5.get(f"{name};", f"&{name}"))
+
+    def handle_charref(self, name):
+        self.text_length += len(name) + 3
+        if not self.excluded_depth:
+            # &#39; / &#x27; (잘못된 코드 포인트는 U+FFFD, 0x80~0x9F 는 windows-1252 문자로)
+            self.parts.append(html.unescape(f"&#{name};"))
+
+    def unknown_decl(self, data):
+        # CDATA 는 제외 태그 안에서도 텍스트에 포함
+        if data.upper().startswith("CDATA["):
+            self.text_length += len(data) - len("CDATA[")
+            self.parts.append(data[len("CDATA["):])
+
+
+def normalize_text(raw_text):
+    # 이스케이프 문자 -> 공백으로 치환
+    clean_text = raw_text.replace('\xa0', ' ')
+    clean_text = _NEWLINES_RE.sub(' ', clean_text)
+
+    # 여러 공백 -> 단일 공백
+    clean_text = _SPACES_RE.sub(' ', clean_text)
+
+    return clean_text.strip()
+
+
+def _content_key(content):
+    return len(content), hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def parse_content(content):
+    """
+    HTML 본문 파싱 결과 (ParsedContent)
+    같은 요청 안에서 검증 → content_text 추출 → 이미지 src 추출 순으로 같은 본문을 다시 쓰므로, 최근 결과를 재사용
+    """
+    content = content or ""
+    key = _content_key(content)
+    with _parse_lock:
+        parsed = _parse_cache.get(key)
+        if parsed is not None:
+            _parse_cache.move_to_end(key)
+            return parsed
+
+    parser = ContentParser()
+    parser.feed(content)
+    parser.close()
+    text_length = min(parser.text_length, len(content))
+    parsed = ParsedContent(
+        text=normalize_text("".join(parser.parts)),
+        srcs=tuple(parser.srcs),
+        text_length=text_length,
+        tag_length=len(content) - text_length,
+    )
+    with _parse_lock:
+        _parse_cache[key] = parsed
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return parsed
+
+
+def clear_parse_cache():
+    with _parse_lock:
+        _parse_cache.clear()
+
+
+def extract_content_text(content):
+    """
+    HTML 본문에서 검색용 텍스트 추출
+    """
+    return parse_content(content).text
+
+
+class ContentTextMixin:
+    """
+    content 가 바뀐 경우에만 content_text(검색용 텍스트)를 다시 추출
+    CONTENT_TEXT_SYNC_MAX_LENGTH 보다 긴 본문은 커밋 이후 Celery 태스크에서 추출 (그 전까지는 이전 텍스트 유지)
+    사용: class TeamBuildPost(ContentTextMixin, models.Model)
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_content = instance.__dict__.get("content", _NOT_LOADED)
+        return instance
+
+    def content_changed(self):
+        if "content" not in self.__dict__:
+            # content 를 불러오지 않았고 값을 지정하지도 않음
+            return False
+        if self._state.adding:
+            return True
+        return self.content != getattr(self, "_loaded_content", _NOT_LOADED)
+
+    def save(self, *args, **kwargs):
+        deferred = False
+        update_fields = kwargs.get("update_fields")
+        if self.content_changed() and (update_fields is None or "content" in update_fields):
+            if len(self.content or "") > settings.CONTENT_TEXT_SYNC_MAX_LENGTH:
+                deferred = True
+            else:
+                self.content_text = extract_content_text(self.content)
+                if update_fields is not None:
+                    kwargs["update_fields"] = {*update_fields, "content_text"}
+        super().save(*args, **kwargs)
+        if "content" in self.__dict__:
+            self._loaded_content = self.content
+
+        if deferred:
+            from .tasks import update_content_text
+
+            label, pk = self._meta.label, self.pk
+            transaction.on_commit(lambda: update_content_text.delay(label, pk))
+
+
+def refresh_content_text(model_label, pk):
+    """
+    content_text 를 현재 content 기준으로 다시 추출 (긴 본문 비동기 처리용)
+    행을 잠근 상태에서 읽고 저장하여, 그 사이에 수정된 본문을 이전 텍스트로 덮어쓰지 않도록 함
+    반환값: 갱신 여부
+    """
+    model = apps.get_model(model_label)
+    with transaction.atomic():
+        content = model.objects.select_for_update().filter(pk=pk).values_list("content", flat=True).first()
+        if content is None:
+            return False
+        return bool(model.objects.filter(pk=pk).update(content_text=extract_content_text(content)))
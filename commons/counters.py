@@ -0,0 +1,118 @@
+from django.apps import apps
+from django.db.models import Avg, Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Abs, Coalesce
+
+
+# 비정규화 카운터 목록
+# (모델, 카운터 필드, 역참조 related_name, 집계 대상 조건, 집계 함수)
+COUNTERS = [
+    ("games.Game", "like_cnt", "likes", Q(), Count("pk")),
+    ("games.Game", "review_cnt", "reviews", Q(is_visible=True), Count("pk")),
+    ("games.Game", "star", "reviews", Q(is_visible=True), Avg("star")),
+    ("games.Review", "like_cnt", "reviews", Q(is_like=1), Count("pk")),
+    ("games.Review", "dislike_cnt", "reviews", Q(is_like=2), Count("pk")),
+    ("teambuildings.TeamBuildPost", "comment_cnt", "comments", Q(is_visible=True), Count("pk")),
+]
+
+# 평균(float) 카운터는 F() 갱신의 반올림 오차가 쌓이므로 이 이하의 차이는 보정하지 않음
+DRIFT_TOLERANCE = 1e-6
+
+
+class CounterFieldsMixin:
+    """
+    카운터 컬럼은 F() 갱신으로만 관리되므로, 기존 행을 save() 할 때 메모리에 있는 (오래된) 값으로 덮어쓰지 않음
+    사용: class Game(CounterFieldsMixin, models.Model): counter_fields = ("like_cnt", ...)
+    """
+    counter_fields = ()
+
+    def save(self, *args, **kwargs):
+        if (
+            self.counter_fields
+            and not self._state.adding
+            and not kwargs.get("force_insert")
+            and kwargs.get("update_fields") is None
+            and not args
+        ):
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.counter_fields
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
+
+def adjust_counters(model, pk, **deltas):
+    """
+    카운터 컬럼을 F()로 원자적으로 증감
+    ex) adjust_counters(Game, game_id, like_cnt=1)
+    반환값: 갱신된 행 수 (0이면 대상이 없음)
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return 0
+    return model.objects.filter(pk=pk).update(
+        **{field: F(field) + delta for field, delta in deltas.items()}
+    )
+
+
+def actual_count(model, field, related_name, condition=Q(), aggregate=None):
+    """
+    카운터의 실제 값을 계산하는 서브쿼리 (reconcile 용, 대상이 없으면 0)
+    """
+    relation = model._meta.get_field(related_name)
+    fk_name = relation.field.name
+    counted = (
+        relation.related_model.objects
+        .filter(**{fk_name: OuterRef("pk")})
+        .filter(condition)
+        .order_by()
+        .values(fk_name)
+        .annotate(cnt=aggregate or Count("pk"))
+        .values("cnt")
+    )
+    return Coalesce(Subquery(counted), 0, output_field=model._meta.get_field(field))
+
+
+def reconcile_counter(model, field, related_name, condition=Q(), aggregate=None, batch_size=1000):
+    """
+    pk 구간 단위로 카운터와 실제 값을 비교해 어긋난 행만 다시 계산
+    반환값: 보정된 행 수
+    """
+    fixed = 0
+    last_pk = 0
+    while True:
+        pks = list(
+            model.objects.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            break
+        last_pk = pks[-1]
+
+        drifted = list(
+            model.objects.filter(pk__in=pks)
+            .alias(drift=Abs(F(field) - actual_count(model, field, related_name, condition, aggregate)))
+            .filter(drift__gt=DRIFT_TOLERANCE)
+            .values_list("pk", flat=True)
+        )
+        if drifted:
+            # 값을 읽어 쓰지 않고 UPDATE 안에서 다시 계산하여 그 사이의 F() 갱신을 덮어쓰지 않도록 함
+            fixed += model.objects.filter(pk__in=drifted).update(
+                **{field: actual_count(model, field, related_name, condition, aggregate)}
+            )
+    return fixed
+
+
+def reconcile_all(batch_size=1000):
+    """
+    등록된 모든 카운터 보정
+    반환값: {"app.Model.field": 보정된 행 수}
+    """
+    result = {}
+    for label, field, related_name, condition, aggregate in COUNTERS:
+        model = apps.get_model(label)
+        result[f"{label}.{field}"] = reconcile_counter(
+            model, field, related_name, condition, aggregate, batch_size=batch_size
+        )
+    return result
@@ -0,0 +1,196 @@
+import os
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.db import OperationalError, connections
+
+
+class PoolTimeout(OperationalError):
+    """
+    DB_POOL_TIMEOUT 동안 빈 커넥션이 생기지 않음 (DB 에러와 같이 처리되도록 OperationalError 상속)
+    """
+
+
+class ConnectionPool:
+    """
+    프로세스 내 스레드가 함께 쓰는 DB 커넥션 풀
+    - 최대 max_size 개까지 만들고, 모두 사용 중이면 timeout 초 동안 반납을 기다림
+    - health_check_idle 초 이상 쉬던 커넥션은 빌려주기 전에 is_usable() 로 확인 (끊긴 커넥션은 버리고 다시 시도)
+    - 반납 시 reset() 이 False 를 반환하면 (끊김/트랜잭션 상태 불명) 풀에 넣지 않고 닫음
+    connect/is_usable/reset 은 DB 드라이버별로 주입 (commons.db.postgresql 참고)
+    """
+
+    def __init__(self, connect, is_usable, reset, max_size, timeout, health_check_idle, alias=None):
+        self.alias = alias
+        self._connect = connect
+        self._is_usable = is_usable
+        self._reset = reset
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_idle = health_check_idle
+
+        self._cond = threading.Condition()
+        self._idle = deque()    # (커넥션, 반납 시각)
+        self._size = 0          # 풀이 만든 커넥션 중 닫히지 않은 개수 (사용 중 + 대기)
+        self._waiting = 0
+        self._counters = dict.fromkeys(
+            ("acquired", "created", "discarded", "timeouts", "health_checks", "wait_ms", "connect_ms"), 0
+        )
+
+    def _count(self, name, value=1):
+        # self._cond 를 잡은 상태에서 호출
+        self._counters[name] += value
+
+    def _close(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._count("discarded")
+            self._cond.notify()
+
+    def acquire(self):
+        """
+        커넥션 대여 (대기 커넥션 → 새 커넥션 → 반납 대기 순)
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        while True:
+            with self._cond:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._count("timeouts")
+                        raise PoolTimeout(
+                            f"DB 커넥션 풀이 가득 찼습니다. (max_size={self.max_size}, timeout={self.timeout}s)"
+                        )
+                    self._waiting += 1
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+                self._count("wait_ms", (time.monotonic() - start) * 1000)
+                if self._idle:
+                    # 가장 최근에 반납된 커넥션부터 사용 (오래 쉰 커넥션은 DB/방화벽 타임아웃으로 정리되도록 둠)
+                    conn, released_at = self._idle.pop()
+                else:
+                    conn, released_at = None, None
+                    self._size += 1
+
+            if conn is None:
+                connect_start = time.monotonic()
+                try:
+                    conn = self._connect()
+                except BaseException:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._count("created")
+                    self._count("connect_ms", (time.monotonic() - connect_start) * 1000)
+                    self._count("acquired")
+                return conn
+
+            if time.monotonic() - released_at >= self.health_check_idle:
+                with self._cond:
+                    self._count("health_checks")
+                if not self._is_usable(conn):
+                    self._close(conn)
+                    continue
+            with self._cond:
+                self._count("acquired")
+            return conn
+
+    def release(self, conn):
+        try:
+            reusable = self._reset(conn)
+        except Exception:
+            reusable = False
+        if not reusable:
+            self._close(conn)
+            return
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def close_all(self):
+        with self._cond:
+            idle, self._idle = self._idle, deque()
+        for conn, _ in idle:
+            self._close(conn)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "waiting": self._waiting,
+                **{name: round(value, 2) for name, value in self._counters.items()},
+            }
+
+
+# 프로세스 별 커넥션 풀 (fork 된 자식 프로세스(Celery prefork, gunicorn 워커 등)에서는 새로 생성)
+_lock = threading.Lock()
+_pools = {}
+
+
+def get_pool(alias, conn_params, **kwargs):
+    """
+    alias + 접속 정보 별 커넥션 풀 (테스트 DB 생성처럼 접속 정보가 바뀌면 새 풀 사용)
+    kwargs: ConnectionPool 인자 (max_size/timeout/health_check_idle 기본값은 settings.DB_POOL_*)
+    """
+    key = (alias, repr(sorted(conn_params.items())))
+    pid = os.getpid()
+    pools = _pools.get(pid)
+    pool = pools.get(key) if pools else None
+    if pool is None:
+        with _lock:
+            if pid not in _pools:
+                _pools.clear()  # 부모 프로세스에서 만든 커넥션은 사용하지 않음
+                _pools[pid] = {}
+            pool = _pools[pid].get(key)
+            if pool is None:
+                kwargs.setdefault("max_size", settings.DB_POOL_MAX_SIZE)
+                kwargs.setdefault("timeout", settings.DB_POOL_TIMEOUT)
+                kwargs.setdefault("health_check_idle", settings.DB_POOL_HEALTH_CHECK_IDLE)
+                pool = _pools[pid][key] = ConnectionPool(alias=alias, **kwargs)
+    return pool
+
+
+def connection_metrics():
+    """
+    현재 프로세스의 DB 접속 설정과 커넥션 풀 사용 현황
+    반환값: {alias: {"engine", "conn_max_age", "health_checks", "pools": [ConnectionPool.stats(), ...]}}
+    """
+    pools = list(_pools.get(os.getpid(), {}).values())
+    return {
+        alias: {
+            "engine": connections.settings[alias]["ENGINE"],
+            "conn_max_age": connections.settings[alias]["CONN_MAX_AGE"],
+            "health_checks": connections.settings[alias]["CONN_HEALTH_CHECKS"],
+            "pools": [pool.stats() for pool in pools if pool.alias == alias],
+        }
+        for alias in connections.settings
+    }
+
+
+def pool_metric_lines():
+    """
+    커넥션 풀 현황을 Prometheus 텍스트 형식으로 (commons.metrics.render 의 extra_lines)
+    """
+    lines = [
+        "# HELP db_pool_connections 커넥션 풀의 상태별 커넥션 수 (waiting: 반납을 기다리는 스레드 수)",
+        "# TYPE db_pool_connections gauge",
+    ]
+    for alias, info in connection_metrics().items():
+        for state in ("in_use", "idle", "waiting"):
+            total = sum(pool[state] for pool in info["pools"])
+            lines.append(f'db_pool_connections{{alias="{alias}",state="{state}"}} {total}')
+    return lines
@@ -0,0 +1,56 @@
+from django.db.backends.postgresql import base
+from django.utils.asyncio import async_unsafe
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+
+from commons.db.pool import get_pool
+
+
+def _is_usable(conn):
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    except base.Database.Error:
+        return False
+    return True
+
+
+def _reset(conn):
+    """
+    풀에 반납하기 전 커넥션 정리 (끊겼거나 상태를 알 수 없으면 False → 풀에서 제거)
+    """
+    if conn.closed:
+        return False
+    status = conn.info.transaction_status
+    if status == TRANSACTION_STATUS_UNKNOWN:
+        return False
+    if status != TRANSACTION_STATUS_IDLE:
+        conn.rollback()
+    return True
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL(psycopg2) + 프로세스 내 커넥션 풀 (settings.DB_POOL_ENABLED)
+    Django 는 스레드마다 커넥션을 따로 열기 때문에 ASGI(sync_to_async)/스레드 워커에서는 스레드 수만큼 커넥션이 생김
+    → 커넥션을 닫는 대신 풀에 반납하고, 새로 필요할 때 풀에서 빌려 씀
+    풀을 쓸 때는 CONN_MAX_AGE=0 으로 두어 요청이 끝날 때마다 반납되도록 함
+    """
+
+    def _pool(self, conn_params):
+        return get_pool(
+            self.alias,
+            conn_params,
+            connect=lambda: super(DatabaseWrapper, self).get_new_connection(conn_params),
+            is_usable=_is_usable,
+            reset=_reset,
+        )
+
+    @async_unsafe
+    def get_new_connection(self, conn_params):
+        self._leased_from = self._pool(conn_params)
+        return self._leased_from.acquire()
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self._leased_from.release(self.connection)
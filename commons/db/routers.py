@@ -0,0 +1,98 @@
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+REPLICA_STICKY_KEY = "commons:replica_sticky:{user_id}"
+
+# 요청 단위 라우팅 상태 (ReplicaRoutingMiddleware 가 요청마다 설정, 요청 밖(Celery/관리 명령 등)에서는 None → 항상 primary)
+_state = ContextVar("replica_routing_state", default=None)
+
+
+class RoutingState:
+    def __init__(self, use_replica):
+        self.use_replica = use_replica  # 읽기 쿼리를 복제본으로 보낼지
+        self.wrote = False              # 이번 요청에서 쓰기 쿼리가 있었는지
+
+
+def pin_if_recent_writer(user_id):
+    """
+    REPLICA_STICKY_SECONDS 안에 데이터를 변경한 유저의 요청이면 primary 에서 읽음 (복제 지연 동안 자신의 변경이 안 보이는 문제 방지)
+    인증 단계(accounts.authentication)에서 호출
+    """
+    state = _state.get()
+    if state is not None and state.use_replica and cache.get(REPLICA_STICKY_KEY.format(user_id=user_id)):
+        state.use_replica = False
+
+
+class ReplicaRouter:
+    """
+    읽기 쿼리는 settings.REPLICA_DATABASES 중 하나로, 쓰기 쿼리는 primary(default) 로 보냄
+    아래의 경우 읽기도 primary 사용
+    - 요청 밖 (Celery 태스크, 관리 명령 등 읽은 값으로 다시 쓰는 작업)
+    - GET/HEAD/OPTIONS 가 아닌 요청, REPLICA_PRIMARY_PATHS 로 시작하는 경로
+    - 같은 요청에서 쓰기 쿼리가 있었던 이후, primary 트랜잭션(atomic) 안
+    - 최근 REPLICA_STICKY_SECONDS 안에 데이터를 변경한 유저의 요청
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if (
+            state is None
+            or not state.use_replica
+            or not settings.REPLICA_DATABASES
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            # None 을 반환하면 인스턴스를 읽어 온 DB(복제본)를 그대로 쓰므로 primary 를 명시
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.REPLICA_DATABASES)
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.use_replica = False
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 primary 와 같은 데이터이므로 서로 다른 DB 에서 읽은 인스턴스 간 관계 허용
+        databases = {DEFAULT_DB_ALIAS, *settings.REPLICA_DATABASES}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.REPLICA_DATABASES:
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    요청 단위로 ReplicaRouter 의 라우팅 상태를 설정
+    쓰기 쿼리가 있었던 로그인 유저는 REPLICA_STICKY_SECONDS 동안 primary 에서 읽도록 표시
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = RoutingState(
+            use_replica=bool(settings.REPLICA_DATABASES)
+            and request.method in ("GET", "HEAD", "OPTIONS")
+            and not request.path.startswith(tuple(settings.REPLICA_PRIMARY_PATHS))
+        )
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+            if state.wrote:
+                # DRF 는 인증한 유저를 request.user 에도 설정함
+                user = getattr(request, "user", None)
+                if user is not None and user.is_authenticated:
+                    cache.set(REPLICA_STICKY_KEY.format(user_id=user.pk), 1, settings.REPLICA_STICKY_SECONDS)
+            return response
+        finally:
+            _state.reset(token)
@@ -0,0 +1,135 @@
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+
+from spartagames.config import AWS_S3_BUCKET_NAME
+from .models import UploadImage
+
+
+def s3_key(src):
+    return urlparse(src).path.lstrip('/')
+
+
+def _tag_object(s3, key, value):
+    try:
+        s3.put_object_tagging(
+            Bucket=AWS_S3_BUCKET_NAME,
+            Key=key,
+            Tagging={'TagSet': [{'Key': 'is_used', 'Value': value}]},
+        )
+        return True
+    except (BotoCoreError, ClientError):
+        return False
+
+
+def tag_objects(s3, keys, value):
+    """
+    S3 오브젝트 is_used 태깅을 스레드 풀로 병렬 처리
+    반환값: 실패한 키 목록
+    """
+    with ThreadPoolExecutor(max_workers=settings.S3_TAGGING_MAX_WORKERS) as executor:
+        results = executor.map(lambda key: _tag_object(s3, key, value), keys)
+        return [key for key, ok in zip(keys, results) if not ok]
+
+
+def delete_objects(s3, keys):
+    """
+    delete_objects 요청 당 최대 1000개씩 나누어 삭제
+    반환값: 실패한 키 목록
+    """
+    failed = []
+    for start in range(0, len(keys), 1000):
+        batch = keys[start:start + 1000]
+        try:
+            response = s3.delete_objects(
+                Bucket=AWS_S3_BUCKET_NAME,
+                Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True},
+            )
+            failed += [error['Key'] for error in response.get('Errors', [])]
+        except (BotoCoreError, ClientError):
+            failed += batch
+    return failed
+
+
+def _schedule_tagging(srcs):
+    from .tasks import tag_s3_objects
+
+    keys = [s3_key(src) for src in srcs]
+    if keys:
+        transaction.on_commit(lambda: tag_s3_objects.delay(keys))
+
+
+def _schedule_deletion(srcs):
+    from .tasks import delete_s3_objects
+
+    keys = [s3_key(src) for src in srcs]
+    if keys:
+        transaction.on_commit(lambda: delete_s3_objects.delay(keys))
+
+
+def used_image_rows(instance):
+    return UploadImage.objects.filter(
+        content_type=ContentType.objects.get_for_model(instance),
+        content_id=instance.pk,
+        is_used=True,
+    )
+
+
+def register_content_images(instance, uploader, srcs):
+    """
+    새 게시글/프로필 본문의 이미지 등록
+    UploadImage 는 한 번에 생성하고, S3 태깅(is_used=true)은 커밋 이후 Celery 태스크에서 처리 (응답이 S3 를 기다리지 않음)
+    """
+    srcs = list(dict.fromkeys(srcs))  # 본문에 같은 이미지가 여러 번 있어도 한 번만 등록
+    if not srcs:
+        return
+    content_type = ContentType.objects.get_for_model(instance)
+    UploadImage.objects.bulk_create([
+        UploadImage(content_type=content_type, content_id=instance.pk, uploader=uploader, src=src, is_used=True)
+        for src in srcs
+    ])
+    _schedule_tagging(srcs)
+
+
+def sync_content_images(instance, uploader, srcs):
+    """
+    본문 수정 시 이미지 정리
+    - 사라진 이미지: UploadImage 삭제(쿼리 1번) + S3 오브젝트 삭제(백그라운드)
+    - 추가된 이미지: register_content_images 와 동일
+    """
+    rows = used_image_rows(instance)
+    old_srcs = set(rows.values_list("src", flat=True))
+    new_srcs = list(dict.fromkeys(srcs))
+
+    delete_srcs = old_srcs - set(new_srcs)
+    if delete_srcs:
+        rows.filter(src__in=delete_srcs).delete()
+        _schedule_deletion(delete_srcs)
+
+    register_content_images(instance, uploader, [src for src in new_srcs if src not in old_srcs])
+
+
+def delete_content_images(instance):
+    """
+    게시글/프로필 삭제 시 사용된 모든 이미지의 UploadImage 삭제 + S3 오브젝트 삭제(백그라운드)
+    """
+    rows = used_image_rows(instance)
+    srcs = list(rows.values_list("src", flat=True))
+    if srcs:
+        rows.delete()
+        _schedule_deletion(srcs)
+
+
+def delete_uploader_images(user):
+    """
+    회원 완전 삭제 시 해당 회원이 업로드한 모든 이미지의 UploadImage 삭제 + S3 오브젝트 삭제(백그라운드)
+    """
+    rows = UploadImage.objects.filter(uploader=user)
+    srcs = list(rows.values_list("src", flat=True))
+    if srcs:
+        rows.delete()
+        _schedule_deletion(srcs)
@@ -0,0 +1,80 @@
+import re
+import statistics
+import time
+
+from bs4 import BeautifulSoup
+from django.core.management.base import BaseCommand
+
+from commons.content import clear_parse_cache, normalize_text, parse_content
+
+
+def make_document(size):
+    """
+    에디터 본문과 비슷한 구조(문단, 서식, 링크, 이미지)의 size 바이트 내외 HTML
+    """
+    paragraph = (
+        "<p>팀원 모집 안내 {i} <strong>Unity</strong> 클라이언트 &amp; 서버 개발자를 찾습니다.&nbsp;"
+        "<a href='https://example.com/{i}'>포트폴리오</a></p>\n"
+        "<p><img src='https://images.example.com/screenshot/teambuildings/{i}.png'></p>\n"
+    )
+    parts = []
+    length = 0
+    i = 0
+    while length < size:
+        block = paragraph.format(i=i)
+        parts.append(block)
+        length += len(block.encode())
+        i += 1
+    return "".join(parts)
+
+
+def legacy_pipeline(content):
+    # 기존: 검증 정규식 2회 + BeautifulSoup 파싱 2회 (content_text, img src)
+    text_only = re.sub(r'<[^>]+>', '', content)
+    tag_only = re.findall(r'<[^>]+>', content)
+    stats = (len(text_only), sum(len(tag) for tag in tag_only))
+    text = normalize_text(BeautifulSoup(content, "html.parser").get_text())
+    srcs = [img.get('src') for img in BeautifulSoup(content, 'html.parser').find_all('img') if img.get('src')]
+    return stats, text, srcs
+
+
+def single_parse_pipeline(content):
+    clear_parse_cache()
+    parsed = parse_content(content)
+    return (parsed.text_length, parsed.tag_length), parsed.text, list(parsed.srcs)
+
+
+class Command(BaseCommand):
+    """
+    본문 처리(길이 검증 + 검색용 텍스트 + 이미지 src) 기존 방식과 단일 파싱 방식 비교
+    예) python manage.py benchmark_content_parse --sizes 100 500 --repeat 5
+    """
+    help = "HTML 본문 처리 파이프라인의 기존/단일 파싱 방식 소요 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500], help="문서 크기 (KB)")
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def measure(self, func, content, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(content)
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'size':>8} {'legacy p50':>12} {'single p50':>12} {'speedup':>8}")
+        for size in options["sizes"]:
+            content = make_document(size * 1024)
+
+            legacy, single = legacy_pipeline(content), single_parse_pipeline(content)
+            if legacy[1:] != single[1:]:
+                self.stderr.write(f"{size}KB: 결과가 다릅니다.")
+                continue
+
+            legacy_ms = self.measure(legacy_pipeline, content, options["repeat"])
+            single_ms = self.measure(single_parse_pipeline, content, options["repeat"])
+            self.stdout.write(
+                f"{size:>6}KB {legacy_ms:>10.1f}ms {single_ms:>10.1f}ms {legacy_ms / single_ms:>7.1f}x"
+            )
@@ -0,0 +1,134 @@
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.utils import load_backend
+
+from commons.db.pool import ConnectionPool
+
+
+class Command(BaseCommand):
+    """
+    DB 커넥션 방식별 요청 당 소요 시간 비교 (쿼리 1번(SELECT 1)을 요청 1건으로 보고 측정)
+    - 요청마다 연결: CONN_MAX_AGE=0 (기존 설정)
+    - 커넥션 유지: CONN_MAX_AGE=DB_CONN_MAX_AGE + CONN_HEALTH_CHECKS (요청 시작 시 확인 쿼리 포함)
+    - 커넥션 풀: commons.db.postgresql (PostgreSQL 인 경우만)
+    --concurrency 만큼 스레드를 띄워 동시에 요청 (ASGI/스레드 워커 상황)
+    예) python manage.py benchmark_db_connections --repeat 200 --concurrency 8
+    """
+    help = "DB 커넥션 방식(요청마다 연결/유지/풀)별 요청 당 소요 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=100, help="스레드 당 요청 수")
+        parser.add_argument("--concurrency", type=int, default=1)
+        parser.add_argument("--database", default="default")
+
+    def new_wrapper(self, conn_max_age):
+        # 설정된 ENGINE 과 관계없이 Django 기본 백엔드로 비교 (풀 백엔드면 PostgreSQL 기본 백엔드 사용)
+        settings_dict = {**connections.settings[self.alias], "CONN_MAX_AGE": conn_max_age, "CONN_HEALTH_CHECKS": True}
+        if settings_dict["ENGINE"] == "commons.db.postgresql":
+            settings_dict["ENGINE"] = "django.db.backends.postgresql"
+        return load_backend(settings_dict["ENGINE"]).DatabaseWrapper(settings_dict, self.alias)
+
+    def run(self, make_request):
+        """
+        make_request(): 스레드마다 한 번 호출하여 요청 1건을 처리하는 함수를 반환
+        반환값: 요청 당 소요 시간 목록 (ms)
+        """
+        def worker():
+            request, cleanup = make_request()
+            timings = []
+            try:
+                for _ in range(self.repeat):
+                    start = time.perf_counter()
+                    request()
+                    timings.append((time.perf_counter() - start) * 1000)
+            finally:
+                cleanup()
+            return timings
+
+        with ThreadPoolExecutor(self.concurrency) as executor:
+            futures = [executor.submit(worker) for _ in range(self.concurrency)]
+            return [timing for future in futures for timing in future.result()]
+
+    def per_request(self):
+        wrapper = self.new_wrapper(0)
+
+        def request():
+            with wrapper.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            # 요청 종료 시 close_old_connections() 와 동일
+            wrapper.close_if_unusable_or_obsolete()
+        return request, wrapper.close
+
+    def persistent(self):
+        wrapper = self.new_wrapper(settings.DB_CONN_MAX_AGE)
+
+        def request():
+            with wrapper.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            wrapper.close_if_unusable_or_obsolete()
+        return request, wrapper.close
+
+    def pooled(self, pool):
+        def make_request():
+            def request():
+                conn = pool.acquire()
+                try:
+                    with conn.cursor() as cursor:
+                        cursor.execute("SELECT 1")
+                finally:
+                    pool.release(conn)
+            return request, lambda: None
+        return make_request
+
+    def build_pool(self):
+        from commons.db.postgresql.base import _is_usable, _reset
+
+        lock = threading.Lock()
+        wrapper = self.new_wrapper(0)
+        params = wrapper.get_connection_params()
+
+        def connect():
+            with lock:
+                return wrapper.get_new_connection(params)
+
+        return ConnectionPool(
+            connect=connect, is_usable=_is_usable, reset=_reset,
+            max_size=settings.DB_POOL_MAX_SIZE, timeout=settings.DB_POOL_TIMEOUT,
+            health_check_idle=settings.DB_POOL_HEALTH_CHECK_IDLE,
+        )
+
+    def report(self, label, timings):
+        timings = sorted(timings)
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f"{label:<16} {statistics.median(timings):>8.2f}ms {p95:>8.2f}ms {timings[-1]:>8.2f}ms"
+        )
+        return statistics.median(timings)
+
+    def handle(self, *args, **options):
+        self.alias = options["database"]
+        self.repeat = options["repeat"]
+        self.concurrency = options["concurrency"]
+
+        self.stdout.write(f"요청 {self.repeat}건 x 스레드 {self.concurrency}개")
+        self.stdout.write(f"{'':<16} {'p50':>10} {'p95':>10} {'max':>10}")
+        baseline = self.report("요청마다 연결", self.run(self.per_request))
+        persistent = self.report("커넥션 유지", self.run(self.persistent))
+        self.stdout.write(f"커넥션 유지: 요청 당 {baseline - persistent:.2f}ms 절약")
+
+        if connections[self.alias].vendor != "postgresql":
+            self.stdout.write("커넥션 풀 측정은 PostgreSQL 에서만 지원합니다.")
+            return
+        pool = self.build_pool()
+        try:
+            pooled = self.report("커넥션 풀", self.run(self.pooled(pool)))
+            self.stdout.write(f"커넥션 풀: 요청 당 {baseline - pooled:.2f}ms 절약")
+            self.stdout.write(f"풀 사용 현황: {pool.stats()}")
+        finally:
+            pool.close_all()
@@ -0,0 +1,210 @@
+import json
+import math
+import platform
+import random
+import statistics
+import time
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from games import tasks as game_tasks
+from games.models import Game, GameCategory, Like, PlayLog, Review, TotalPlayTime
+from teambuildings.models import TeamBuildPost
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    """
+    주요 엔드포인트/칩 할당 태스크의 처리량(req/s), 지연시간(p50/p99), 쿼리 수 측정
+    - 요청은 테스트 클라이언트로 프로세스 안에서 처리 (미들웨어/DRF/직렬화 포함, 네트워크 제외)
+    - 캐시는 로컬 메모리 캐시로 바꾸어 요청마다 비움 (--warm-cache 로 유지), 태스크는 매번 롤백
+    - 결과를 JSON 으로 저장하고 이전 결과(baseline)와 비교하여 회귀 표시
+    예)
+        python manage.py seed_benchmark_data --preset large
+        python manage.py benchmark_endpoints --output benchmarks/baseline.json
+        (변경 후) python manage.py benchmark_endpoints --baseline benchmarks/baseline.json --fail-on-regression
+    """
+    help = "엔드포인트/태스크 별 처리량, p50/p99 지연시간, 쿼리 수를 측정하고 baseline 과 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=30, help="엔드포인트 당 측정 요청 수")
+        parser.add_argument("--task-repeat", type=int, default=3, help="태스크 당 측정 실행 수")
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--only", nargs="+", help="측정할 항목 이름")
+        parser.add_argument("--warm-cache", action="store_true", help="요청 사이에 캐시를 비우지 않음")
+        parser.add_argument("--output", help="결과 JSON 저장 경로")
+        parser.add_argument("--baseline", help="비교할 결과 JSON 경로")
+        parser.add_argument("--threshold", type=float, default=0.25, help="p50 회귀 기준 (0.25 = 25%% 이상 느려짐)")
+        parser.add_argument("--fail-on-regression", action="store_true")
+
+    def cases(self):
+        """
+        측정 항목 {이름: 요청/실행 1회 함수} (데이터는 seed_benchmark_data 로 생성)
+        """
+        game = Game.objects.filter(is_visible=True, register_state=1).order_by("-review_cnt").first()
+        category = GameCategory.objects.filter(games__isnull=False).order_by("pk").first()
+        user = Like.objects.values_list("user_id", flat=True).order_by("user_id").first()
+        if not (game and category and user):
+            raise CommandError("데이터가 없습니다. 먼저 seed_benchmark_data 를 실행해주세요.")
+        token = str(AccessToken.for_user(get_user_model().objects.get(pk=user)))
+        client = Client()
+
+        def get(name, query=None, **kwargs):
+            def request(headers=None):
+                response = client.get(reverse(name, kwargs=kwargs), query or {}, headers=headers)
+                if response.status_code != 200:
+                    raise CommandError(f"{name}: {response.status_code} {response.content[:200]!r}")
+            return request
+
+        def authenticated(request):
+            return lambda: request(headers={"Authorization": f"Bearer {token}"})
+
+        def task(func):
+            def run():
+                # 태스크는 데이터를 바꾸므로 실행 후 롤백 (예외를 잡아 문자열로 반환하는 태스크도 결과를 확인)
+                try:
+                    with transaction.atomic():
+                        result = func()
+                        raise Rollback(result)
+                except Rollback as e:
+                    if str(e).startswith("Error"):
+                        raise CommandError(f"{func.__name__}: {e}")
+            return run
+
+        return {
+            "game_list": get("games:game_list"),
+            "game_list_authenticated": authenticated(get("games:game_list")),
+            "game_list_search": get("games:search", {"keyword": "game 1"}),
+            "category_games_list": get("games:category_games_list", {"category": category.name}),
+            "game_reviews": get("games:reviews", game_id=game.pk),
+            "game_reviews_authenticated": authenticated(get("games:reviews", game_id=game.pk)),
+            "teambuild_post_list": get("teambuildings:teambuild_post_list"),
+            "task_assign_chips_to_top_games": task(game_tasks.assign_chips_to_top_games),
+            "task_assign_bookmark_top_chips": task(game_tasks.assign_bookmark_top_chips),
+            "task_assign_long_play_chips": task(game_tasks.assign_long_play_chips),
+            "task_assign_review_top_chips": task(game_tasks.assign_review_top_chips),
+            "task_cleanup_new_game_chip": task(game_tasks.cleanup_new_game_chip),
+        }
+
+    def measure(self, run, repeat, warmup, warm_cache):
+        for _ in range(warmup):
+            run()
+        if not warm_cache:
+            cache.clear()
+        # CaptureQueriesContext 는 요청 시작 시 reset_queries 로 기록이 지워질 수 있으므로 실행 래퍼로 집계
+        queries = []
+        with connection.execute_wrapper(lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)):
+            run()
+
+        timings = []
+        for _ in range(repeat):
+            if not warm_cache:
+                cache.clear()
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        return {
+            "rps": round(len(timings) / sum(timings), 1),
+            "p50_ms": round(statistics.median(timings) * 1000, 2),
+            "p99_ms": round(timings[math.ceil(len(timings) * 0.99) - 1] * 1000, 2),
+            "queries": len(queries),
+            "n": len(timings),
+        }
+
+    def dataset(self):
+        return {
+            "vendor": connection.vendor,
+            "games": Game.objects.count(),
+            "likes": Like.objects.count(),
+            "reviews": Review.objects.count(),
+            "playtimes": TotalPlayTime.objects.count(),
+            "playlogs": PlayLog.objects.count(),
+            "teambuild_posts": TeamBuildPost.objects.count(),
+        }
+
+    def compare(self, results, baseline, threshold):
+        """
+        반환값: 회귀 항목 목록 (쿼리 수 증가 또는 p50 이 threshold 이상 느려짐)
+        """
+        regressions = []
+        self.stdout.write(f"\n{'baseline 비교':<32} {'p50':>18} {'queries':>12}")
+        for name, result in results.items():
+            before = baseline["results"].get(name)
+            if before is None:
+                continue
+            change = result["p50_ms"] / before["p50_ms"] - 1 if before["p50_ms"] else 0
+            slower = change >= threshold
+            more_queries = result["queries"] > before["queries"]
+            line = (
+                f"{name:<32} {before['p50_ms']:>7.2f}→{result['p50_ms']:<7.2f}({change:+.0%})"
+                f" {before['queries']:>4}→{result['queries']:<4}"
+            )
+            if slower or more_queries:
+                regressions.append(name)
+                self.stdout.write(self.style.ERROR(f"{line} 회귀"))
+            else:
+                self.stdout.write(line)
+        if baseline.get("dataset") != self.dataset():
+            self.stdout.write(self.style.WARNING("baseline 과 데이터 규모가 다릅니다. 지연시간 비교는 참고용입니다."))
+        return regressions
+
+    def handle(self, *args, **options):
+        # 결과가 요청마다 달라지지 않도록 (GameListAPIView 의 카테고리 무작위 선택 등)
+        random.seed(options["seed"])
+        with override_settings(
+            ALLOWED_HOSTS=["testserver"],
+            CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+            PROFILING_ENABLED=False,
+            REPLICA_DATABASES=[],
+        ):
+            cases = self.cases()
+            only = options["only"]
+            if only:
+                unknown = set(only) - set(cases)
+                if unknown:
+                    raise CommandError(f"알 수 없는 항목: {', '.join(sorted(unknown))}")
+                cases = {name: run for name, run in cases.items() if name in only}
+
+            results = {}
+            self.stdout.write(f"{'':<32} {'req/s':>8} {'p50':>10} {'p99':>10} {'queries':>8}")
+            for name, run in cases.items():
+                repeat = options["task_repeat"] if name.startswith("task_") else options["repeat"]
+                warmup = min(options["warmup"], 1) if name.startswith("task_") else options["warmup"]
+                result = results[name] = self.measure(run, repeat, warmup, options["warm_cache"])
+                self.stdout.write(
+                    f"{name:<32} {result['rps']:>8.1f} {result['p50_ms']:>8.2f}ms {result['p99_ms']:>8.2f}ms"
+                    f" {result['queries']:>8}"
+                )
+
+            report = {
+                "created_at": timezone.now().isoformat(),
+                "python": platform.python_version(),
+                "dataset": self.dataset(),
+                "options": {key: options[key] for key in ("repeat", "task_repeat", "warmup", "seed", "warm_cache")},
+                "results": results,
+            }
+
+        if options["output"]:
+            path = Path(options["output"])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+            self.stdout.write(f"결과 저장: {path}")
+
+        if options["baseline"]:
+            baseline = json.loads(Path(options["baseline"]).read_text())
+            regressions = self.compare(results, baseline, options["threshold"])
+            if regressions and options["fail_on_regression"]:
+                raise CommandError(f"회귀 {len(regressions)}건: {', '.join(regressions)}")
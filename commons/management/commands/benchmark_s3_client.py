@@ -0,0 +1,52 @@
+import statistics
+import time
+
+import boto3
+from django.core.management.base import BaseCommand
+
+from commons.storage import get_s3_client
+from spartagames.config import AWS_AUTH, AWS_S3_BUCKET_NAME, AWS_S3_REGION_NAME
+
+
+class Command(BaseCommand):
+    """
+    요청마다 boto3.client 를 만드는 기존 방식과 프로세스 공용 클라이언트(get_s3_client) 비교
+    presigned url 발급(네트워크 없음) 1회를 요청 1건으로 보고 측정
+    예) python manage.py benchmark_s3_client --repeat 50
+    """
+    help = "S3 클라이언트 생성 방식별 요청 당 소요 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def per_request(self, get_client):
+        s3 = get_client()
+        return s3.generate_presigned_url(
+            ClientMethod='put_object',
+            Params={'Bucket': AWS_S3_BUCKET_NAME, 'Key': 'benchmark/object.png'},
+            ExpiresIn=600,
+        )
+
+    def measure(self, get_client, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            self.per_request(get_client)
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings), max(timings)
+
+    def handle(self, *args, **options):
+        def new_client():
+            return boto3.client(
+                's3',
+                aws_access_key_id=AWS_AUTH["aws_access_key_id"],
+                aws_secret_access_key=AWS_AUTH["aws_secret_access_key"],
+                region_name=AWS_S3_REGION_NAME,
+            )
+
+        per_request_p50, per_request_max = self.measure(new_client, options["repeat"])
+        shared_p50, shared_max = self.measure(get_s3_client, options["repeat"])
+        self.stdout.write(f"{'':<20} {'p50':>10} {'max':>10}")
+        self.stdout.write(f"{'boto3.client/요청':<20} {per_request_p50:>8.2f}ms {per_request_max:>8.2f}ms")
+        self.stdout.write(f"{'get_s3_client':<20} {shared_p50:>8.2f}ms {shared_max:>8.2f}ms")
+        self.stdout.write(f"요청 당 {per_request_p50 - shared_p50:.2f}ms 절약 ({per_request_p50 / shared_p50:.0f}x)")
@@ -0,0 +1,83 @@
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from commons.models import UploadImage
+from games.models import Game, Like, Review, ReviewsLike, TotalPlayTime
+from teambuildings.models import TeamBuildPost
+
+
+class Command(BaseCommand):
+    """
+    주요 엔드포인트의 핫 쿼리에 대해 실행 계획(EXPLAIN)과 지연시간을 출력
+    인덱스 추가 전/후 비교:
+        python manage.py seed_benchmark_data
+        python manage.py migrate games 0009 && python manage.py migrate teambuildings 0005 && python manage.py migrate commons 0001
+        python manage.py explain_hot_queries > before.txt
+        python manage.py migrate
+        python manage.py explain_hot_queries > after.txt
+    """
+    help = "핫 쿼리의 실행 계획과 지연시간(p50/max)을 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--analyze", action="store_true", help="PostgreSQL EXPLAIN ANALYZE 사용")
+        parser.add_argument("--no-plan", action="store_true", help="실행 계획 출력 생략")
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.filter(like_games__isnull=False).first() or get_user_model().objects.first()
+        game = Game.objects.filter(is_visible=True, register_state=1).order_by("-review_cnt").first()
+        review = Review.objects.filter(is_visible=True).first()
+        post = TeamBuildPost.objects.filter(is_visible=True).first()
+        if not (user and game):
+            self.stderr.write("데이터가 없습니다. 먼저 seed_benchmark_data 를 실행해주세요.")
+            return
+
+        today = timezone.now().date()
+        public = Game.objects.filter(is_visible=True, register_state=1)
+        queries = {
+            # games:game_list / category_games_list / game_list_search
+            "game_list_created": public.order_by("-created_at")[:4],
+            "game_list_updated": public.order_by("-updated_at")[:4],
+            "game_list_star": public.order_by("-star", "-created_at")[:16],
+            # qnas:get_stats
+            "admin_stats_ready": Game.objects.filter(is_visible=True, register_state=0),
+            # games:reviews
+            "reviews_by_game": Review.objects.filter(game=game, is_visible=True).order_by("-created_at")[:6],
+            # GameListSerializer.get_is_liked / GameLikeAPIView
+            "like_lookup": Like.objects.filter(user=user, game=game),
+            # ReviewSerializer.get_user_is_like / toggle_review_like
+            "reviews_like_lookup": ReviewsLike.objects.filter(review=review, user=user) if review else None,
+            # GamePlaytimeAPIView.post
+            "totalplaytime_lookup": TotalPlayTime.objects.filter(user=user, game=game),
+            # teambuildings:teambuild_post_list (추천/마감임박)
+            "teambuild_open_deadline": TeamBuildPost.objects.filter(is_visible=True, deadline__gte=today).order_by("deadline")[:4],
+            "teambuild_list_created": TeamBuildPost.objects.filter(is_visible=True).order_by("-create_dt")[:12],
+            # teambuildings:teambuild_post_detail (수정/삭제 시 이미지 조회)
+            "upload_images_by_content": UploadImage.objects.filter(
+                content_type=ContentType.objects.get_for_model(TeamBuildPost),
+                content_id=post.id if post else 0,
+                is_used=True,
+            ),
+        }
+
+        self.stdout.write(f"database vendor: {connection.vendor}")
+        for name, queryset in queries.items():
+            if queryset is None:
+                continue
+            timings = []
+            for _ in range(options["repeat"]):
+                start = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - start) * 1000)
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n[{name}]"))
+            self.stdout.write(f"p50={statistics.median(timings):.3f}ms max={max(timings):.3f}ms (n={len(timings)})")
+            if not options["no_plan"]:
+                explain_options = {"analyze": True} if options["analyze"] and connection.vendor == "postgresql" else {}
+                self.stdout.write(queryset.explain(**explain_options))
@@ -0,0 +1,280 @@
+import random
+from datetime import timedelta
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from commons.counters import reconcile_all
+from commons.models import UploadImage
+from games.models import Game, GameCategory, Like, PlayLog, Review, ReviewsLike, TotalPlayTime
+from teambuildings.models import TeamBuildPost, Role, PURPOSE_CHOICES, DURATION_CHOICES, MEETING_TYPE_CHOICES
+
+
+BENCH_PREFIX = "bench"
+
+# 데이터 규모 (옵션을 따로 주면 해당 항목만 덮어씀)
+PRESETS = {
+    "small": {"users": 200, "games": 1000, "likes": 10000, "reviews": 10000, "playtimes": 10000, "playlogs": 10000, "posts": 500},
+    "default": {"users": 1000, "games": 10000, "likes": 100000, "reviews": 100000, "playtimes": 100000, "playlogs": 100000, "posts": 5000},
+    "large": {"users": 20000, "games": 100000, "likes": 1000000, "reviews": 1000000, "playtimes": 1000000, "playlogs": 1000000, "posts": 50000},
+}
+
+
+class Command(BaseCommand):
+    """
+    벤치마크용 대량 더미 데이터 생성
+    모든 데이터는 'bench' 접두사를 가진 유저/카테고리에 묶여서 생성되므로 --clear 로 한번에 정리 가능
+    예) python manage.py seed_benchmark_data --users 2000 --games 20000 --likes 200000
+        python manage.py seed_benchmark_data --preset large   (게임 10만, 좋아요/리뷰/플레이 기록 100만, 팀빌딩 게시글 5만)
+    객체/조합은 batch-size 단위로 만들어 바로 저장하므로 large 규모에서도 메모리에는 유저/게임 id 목록만 유지 (SQLite/PostgreSQL)
+    """
+    help = "벤치마크용 대량 더미 데이터를 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--preset", choices=PRESETS, default="default")
+        for name in PRESETS["default"]:
+            parser.add_argument(f"--{name}", type=int)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--clear", action="store_true", help="기존 벤치마크 데이터 삭제 후 종료")
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+
+        if options["clear"]:
+            self.clear()
+            return
+
+        counts = {
+            name: default if options[name] is None else options[name]
+            for name, default in PRESETS[options["preset"]].items()
+        }
+        with transaction.atomic():
+            categories = self.seed_categories()
+            roles = self.seed_roles()
+            user_ids = self.seed_users(counts["users"])
+            game_ids = self.seed_games(counts["games"], user_ids, categories)
+            self.seed_likes(counts["likes"], user_ids, game_ids)
+            reviews = self.seed_reviews(counts["reviews"], user_ids, game_ids)
+            self.seed_reviews_likes(counts["likes"], user_ids, reviews, counts["reviews"])
+            self.seed_playtimes(counts["playtimes"], user_ids, game_ids)
+            self.seed_playlogs(counts["playlogs"], user_ids, game_ids)
+            self.seed_posts(counts["posts"], user_ids, roles)
+            # bulk_create 는 카운터를 갱신하지 않으므로 한 번에 보정
+            self.log("reconciled counters", reconcile_all(batch_size=self.batch_size))
+
+        self.stdout.write(self.style.SUCCESS("벤치마크 데이터 생성 완료"))
+
+    def clear(self):
+        users = get_user_model().objects.filter(email__startswith=f"{BENCH_PREFIX}_")
+        Game.objects.filter(maker__in=users).delete()
+        TeamBuildPost.objects.filter(author__in=users).delete()
+        deleted, _ = users.delete()
+        GameCategory.objects.filter(name__startswith=f"{BENCH_PREFIX}_").delete()
+        self.stdout.write(self.style.SUCCESS(f"벤치마크 데이터 삭제 완료 ({deleted} rows)"))
+
+    def log(self, name, count):
+        self.stdout.write(f"  - {name}: {count}")
+
+    def bulk_create(self, model, objs, **kwargs):
+        """
+        objs(이터러블)를 batch-size 개씩 만들어 저장 (전체 객체를 한 번에 메모리에 올리지 않음)
+        반환값: 저장한 객체 수
+        """
+        objs = iter(objs)
+        saved = 0
+        while batch := list(islice(objs, self.batch_size)):
+            model.objects.bulk_create(batch, **kwargs)
+            saved += len(batch)
+        return saved
+
+    def iter_pks(self, queryset):
+        # pk 순으로 batch-size 개씩 조회
+        last_pk = 0
+        while pks := list(queryset.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:self.batch_size]):
+            yield from pks
+            last_pk = pks[-1]
+
+    def unique_pairs(self, count, left, left_count, right):
+        """
+        (left, right) 조합이 유일해야 하는 테이블용 (Like, ReviewsLike, TotalPlayTime)
+        left 값마다 right 에서 겹치지 않게 뽑아 차례로 반환하므로 전체 조합을 메모리에 모으지 않음
+        left: left_count 개의 값을 내는 이터러블, right: 목록
+        """
+        count = min(count, left_count * len(right))
+        if not count:
+            return
+        per_left, extra = divmod(count, left_count)
+        for i, value in enumerate(islice(left, left_count)):
+            for other in self.rng.sample(right, per_left + (i < extra)):
+                yield value, other
+
+    def seed_categories(self):
+        names = [f"{BENCH_PREFIX}_category_{i}" for i in range(12)]
+        GameCategory.objects.bulk_create([GameCategory(name=x) for x in names], ignore_conflicts=True)
+        return list(GameCategory.objects.filter(name__in=names))
+
+    def seed_roles(self):
+        names = [f"{BENCH_PREFIX}_role_{i}" for i in range(10)]
+        Role.objects.bulk_create([Role(name=x) for x in names], ignore_conflicts=True)
+        return list(Role.objects.filter(name__in=names))
+
+    def seed_users(self, count):
+        User = get_user_model()
+        start = User.objects.filter(email__startswith=f"{BENCH_PREFIX}_").count()
+        self.bulk_create(User, (
+            User(
+                email=f"{BENCH_PREFIX}_{i}@example.com",
+                nickname=f"{BENCH_PREFIX}{i}",
+                login_type="DEFAULT",
+                introduce="",
+                password="!",
+            )
+            for i in range(start, start + count)
+        ))
+        self.log("users", count)
+        return list(User.objects.filter(email__startswith=f"{BENCH_PREFIX}_").values_list("id", flat=True))
+
+    def seed_games(self, count, user_ids, categories):
+        now = timezone.now()
+        through = Game.category.through
+        game_ids = []
+        for start in range(0, count, self.batch_size):
+            created = Game.objects.bulk_create([
+                Game(
+                    title=f"{BENCH_PREFIX} game {i}",
+                    thumbnail="images/thumbnail/bench.png",
+                    maker_id=self.rng.choice(user_ids),
+                    content="<p>benchmark</p>",
+                    gamefile="zips/bench.zip",
+                    register_state=self.rng.choices([0, 1, 2], weights=[1, 8, 1])[0],
+                    is_visible=self.rng.random() > 0.05,
+                    star=round(self.rng.uniform(0, 5), 2),
+                    review_cnt=0,
+                )
+                for i in range(start, min(start + self.batch_size, count))
+            ])
+
+            # auto_now_add 필드는 bulk_create 시 현재 시각으로 채워지므로 분포를 주기 위해 별도 갱신
+            for game in created:
+                game.created_at = now - timedelta(minutes=self.rng.randint(0, 60 * 24 * 365))
+                game.updated_at = game.created_at + timedelta(minutes=self.rng.randint(0, 60 * 24 * 30))
+            Game.objects.bulk_update(created, ["created_at", "updated_at"])
+
+            through.objects.bulk_create(
+                [through(game_id=game.id, gamecategory_id=self.rng.choice(categories).id) for game in created]
+            )
+            game_ids.extend(game.id for game in created)
+        self.log("games", count)
+        return game_ids
+
+    def seed_likes(self, count, user_ids, game_ids):
+        pairs = self.unique_pairs(count, user_ids, len(user_ids), game_ids)
+        self.log("likes", self.bulk_create(Like, (Like(user_id=u, game_id=g) for u, g in pairs), ignore_conflicts=True))
+
+    def seed_reviews(self, count, user_ids, game_ids):
+        """
+        반환값: 이번에 만든 리뷰 queryset
+        """
+        last_pk = Review.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+        self.bulk_create(Review, (
+            Review(
+                game_id=self.rng.choice(game_ids),
+                author_id=self.rng.choice(user_ids),
+                content="benchmark review",
+                star=self.rng.randint(1, 5),
+                difficulty=self.rng.randint(0, 2),
+                is_visible=self.rng.random() > 0.05,
+            )
+            for _ in range(count)
+        ))
+        self.log("reviews", count)
+        return Review.objects.filter(pk__gt=last_pk)
+
+    def seed_reviews_likes(self, count, user_ids, reviews, review_count):
+        # 리뷰 id 는 목록으로 들고 있지 않고 pk 순으로 나누어 조회
+        pairs = self.unique_pairs(count, self.iter_pks(reviews), review_count, user_ids)
+        saved = self.bulk_create(
+            ReviewsLike,
+            (ReviewsLike(review_id=r, user_id=u, is_like=self.rng.choice([1, 2])) for r, u in pairs),
+            ignore_conflicts=True,
+        )
+        self.log("reviews_likes", saved)
+
+    def seed_playtimes(self, count, user_ids, game_ids):
+        now = timezone.now()
+        pairs = self.unique_pairs(count, user_ids, len(user_ids), game_ids)
+        saved = self.bulk_create(
+            TotalPlayTime,
+            (
+                TotalPlayTime(
+                    user_id=u, game_id=g,
+                    latest_at=now - timedelta(minutes=self.rng.randint(0, 60 * 24 * 90)),
+                    totaltime=self.rng.randint(10, 36000),
+                )
+                for u, g in pairs
+            ),
+            ignore_conflicts=True,
+        )
+        self.log("playtimes", saved)
+
+    def seed_playlogs(self, count, user_ids, game_ids):
+        now = timezone.now()
+
+        def playlog():
+            playtime = self.rng.randint(10, 3600)
+            end_at = now - timedelta(minutes=self.rng.randint(0, 60 * 24 * 90))
+            return PlayLog(
+                user_id=self.rng.choice(user_ids), game_id=self.rng.choice(game_ids),
+                start_at=end_at - timedelta(seconds=playtime), end_at=end_at, playtime=playtime,
+            )
+
+        self.bulk_create(PlayLog, (playlog() for _ in range(count)))
+        self.log("playlogs", count)
+
+    def seed_posts(self, count, user_ids, roles):
+        today = timezone.now().date()
+        through = TeamBuildPost.want_roles.through
+        content_type = ContentType.objects.get_for_model(TeamBuildPost)
+        for start in range(0, count, self.batch_size):
+            posts = TeamBuildPost.objects.bulk_create([
+                TeamBuildPost(
+                    author_id=self.rng.choice(user_ids),
+                    title=f"{BENCH_PREFIX} post {i}",
+                    thumbnail="images/thumbnail/teambuildings/teambuilding_default.png",
+                    purpose=self.rng.choice(PURPOSE_CHOICES)[0],
+                    duration=self.rng.choice(DURATION_CHOICES)[0],
+                    meeting_type=self.rng.choice(MEETING_TYPE_CHOICES)[0],
+                    deadline=today + timedelta(days=self.rng.randint(-60, 60)),
+                    contact="bench@example.com",
+                    content="<p>benchmark</p>",
+                    content_text="benchmark",
+                    is_visible=self.rng.random() > 0.05,
+                )
+                for i in range(start, min(start + self.batch_size, count))
+            ])
+
+            through.objects.bulk_create([
+                through(teambuildpost_id=post.id, role_id=role.id)
+                for post in posts
+                for role in self.rng.sample(roles, self.rng.randint(1, 3))
+            ])
+
+            # 게시글 당 에디터 이미지 2개
+            UploadImage.objects.bulk_create([
+                UploadImage(
+                    content_type=content_type,
+                    content_id=post.id,
+                    uploader_id=post.author_id,
+                    src=f"https://example.com/{BENCH_PREFIX}/{post.id}_{n}.png",
+                    is_used=True,
+                )
+                for post in posts
+                for n in range(2)
+            ])
+        self.log("teambuild_posts", count)
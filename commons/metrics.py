@@ -0,0 +1,88 @@
+import threading
+from bisect import bisect_left
+
+
+# 프로세스 내 Prometheus 형식 지표 (prometheus_client 없이 텍스트 형식만 구현)
+# 프로세스(워커) 별로 따로 집계되므로 스크랩 대상도 워커 별로 구분 (instance 라벨)
+_lock = threading.Lock()
+_registry = {}
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name, self.help, self.labels = name, help, tuple(labels)
+        self._values = {}
+
+    def inc(self, *label_values, amount=1):
+        with _lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        for label_values, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {value}"
+
+
+class Histogram:
+    type = "histogram"
+
+    def __init__(self, name, help, buckets, labels=()):
+        self.name, self.help, self.labels = name, help, tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}   # 라벨 값: [버킷별 개수..., +Inf 개수, 합계]
+
+    def observe(self, *label_values, value):
+        index = bisect_left(self.buckets, value)
+        with _lock:
+            counts = self._values.get(label_values)
+            if counts is None:
+                counts = self._values[label_values] = [0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    def samples(self):
+        for label_values, counts in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                labels = _format_labels(self.labels, label_values, [("le", bound)])
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labels, label_values)
+            yield f"{self.name}_sum{labels} {counts[-1]}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+def register(metric):
+    """
+    이름이 같은 지표가 이미 있으면 기존 지표 반환 (모듈 재로딩/중복 등록 대비)
+    ex) REQUESTS = register(Counter("http_requests_total", "요청 수", ["view", "method", "status"]))
+    """
+    with _lock:
+        return _registry.setdefault(metric.name, metric)
+
+
+def render(extra_lines=()):
+    """
+    등록된 지표를 Prometheus 텍스트 형식으로 출력
+    extra_lines: 요청 시점에 계산하는 지표 (DB 커넥션 풀 현황 등)
+    """
+    lines = []
+    with _lock:
+        for metric in _registry.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+    lines.extend(extra_lines)
+    return "\n".join(lines) + "\n"
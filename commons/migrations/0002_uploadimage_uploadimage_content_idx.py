@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-19 06:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('commons', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='uploadimage',
+            index=models.Index(fields=['content_type', 'content_id', 'is_used'], name='uploadimage_content_idx'),
+        ),
+    ]
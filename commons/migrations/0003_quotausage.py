@@ -0,0 +1,27 @@
+# Generated by Django 4.2 on 2026-10-19 06:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('commons', '0002_uploadimage_uploadimage_content_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuotaUsage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=50)),
+                ('ident', models.CharField(max_length=100)),
+                ('date', models.DateField()),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='quotausage',
+            constraint=models.UniqueConstraint(fields=('scope', 'ident', 'date'), name='unique_quotausage_scope_ident_date'),
+        ),
+    ]
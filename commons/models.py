@@ -18,3 +18,27 @@ class UploadImage(models.Model):
     src = models.URLField(unique=True)
     is_used = models.BooleanField(default=False)
     create_dt = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # 게시글/프로필 별 사용 중인 이미지 조회
+            models.Index(fields=["content_type", "content_id", "is_used"], name="uploadimage_content_idx"),
+        ]
+
+
+class QuotaUsage(models.Model):
+    """
+    기간별 사용량 (commons.quota 의 캐시 장애 시 fallback 저장소)
+    """
+    scope = models.CharField(max_length=50)
+    ident = models.CharField(max_length=100)
+    date = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["scope", "ident", "date"], name="unique_quotausage_scope_ident_date"),
+        ]
+
+    def __str__(self):
+        return f"{self.scope} - {self.ident} - {self.date} - {self.count}"
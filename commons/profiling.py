@@ -0,0 +1,189 @@
+import json
+import logging
+import random
+import re
+import time
+from collections import Counter as ShapeCounter
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from rest_framework import serializers
+
+from .metrics import Counter, Histogram, register
+
+
+logger = logging.getLogger("commons.profiling")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# 모든 요청
+REQUESTS = register(Counter(
+    "http_requests_total", "요청 수", ["view", "method", "status"],
+))
+REQUEST_DURATION = register(Histogram(
+    "http_request_duration_seconds", "요청 처리 시간", LATENCY_BUCKETS, ["view"],
+))
+# 샘플링된 요청 (PROFILING_SAMPLE_RATE)
+PROFILED_REQUESTS = register(Counter(
+    "http_profiled_requests_total", "쿼리/직렬화 시간을 측정한 요청 수", ["view"],
+))
+DB_QUERIES = register(Histogram(
+    "http_request_db_queries", "요청 당 쿼리 수", QUERY_COUNT_BUCKETS, ["view"],
+))
+DB_DURATION = register(Histogram(
+    "http_request_db_duration_seconds", "요청 당 쿼리 실행 시간 합계", LATENCY_BUCKETS, ["view"],
+))
+SERIALIZER_DURATION = register(Histogram(
+    "http_request_serializer_duration_seconds", "요청 당 DRF serializer.data 시간 합계 (지연 평가 쿼리 포함)",
+    LATENCY_BUCKETS, ["view"],
+))
+RESPONSE_SIZE = register(Histogram(
+    "http_response_size_bytes", "응답 크기", SIZE_BUCKETS, ["view"],
+))
+N_PLUS_ONE = register(Counter(
+    "http_n_plus_one_total", "같은 형태의 쿼리가 PROFILING_N_PLUS_ONE_THRESHOLD 번 이상 반복된 요청 수", ["view"],
+))
+
+# 샘플링된 요청의 측정값 (요청 밖이거나 샘플링되지 않은 요청에서는 None)
+_profile = ContextVar("request_profile", default=None)
+
+_IN_LIST = re.compile(r"\((?:%s, )+%s\)")
+_NUMBER = re.compile(r"\b\d+\b")
+
+
+def sql_shape(sql):
+    """
+    값만 다른 쿼리를 같은 형태로 묶기 위한 정규화 (IN 목록 길이, LIMIT/OFFSET 숫자 등 제거)
+    """
+    return _NUMBER.sub("?", _IN_LIST.sub("(...)", sql))
+
+
+class RequestProfile:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+        self.shapes = ShapeCounter()
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper 로 등록되어 모든 쿼리 실행을 감쌈
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+            self.shapes[sql_shape(sql)] += 1
+
+    def repeated_queries(self):
+        threshold = settings.PROFILING_N_PLUS_ONE_THRESHOLD
+        return [
+            {"sql": shape, "count": count}
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+_serializer_data = serializers.BaseSerializer.data
+
+
+@property
+def _profiled_serializer_data(self):
+    profile = _profile.get()
+    if profile is None:
+        return _serializer_data.fget(self)
+    # 중첩된 serializer(SerializerMethodField 안에서 .data 호출 등)는 바깥 serializer 시간에 포함
+    profile.serializer_depth += 1
+    start = time.perf_counter()
+    try:
+        return _serializer_data.fget(self)
+    finally:
+        profile.serializer_depth -= 1
+        if profile.serializer_depth == 0:
+            profile.serializer_time += time.perf_counter() - start
+
+
+def install():
+    """
+    DRF serializer.data 시간 측정 (CommonsConfig.ready 에서 PROFILING_ENABLED 일 때 호출)
+    Serializer/ListSerializer.data 는 모두 BaseSerializer.data 를 거침
+    """
+    serializers.BaseSerializer.data = _profiled_serializer_data
+
+
+def view_label(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched"
+    return match.view_name or match._func_path
+
+
+class ProfilingMiddleware:
+    """
+    요청별 처리 시간/상태 코드는 모든 요청에서, 쿼리 수/쿼리 시간/직렬화 시간/응답 크기는 PROFILING_SAMPLE_RATE 비율로 측정
+    - 지표: commons.metrics (GET /commons/metrics/, Prometheus 형식)
+    - 샘플링된 요청은 'commons.profiling' 로거에 JSON 한 줄로 기록
+    - 같은 형태의 쿼리가 PROFILING_N_PLUS_ONE_THRESHOLD 번 이상 반복되면 N+1 의심으로 경고 로그 + 카운터 증가
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.PROFILING_ENABLED:
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        if random.random() >= settings.PROFILING_SAMPLE_RATE:
+            response = self.get_response(request)
+            self.record(request, response, time.perf_counter() - start)
+            return response
+
+        profile = RequestProfile()
+        token = _profile.set(profile)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(profile))
+                response = self.get_response(request)
+        finally:
+            _profile.reset(token)
+        self.record(request, response, time.perf_counter() - start, profile)
+        return response
+
+    def record(self, request, response, duration, profile=None):
+        view = view_label(request)
+        REQUESTS.inc(view, request.method, response.status_code)
+        REQUEST_DURATION.observe(view, value=duration)
+        if profile is None:
+            return
+
+        size = None if response.streaming else len(response.content)
+        repeated = profile.repeated_queries()
+        PROFILED_REQUESTS.inc(view)
+        DB_QUERIES.observe(view, value=profile.queries)
+        DB_DURATION.observe(view, value=profile.db_time)
+        SERIALIZER_DURATION.observe(view, value=profile.serializer_time)
+        if size is not None:
+            RESPONSE_SIZE.observe(view, value=size)
+        if repeated:
+            N_PLUS_ONE.inc(view)
+
+        record = {
+            "view": view,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "duration_ms": round(duration * 1000, 2),
+            "queries": profile.queries,
+            "db_ms": round(profile.db_time * 1000, 2),
+            "serializer_ms": round(profile.serializer_time * 1000, 2),
+            "response_bytes": size,
+            "repeated_queries": repeated,
+        }
+        logger.log(logging.WARNING if repeated else logging.INFO, json.dumps(record, ensure_ascii=False))
@@ -0,0 +1,96 @@
+import logging
+from datetime import datetime, time, timedelta
+
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from redis.exceptions import RedisError
+from rest_framework.throttling import BaseThrottle
+
+from .models import QuotaUsage
+
+
+logger = logging.getLogger(__name__)
+
+QUOTA_KEY = "quota:{scope}:{ident}:{date}"
+
+
+def seconds_until_reset():
+    """
+    일일 사용량이 초기화되는 시점(다음 날 00:00, TIME_ZONE 기준)까지 남은 시간 (초)
+    """
+    now = timezone.localtime()
+    tomorrow = datetime.combine(now.date() + timedelta(days=1), time.min, tzinfo=now.tzinfo)
+    # 같은 tzinfo 끼리의 뺄셈은 서머타임 변경을 반영하지 않으므로 timestamp 로 계산
+    return max(int(tomorrow.timestamp() - now.timestamp()), 1)
+
+
+def _consume_cache(key, amount):
+    cache = caches["default"]
+    ttl = seconds_until_reset() + 60  # 하루치 + 여유시간 뒤 만료
+    # 첫 사용 시 만료 시간과 함께 0 으로 생성 (Redis: SET NX EX) 후 증가 (INCRBY 는 만료 시간을 유지)
+    cache.add(key, 0, ttl)
+    try:
+        return cache.incr(key, amount)
+    except ValueError:
+        # add 와 incr 사이에 만료/축출된 경우
+        if cache.add(key, amount, ttl):
+            return amount
+        return cache.incr(key, amount)
+
+
+def _consume_db(scope, ident, date, limit, amount):
+    # 조건부 UPDATE 한 번으로 한도 확인 + 증가 (동시 요청에도 초과하지 않음)
+    lookup = {"scope": scope, "ident": ident, "date": date}
+    if QuotaUsage.objects.filter(**lookup, count__lte=limit - amount).update(count=F("count") + amount):
+        return True
+    if amount > limit:
+        return False
+    try:
+        with transaction.atomic():
+            QuotaUsage.objects.create(**lookup, count=amount)
+        return True
+    except IntegrityError:
+        # 이미 행이 있으면 (한도 초과 또는 동시 생성) 조건부 UPDATE 재시도
+        return bool(QuotaUsage.objects.filter(**lookup, count__lte=limit - amount).update(count=F("count") + amount))
+
+
+def consume_quota(scope, ident, limit, amount=1):
+    """
+    scope(기능) + ident(유저 id, IP 등) 단위의 일일 사용량을 원자적으로 증가시키고 한도 내인지 반환
+    - 캐시(Redis)의 INCR 로 처리하고, 캐시 장애 시에만 DB(QuotaUsage)로 처리
+    ex) if not consume_quota("chatbot", user.pk, 10): 한도 초과
+    """
+    date = timezone.localdate()
+    try:
+        count = _consume_cache(QUOTA_KEY.format(scope=scope, ident=ident, date=date.isoformat()), amount)
+        return count <= limit
+    except RedisError:
+        logger.warning("quota cache unavailable, falling back to database (scope=%s)", scope)
+        return _consume_db(scope, str(ident), date, limit, amount)
+
+
+class DailyQuotaThrottle(BaseThrottle):
+    """
+    consume_quota 기반 DRF throttle
+    사용: class XXXThrottle(DailyQuotaThrottle): scope = "xxx"; limit = 100
+    로그인 유저는 user id, 비로그인은 IP 기준
+    요청 1건이 여러 건으로 계산되어야 하면 (일괄 요청 등) get_amount 를 오버라이드
+    """
+    scope = None
+    limit = None
+
+    def get_ident(self, request):
+        if request.user and request.user.is_authenticated:
+            return f"user:{request.user.pk}"
+        return f"ip:{super().get_ident(request)}"
+
+    def get_amount(self, request, view):
+        return 1
+
+    def allow_request(self, request, view):
+        return consume_quota(self.scope, self.get_ident(request), self.limit, self.get_amount(request, view))
+
+    def wait(self):
+        return seconds_until_reset()
@@ -0,0 +1,90 @@
+import os
+import re
+import threading
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+
+from spartagames.config import AWS_AUTH, AWS_S3_BUCKET_NAME, AWS_S3_REGION_NAME
+
+
+# 프로세스 별 S3 클라이언트
+# boto3 클라이언트는 스레드 간 공유해도 안전하지만, 생성 시 서비스 모델 파싱 비용이 크고 커넥션 풀도 클라이언트마다 따로 생김
+# → 처음 사용할 때 한 번만 만들고 재사용 (fork 된 자식 프로세스(Celery prefork 등)에서는 새로 생성)
+_lock = threading.Lock()
+_clients = {}
+
+
+def _build_s3_client():
+    session = boto3.session.Session(
+        aws_access_key_id=AWS_AUTH["aws_access_key_id"],
+        aws_secret_access_key=AWS_AUTH["aws_secret_access_key"],
+        region_name=AWS_S3_REGION_NAME,
+    )
+    return session.client(
+        's3',
+        config=Config(
+            max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True,
+            connect_timeout=settings.S3_CONNECT_TIMEOUT,
+            read_timeout=settings.S3_READ_TIMEOUT,
+            retries={'max_attempts': 3, 'mode': 'standard'},
+        ),
+    )
+
+
+def get_s3_client():
+    """
+    프로세스 공용 S3 클라이언트
+    ex) s3 = get_s3_client(); s3.generate_presigned_url(...)
+    """
+    pid = os.getpid()
+    client = _clients.get(pid)
+    if client is None:
+        with _lock:
+            client = _clients.get(pid)
+            if client is None:
+                _clients.clear()  # 부모 프로세스에서 만든 클라이언트(커넥션)는 사용하지 않음
+                client = _clients[pid] = _build_s3_client()
+    return client
+
+
+RANGE_RE = re.compile(r'^bytes=(\d+-\d*|-\d+)$')
+
+
+def _iter_body(body, chunk_size):
+    try:
+        yield from body.iter_chunks(chunk_size=chunk_size)
+    finally:
+        body.close()
+
+
+def stream_s3_object(key, filename, content_type, range_header=None):
+    """
+    S3 오브젝트를 메모리에 올리지 않고 S3_STREAM_CHUNK_SIZE 단위로 스트리밍하는 응답
+    단일 Range 요청(bytes=시작-끝)은 S3 에 그대로 전달하여 206 으로 응답 (이어받기 지원)
+    """
+    params = {'Bucket': AWS_S3_BUCKET_NAME, 'Key': key}
+    if range_header and RANGE_RE.match(range_header.strip()):
+        params['Range'] = range_header.strip()
+
+    try:
+        obj = get_s3_client().get_object(**params)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') == 'InvalidRange':
+            return HttpResponse(status=416)
+        raise
+
+    response = StreamingHttpResponse(
+        _iter_body(obj['Body'], settings.S3_STREAM_CHUNK_SIZE), content_type=content_type
+    )
+    response['Content-Length'] = obj['ContentLength']
+    response['Accept-Ranges'] = 'bytes'
+    if obj.get('ContentRange'):
+        response.status_code = 206
+        response['Content-Range'] = obj['ContentRange']
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
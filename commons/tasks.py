@@ -0,0 +1,89 @@
+from celery import shared_task
+from celery.exceptions import Retry
+
+from .content import refresh_content_text
+from .counters import reconcile_all
+from .images import delete_objects, tag_objects
+from .storage import get_s3_client
+from .upload_gc import collect_orphan_uploads as run_upload_gc
+
+
+@shared_task
+def reconcile_counters():
+    """
+    매일 새벽에 실행
+    F()로 갱신하는 비정규화 카운터(즐겨찾기/리뷰/리뷰 반응/댓글 수)가 실제 값과 어긋난 경우 보정
+    (회원 hard delete 등 cascade 삭제로 생기는 차이 포함)
+    """
+    try:
+        result = reconcile_all()
+        fixed = {key: cnt for key, cnt in result.items() if cnt}
+        return f"Reconciled counters: {fixed if fixed else 'no drift'}"
+    except Exception as e:
+        return f"Error in reconciling counters: {str(e)}"
+
+
+@shared_task
+def update_content_text(model_label, pk):
+    """
+    본문이 긴 게시글/프로필 저장 시 커밋 이후 실행
+    content 에서 검색용 텍스트(content_text)를 추출하여 저장
+    """
+    try:
+        if refresh_content_text(model_label, pk):
+            return f"Updated content_text of {model_label}({pk})"
+        return f"{model_label}({pk}) does not exist"
+    except Exception as e:
+        return f"Error in updating content_text of {model_label}({pk}): {str(e)}"
+
+
+@shared_task(bind=True, max_retries=5)
+def tag_s3_objects(self, keys, value="true"):
+    """
+    에디터 이미지 등록 시 커밋 이후 실행
+    S3 오브젝트 태깅(is_used)을 스레드 풀로 병렬 처리하고, 실패한 키만 지수 백오프로 재시도
+    """
+    try:
+        failed = tag_objects(get_s3_client(), keys, value)
+        if failed:
+            if self.request.retries >= self.max_retries:
+                return f"Error in tagging S3 objects: {len(failed)}/{len(keys)} failed"
+            raise self.retry(args=(failed, value), countdown=2 ** self.request.retries * 5)
+        return f"Tagged {len(keys)} S3 objects (is_used={value})"
+    except Retry:
+        raise
+    except Exception as e:
+        return f"Error in tagging S3 objects: {str(e)}"
+
+
+@shared_task(bind=True, max_retries=5)
+def delete_s3_objects(self, keys):
+    """
+    게시글/프로필 수정·삭제로 사용하지 않게 된 이미지의 S3 오브젝트 삭제 (실패 시 지수 백오프로 재시도)
+    """
+    try:
+        failed = delete_objects(get_s3_client(), keys)
+        if failed:
+            if self.request.retries >= self.max_retries:
+                return f"Error in deleting S3 objects: {len(failed)}/{len(keys)} failed"
+            raise self.retry(args=(failed,), countdown=2 ** self.request.retries * 5)
+        return f"Deleted {len(keys)} S3 objects"
+    except Retry:
+        raise
+    except Exception as e:
+        return f"Error in deleting S3 objects: {str(e)}"
+
+
+@shared_task
+def collect_orphan_uploads():
+    """
+    매시간 실행
+    업로드 후 본문에 쓰이지 않은 에디터 이미지와 정리되지 않은 UploadImage 를 조금씩(이어서) 정리
+    """
+    try:
+        result = run_upload_gc()
+        if result is None:
+            return "Upload GC is already running"
+        return f"Collected orphan uploads: {result}"
+    except Exception as e:
+        return f"Error in collecting orphan uploads: {str(e)}"
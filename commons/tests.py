@@ -1,3 +1,547 @@
-from django.test import TestCase
+import io
+import json
+import re
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
 
-# Create your tests here.
+from botocore.response import StreamingBody
+from bs4 import BeautifulSoup
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.http import HttpResponse
+from django.utils import timezone
+from redis.exceptions import RedisError
+from rest_framework.test import APIClient
+
+from games.models import Game, Like, Review, ReviewsLike
+from spartagames.config import AWS_S3_CUSTOM_DOMAIN
+from qnas.serializers import CategorySerializer
+from teambuildings.models import TeamBuildPost, TeamBuildPostComment
+from . import content as content_module
+from .counters import reconcile_all, reconcile_counter
+from .content import clear_parse_cache, extract_content_text, normalize_text, parse_content
+from .db.pool import ConnectionPool, PoolTimeout
+from .db.routers import ReplicaRouter, ReplicaRoutingMiddleware, pin_if_recent_writer
+from .models import QuotaUsage, UploadImage
+from .quota import consume_quota, seconds_until_reset
+from .profiling import ProfilingMiddleware, sql_shape
+from .storage import stream_s3_object
+from .tasks import reconcile_counters
+from .upload_gc import collect_orphan_uploads
+from .views import PresignedUrlThrottle
+
+
+class ExtractContentTextTest(SimpleTestCase):
+    """
+    검색용 텍스트는 기존 BeautifulSoup(html.parser).get_text() 결과와 같아야 함
+    """
+    CASES = [
+        "",
+        "text only",
+        "<p>문단&nbsp;하나</p>\n<p>문단\r\n둘</p>",
+        "<p>x<!-- comment -->y</p><img src='https://example.com/a.png'>",
+        "<script>var a = 1;</script><style>p {}</style><template><p>t</p></template>본문",
+        "<ruby>漢<rp>(</rp><rt>한</rt><rp>)</rp></ruby>",
+        "<p>&amp; &lt; &#39; &#x41; &#65x; &unknown; &lt</p>",
+        "<p>&#128; &#150; &#0; &#x110000; &#xD800; &nbsp &copy;</p>",
+        "<![CDATA[cdata]]><!DOCTYPE html><?pi x?>tail",
+        "<b>unclosed <i>nested</b> after</i> end</p>",
+        "<p>1 < 2 & 3</p>",
+    ]
+
+    def test_same_as_beautifulsoup(self):
+        for content in self.CASES:
+            with self.subTest(content=content):
+                expected = normalize_text(BeautifulSoup(content, "html.parser").get_text())
+                self.assertEqual(extract_content_text(content), expected)
+
+    def test_numeric_character_reference(self):
+        self.assertEqual(extract_content_text("<p>it&#39;s</p>"), "it's")
+        self.assertEqual(extract_content_text("<p>it&#x27;s</p>"), "it's")
+        self.assertEqual(extract_content_text("<p>a&#160;b &#X41;</p>"), "a b A")
+
+    def test_parse_cache(self):
+        # 최근 결과는 재사용하되, 본문 문자열은 캐시에 남기지 않음
+        clear_parse_cache()
+        content = "<p>본문</p>" * 1000
+        parsed = parse_content(content)
+        self.assertIs(parse_content("".join(["<p>본문</p>"] * 1000)), parsed)
+        self.assertFalse([part for key in content_module._parse_cache for part in key if isinstance(part, str)])
+        for i in range(content_module.PARSE_CACHE_SIZE):
+            parse_content(f"<p>{i}</p>")
+        self.assertIsNot(parse_content(content), parsed)
+
+    def test_srcs_and_stats(self):
+        content = (
+            "<p>본문 &amp; <img src='https://example.com/a.png'><img alt='x'></p>"
+            "<p><img src=\"b.png\"/></p>"
+        )
+        parsed = parse_content(content)
+        soup = BeautifulSoup(content, "html.parser")
+        self.assertEqual(list(parsed.srcs), [img.get("src") for img in soup.find_all("img") if img.get("src")])
+        self.assertEqual(parsed.text_length, len(re.sub(r"<[^>]+>", "", content)))
+        self.assertEqual(parsed.tag_length, sum(len(tag) for tag in re.findall(r"<[^>]+>", content)))
+
+
+class ReconcileCounterTest(TestCase):
+    def setUp(self):
+        users = [
+            get_user_model().objects.create_user(
+                email=f"member{i}@example.com", password="password1234!", nickname=f"member{i}",
+                login_type="DEFAULT", introduce="",
+            )
+            for i in range(3)
+        ]
+        self.games = [
+            Game.objects.create(
+                title=f"game {i}", thumbnail="images/thumbnail/game.png", maker=users[0],
+                content="<p>game</p>", gamefile="zips/game.zip", star=0, review_cnt=0,
+            )
+            for i in range(3)
+        ]
+        for user in users:
+            Like.objects.create(user=user, game=self.games[0])
+        Like.objects.create(user=users[0], game=self.games[2])
+        self.review = Review.objects.create(game=self.games[0], author=users[1], content="review", star=5)
+        Review.objects.create(game=self.games[0], author=users[2], content="hidden", star=1, is_visible=False)
+        ReviewsLike.objects.create(user=users[0], review=self.review, is_like=1)
+        ReviewsLike.objects.create(user=users[2], review=self.review, is_like=2)
+        self.post = TeamBuildPost.objects.create(
+            author=users[0], title="post", thumbnail="images/thumbnail/teambuildings/teambuilding_default.png",
+            purpose="PORTFOLIO", duration="3M", meeting_type="ONLINE", deadline=timezone.now().date(),
+            contact="contact@example.com", content="<p>post</p>",
+        )
+        TeamBuildPostComment.objects.create(post=self.post, author=users[1], content="comment")
+        TeamBuildPostComment.objects.create(post=self.post, author=users[2], content="hidden", is_visible=False)
+        reconcile_all()
+
+    def test_reconcile_counter(self):
+        # 어긋난 행만 보정 (pk 구간을 나누어도 결과 동일)
+        Game.objects.filter(pk=self.games[0].pk).update(like_cnt=10)
+        Game.objects.filter(pk=self.games[1].pk).update(like_cnt=-1)
+        self.assertEqual(reconcile_counter(Game, "like_cnt", "likes", batch_size=1), 2)
+        self.assertEqual(
+            list(Game.objects.order_by("pk").values_list("like_cnt", flat=True)), [3, 0, 1]
+        )
+        self.assertEqual(reconcile_counter(Game, "like_cnt", "likes", batch_size=1), 0)
+
+    def test_reconcile_counters_task(self):
+        Game.objects.filter(pk=self.games[0].pk).update(review_cnt=5)
+        Review.objects.filter(pk=self.review.pk).update(like_cnt=0, dislike_cnt=3)
+        TeamBuildPost.objects.filter(pk=self.post.pk).update(comment_cnt=0)
+
+        self.assertIn("games.Game.review_cnt': 1", reconcile_counters())
+        self.assertEqual(Game.objects.get(pk=self.games[0].pk).review_cnt, 1)
+        self.assertEqual(
+            tuple(Review.objects.values_list("like_cnt", "dislike_cnt").get(pk=self.review.pk)), (1, 1)
+        )
+        self.assertEqual(TeamBuildPost.objects.get(pk=self.post.pk).comment_cnt, 1)
+        self.assertEqual(reconcile_counters(), "Reconciled counters: no drift")
+
+    def test_reconcile_star(self):
+        # 평점은 보이는 리뷰의 평균으로 보정 (리뷰가 없으면 0), 반올림 오차 수준의 차이는 그대로 둠
+        self.assertEqual(list(Game.objects.order_by("pk").values_list("star", flat=True)), [5.0, 0.0, 0.0])
+        Game.objects.filter(pk=self.games[0].pk).update(star=5.0 + 1e-9)
+        Game.objects.filter(pk=self.games[1].pk).update(star=3.0)
+        self.assertEqual(reconcile_all()["games.Game.star"], 1)
+        self.assertEqual(Game.objects.get(pk=self.games[1].pk).star, 0.0)
+
+
+class FakeRedis:
+    """
+    consume_quota 의 Redis 경로 테스트용 (RedisCache 가 add/incr 에 쓰는 SET NX EX / EXISTS / INCRBY 만 구현)
+    """
+
+    def __init__(self):
+        self.values, self.ttls = {}, {}
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key], self.ttls[key] = value, ex
+        return True
+
+    def exists(self, key):
+        return int(key in self.values)
+
+    def incr(self, key, amount=1):
+        self.values[key] += amount
+        return self.values[key]
+
+
+class ConsumeQuotaTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_limit(self):
+        self.assertEqual([consume_quota("test", 1, 3) for _ in range(4)], [True, True, True, False])
+        # 다른 유저/기능은 따로 집계
+        self.assertTrue(consume_quota("test", 2, 3))
+        self.assertTrue(consume_quota("other", 1, 3))
+        self.assertFalse(consume_quota("test", 3, 3, amount=4))
+
+    def test_redis(self):
+        redis = FakeRedis()
+        with override_settings(CACHES={"default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://localhost:6379",
+        }}), mock.patch("django.core.cache.backends.redis.RedisCacheClient.get_client", return_value=redis):
+            self.assertEqual([consume_quota("test", 1, 2) for _ in range(3)], [True, True, False])
+        # 키 생성 시에만 만료 시간 설정 (SET NX EX), 이후에는 INCRBY 로 증가
+        [(key, count)] = redis.values.items()
+        self.assertTrue(key.endswith(f"quota:test:1:{timezone.localdate().isoformat()}"))
+        self.assertEqual(count, 3)
+        self.assertAlmostEqual(redis.ttls[key], seconds_until_reset() + 60, delta=5)
+
+    def test_database_fallback(self):
+        # 캐시 장애 시 DB 의 조건부 UPDATE 로 한도 확인
+        with mock.patch("commons.quota._consume_cache", side_effect=RedisError("down")), \
+                self.assertLogs("commons.quota", "WARNING"):
+            self.assertEqual([consume_quota("test", 1, 2) for _ in range(3)], [True, True, False])
+            self.assertFalse(consume_quota("test", 2, 2, amount=3))
+            self.assertTrue(consume_quota("test", 2, 2, amount=2))
+        self.assertEqual(
+            dict(QuotaUsage.objects.values_list("ident", "count")), {"1": 2, "2": 2}
+        )
+
+    @override_settings(TIME_ZONE="Asia/Seoul")
+    def test_reset_at_local_midnight(self):
+        # 2026-10-19 15:30 UTC = 2026-10-20 00:30 KST
+        now = timezone.make_aware(datetime(2026, 10, 19, 15, 30), dt_timezone.utc)
+        with mock.patch("django.utils.timezone.now", return_value=now):
+            self.assertEqual(seconds_until_reset(), 23 * 60 * 60 + 30 * 60)
+            consume_quota("test", 1, 1)
+            self.assertFalse(consume_quota("test", 1, 1))
+        self.assertTrue(cache.get("quota:test:1:2026-10-20"))
+
+
+class FakeS3:
+    """
+    upload_gc 테스트용 S3 (list_objects_v2 / get_object_tagging / put_object_tagging / delete_objects)
+    """
+
+    def __init__(self, objects):
+        self.objects = dict(objects)  # key -> (size, last_modified, is_used)
+
+    def list_objects_v2(self, Bucket, Prefix, MaxKeys, StartAfter=""):
+        keys = sorted(key for key in self.objects if key.startswith(Prefix) and key > StartAfter)
+        page = keys[:MaxKeys]
+        return {
+            "Contents": [{"Key": key, "Size": self.objects[key][0], "LastModified": self.objects[key][1]} for key in page],
+            "IsTruncated": len(keys) > MaxKeys,
+        }
+
+    def get_object_tagging(self, Bucket, Key):
+        return {"TagSet": [{"Key": "is_used", "Value": self.objects[Key][2]}]}
+
+    def put_object_tagging(self, Bucket, Key, Tagging):
+        size, modified, _ = self.objects[Key]
+        self.objects[Key] = (size, modified, Tagging["TagSet"][0]["Value"])
+
+    def delete_objects(self, Bucket, Delete):
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"], None)
+        return {}
+
+
+class UploadGCTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_collect_in_pages_and_resume(self):
+        old = timezone.now() - timedelta(days=2)
+        objects = {f"images/screenshot/{i:04d}.png": (100, old, "false") for i in range(2500)}
+        objects["images/screenshot/used.png"] = (100, old, "true")
+        objects["images/screenshot/new.png"] = (100, timezone.now(), "false")
+        s3 = FakeS3(objects)
+
+        with self.settings(UPLOAD_GC_PREFIXES=["images/"], UPLOAD_GC_MAX_PAGES=2):
+            first = collect_orphan_uploads(s3)
+            second = collect_orphan_uploads(s3)
+
+        # 1회 실행 당 2페이지(2000개)까지만 스캔하고, 다음 실행에서 이어서 진행
+        self.assertEqual(first["scanned"], 2000)
+        self.assertEqual(first["deleted"], 2000)
+        self.assertEqual(first["reclaimed_bytes"], 200000)
+        self.assertEqual(second["deleted"], 500)
+        self.assertEqual(set(s3.objects), {"images/screenshot/used.png", "images/screenshot/new.png"})
+
+    def test_reconcile_rows_of_removed_content(self):
+        user = get_user_model().objects.create_user(
+            email="author@example.com", password="password1234!",
+            nickname="author", login_type="DEFAULT", introduce="",
+        )
+        domain = f"https://{AWS_S3_CUSTOM_DOMAIN}"
+        post = TeamBuildPost.objects.create(
+            author=user, title="post", thumbnail="images/thumbnail/teambuildings/teambuilding_default.png",
+            purpose="PORTFOLIO", duration="3M", meeting_type="ONLINE", deadline=timezone.now().date(),
+            contact="contact@example.com", content=f"<img src='{domain}/images/screenshot/kept.png'>",
+        )
+        content_type = ContentType.objects.get_for_model(post)
+        for name in ("kept", "removed"):
+            UploadImage.objects.create(
+                content_type=content_type, content_id=post.pk, uploader=user,
+                src=f"{domain}/images/screenshot/{name}.png", is_used=True,
+            )
+        old = timezone.now() - timedelta(days=2)
+        s3 = FakeS3({
+            "images/screenshot/kept.png": (10, old, "true"),
+            "images/screenshot/removed.png": (10, old, "true"),
+        })
+
+        with self.settings(UPLOAD_GC_PREFIXES=["images/"]):
+            result = collect_orphan_uploads(s3)
+
+        # 본문에서 빠진 이미지는 행 삭제 + is_used=false 태깅 후 같은 실행의 스캔에서 삭제
+        self.assertEqual(result["rows_reconciled"], 1)
+        self.assertEqual(result["deleted"], 1)
+        self.assertEqual(set(s3.objects), {"images/screenshot/kept.png"})
+        self.assertEqual(list(UploadImage.objects.values_list("src", flat=True)), [f"{domain}/images/screenshot/kept.png"])
+
+
+class StreamS3ObjectTest(SimpleTestCase):
+
+    def fake_s3(self, data):
+        class S3:
+            def get_object(self, Bucket, Key, Range=None):
+                if Range is None:
+                    return {"Body": StreamingBody(io.BytesIO(data), len(data)), "ContentLength": len(data)}
+                start, end = Range[len("bytes="):].split("-")
+                start, end = int(start), int(end or len(data) - 1)
+                return {
+                    "Body": StreamingBody(io.BytesIO(data[start:end + 1]), end + 1 - start),
+                    "ContentLength": end + 1 - start,
+                    "ContentRange": f"bytes {start}-{end}/{len(data)}",
+                }
+        return S3()
+
+    def test_stream_in_chunks(self):
+        data = bytes(range(256)) * 40
+        with mock.patch("commons.storage.get_s3_client", return_value=self.fake_s3(data)), \
+                self.settings(S3_STREAM_CHUNK_SIZE=1024):
+            response = stream_s3_object("media/game.zip", "game.zip", "application/zip")
+            chunks = list(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(chunks), 10)
+        self.assertEqual(b"".join(chunks), data)
+        self.assertEqual(response["Content-Length"], str(len(data)))
+
+    def test_range(self):
+        data = bytes(range(256)) * 40
+        with mock.patch("commons.storage.get_s3_client", return_value=self.fake_s3(data)):
+            response = stream_s3_object("media/game.zip", "game.zip", "application/zip", range_header="bytes=100-")
+            body = b"".join(response.streaming_content)
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], f"bytes 100-{len(data) - 1}/{len(data)}")
+        self.assertEqual(body, data[100:])
+
+
+class PresignedUrlBatchTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            email="uploader@example.com", password="password1234!",
+            nickname="uploader", login_type="DEFAULT", introduce="",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("commons:presigned_url_for_upload_batch")
+
+    def test_batch_put_and_post(self):
+        response = self.client.post(
+            self.url, {"base_path": "images/screenshot/teambuildings", "extensions": ["png"] * 10}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        urls = response.data["data"]
+        self.assertEqual(len(urls), 10)
+        self.assertEqual(len({x["url"] for x in urls}), 10)
+        self.assertIn("x-amz-tagging", urls[0]["upload_url"].lower())  # 서명 헤더에 태그 포함
+
+        response = self.client.post(
+            self.url, {"base_path": "images/screenshot/teambuildings", "extensions": ["gif"], "method": "post"}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        form = response.data["data"][0]["upload_form"]
+        self.assertIn("policy", form["fields"])
+        self.assertEqual(form["fields"]["Content-Type"], "image/gif")
+
+    def test_invalid_extension(self):
+        response = self.client.post(self.url, {"base_path": "images", "extensions": ["png", "exe"]}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_throttle_counts_each_url(self):
+        with mock.patch.object(PresignedUrlThrottle, "limit", 15):
+            first = self.client.post(self.url, {"base_path": "images", "extensions": ["png"] * 10}, format="json")
+            second = self.client.post(self.url, {"base_path": "images", "extensions": ["png"] * 10}, format="json")
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 429)
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    def create_pool(self, **kwargs):
+        def is_usable(conn):
+            try:
+                conn.execute("SELECT 1")
+            except sqlite3.Error:
+                return False
+            return True
+
+        def reset(conn):
+            conn.rollback()
+            return is_usable(conn)
+
+        options = {"max_size": 2, "timeout": 1, "health_check_idle": 60}
+        options.update(kwargs)
+        return ConnectionPool(lambda: sqlite3.connect(":memory:", check_same_thread=False), is_usable, reset, **options)
+
+    def test_reuse(self):
+        pool = self.create_pool()
+        conn = pool.acquire()
+        pool.release(conn)
+        self.assertIs(pool.acquire(), conn)
+        stats = pool.stats()
+        self.assertEqual((stats["created"], stats["acquired"], stats["in_use"], stats["idle"]), (1, 2, 1, 0))
+
+    def test_wait_and_timeout(self):
+        pool = self.create_pool(max_size=1, timeout=0.05)
+        conn = pool.acquire()
+        with self.assertRaises(PoolTimeout):
+            pool.acquire()
+
+        # 반납을 기다리던 스레드가 반납된 커넥션을 받음
+        pool.timeout = 5
+        leased = []
+        waiter = threading.Thread(target=lambda: leased.append(pool.acquire()))
+        waiter.start()
+        pool.release(conn)
+        waiter.join()
+        self.assertEqual(leased, [conn])
+        self.assertEqual((pool.stats()["timeouts"], pool.stats()["created"]), (1, 1))
+
+    def test_discard_broken_connections(self):
+        pool = self.create_pool(health_check_idle=0)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.close()
+        # 끊긴 커넥션은 확인 후 버리고 새로 연결
+        new_conn = pool.acquire()
+        self.assertIsNot(new_conn, conn)
+
+        new_conn.close()
+        pool.release(new_conn)
+        stats = pool.stats()
+        self.assertEqual((stats["size"], stats["discarded"], stats["health_checks"]), (0, 2, 1))
+
+
+@override_settings(REPLICA_DATABASES=["replica"], REPLICA_PRIMARY_PATHS=["/admin/"])
+class ReplicaRouterTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.router = ReplicaRouter()
+        self.user = mock.Mock(pk=1, is_authenticated=True)
+
+    def request(self, method, path="/games/api/list/", view=None):
+        """
+        view(): 미들웨어 안에서 실행, 반환값: 각 시점의 읽기 DB 목록
+        """
+        used = []
+
+        def get_response(request):
+            request.user = self.user
+            used.extend(view() if view else [self.router.db_for_read(Game)])
+            return "response"
+
+        request = getattr(RequestFactory(), method)(path)
+        self.assertEqual(ReplicaRoutingMiddleware(get_response)(request), "response")
+        return used
+
+    def test_route_reads(self):
+        self.assertEqual(self.router.db_for_read(Game), "default")  # 요청 밖
+        self.assertEqual(self.request("get"), ["replica"])
+        self.assertEqual(self.request("post"), ["default"])
+        self.assertEqual(self.request("get", path="/admin/games/"), ["default"])
+        self.assertEqual(self.router.db_for_write(Game), "default")
+
+    def test_read_your_writes(self):
+        def write_then_read():
+            before = self.router.db_for_read(Game)
+            self.router.db_for_write(Game)
+            return [before, self.router.db_for_read(Game)]
+
+        # 같은 요청 안에서 쓰기 이후 읽기는 primary
+        self.assertEqual(self.request("get", view=write_then_read), ["replica", "default"])
+
+        # 이후 REPLICA_STICKY_SECONDS 동안 해당 유저의 요청은 primary
+        def authenticate_then_read():
+            pin_if_recent_writer(self.user.pk)
+            return [self.router.db_for_read(Game)]
+        self.assertEqual(self.request("get", view=authenticate_then_read), ["default"])
+
+        self.user = mock.Mock(pk=2, is_authenticated=True)
+        self.assertEqual(self.request("get", view=authenticate_then_read), ["replica"])
+
+
+@override_settings(PROFILING_ENABLED=True, PROFILING_SAMPLE_RATE=1, PROFILING_N_PLUS_ONE_THRESHOLD=3, METRICS_TOKEN="token")
+class ProfilingMiddlewareTest(TestCase):
+    def test_sql_shape(self):
+        self.assertEqual(
+            sql_shape('SELECT "id" FROM "game" WHERE "id" IN (%s, %s, %s) LIMIT 21'),
+            'SELECT "id" FROM "game" WHERE "id" IN (...) LIMIT ?',
+        )
+
+    def test_profile_sampled_request(self):
+        def get_response(request):
+            for pk in range(3):
+                Game.objects.filter(pk=pk).exists()
+            serializer = CategorySerializer([("A", "Action")], many=True)
+            return HttpResponse(json.dumps(serializer.data))
+
+        with self.assertLogs("commons.profiling", "WARNING") as logs:
+            response = ProfilingMiddleware(get_response)(RequestFactory().get("/games/api/list/"))
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual((record["view"], record["status"], record["queries"]), ("unmatched", 200, 3))
+        self.assertEqual(record["response_bytes"], len(response.content))
+        self.assertGreater(record["serializer_ms"], 0)
+        self.assertEqual([query["count"] for query in record["repeated_queries"]], [3])
+
+        self.assertEqual(self.client.get(reverse("commons:prometheus_metrics")).status_code, 403)
+        metrics = self.client.get(reverse("commons:prometheus_metrics"), HTTP_AUTHORIZATION="Bearer token")
+        self.assertIn('http_n_plus_one_total{view="unmatched"}', metrics.content.decode())
+        self.assertIn('http_request_db_queries_bucket{view="unmatched",le="5"}', metrics.content.decode())
+
+
+class BenchmarkCommandTest(TestCase):
+    def test_seed_and_compare_with_baseline(self):
+        call_command(
+            "seed_benchmark_data", "--preset", "small", "--users", "20", "--games", "30", "--likes", "100",
+            "--reviews", "100", "--playtimes", "50", "--playlogs", "50", "--posts", "10", "--batch-size", "7",
+            stdout=io.StringIO(),
+        )
+        self.assertEqual(
+            (Game.objects.count(), Like.objects.count(), Review.objects.count(), ReviewsLike.objects.count()),
+            (30, 100, 100, 100),
+        )
+
+        options = ["--repeat", "2", "--warmup", "0", "--task-repeat", "1", "--only", "game_reviews", "task_assign_chips_to_top_games"]
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = Path(directory) / "baseline.json"
+            call_command("benchmark_endpoints", *options, "--output", str(baseline), stdout=io.StringIO())
+            report = json.loads(baseline.read_text())
+            self.assertEqual(set(report["results"]), {"game_reviews", "task_assign_chips_to_top_games"})
+            self.assertGreater(report["results"]["game_reviews"]["queries"], 0)
+
+            # 쿼리 수가 늘어난 항목은 회귀로 표시
+            report["results"]["game_reviews"]["queries"] -= 1
+            baseline.write_text(json.dumps(report))
+            output = io.StringIO()
+            call_command("benchmark_endpoints", *options, "--baseline", str(baseline), "--threshold", "100", stdout=output)
+            self.assertIn("회귀", output.getvalue())
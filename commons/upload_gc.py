@@ -0,0 +1,149 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.utils import timezone
+
+from spartagames.config import AWS_S3_BUCKET_NAME, AWS_S3_CUSTOM_DOMAIN
+from .images import delete_objects, s3_key, tag_objects
+from .models import UploadImage
+from .storage import get_s3_client
+
+
+GC_LOCK_KEY = "commons:upload_gc:lock"
+GC_LOCK_TIMEOUT = 60 * 30
+OBJECT_CURSOR_KEY = "commons:upload_gc:object_cursor:{prefix}"
+ROW_CURSOR_KEY = "commons:upload_gc:row_cursor"
+
+
+def _filename(src):
+    # presigned 업로드 키의 파일명은 '{시각}_{uuid}.{확장자}' 로 고유
+    return s3_key(src).rsplit('/', 1)[-1]
+
+
+def reconcile_upload_rows(s3, batch_size):
+    """
+    UploadImage 를 pk 순서로 batch_size 개씩 확인 (호출할 때마다 이어서 진행, 끝나면 처음부터)
+    게시글/프로필이 없거나(삭제/비공개) 본문에서 더 이상 쓰지 않는 이미지는 행을 삭제하고 S3 태그를 is_used=false 로 되돌림
+    → 이후 오브젝트 스캔에서 삭제 대상이 됨
+    반환값: 정리한 행 수
+    """
+    last_pk = cache.get(ROW_CURSOR_KEY, 0)
+    rows = list(
+        UploadImage.objects.filter(pk__gt=last_pk).order_by("pk")
+        .only("pk", "content_type_id", "content_id", "src")[:batch_size]
+    )
+    if not rows:
+        cache.set(ROW_CURSOR_KEY, 0, None)
+        return 0
+
+    ids_by_type = defaultdict(set)
+    for row in rows:
+        ids_by_type[row.content_type_id].add(row.content_id)
+
+    contents = {}
+    for content_type_id, ids in ids_by_type.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model is None:
+            continue
+        objects = model._default_manager.filter(pk__in=ids)
+        if any(field.name == "is_visible" for field in model._meta.concrete_fields):
+            objects = objects.filter(is_visible=True)
+        for pk, content in objects.values_list("pk", "content"):
+            contents[(content_type_id, pk)] = content or ""
+
+    stale = [
+        row for row in rows
+        if _filename(row.src) not in contents.get((row.content_type_id, row.content_id), "")
+    ]
+    if stale:
+        UploadImage.objects.filter(pk__in=[row.pk for row in stale]).delete()
+        tag_objects(s3, [s3_key(row.src) for row in stale], "false")
+
+    cache.set(ROW_CURSOR_KEY, rows[-1].pk, None)
+    return len(stale)
+
+
+def _is_unused_tag(s3, key):
+    try:
+        tags = s3.get_object_tagging(Bucket=AWS_S3_BUCKET_NAME, Key=key)["TagSet"]
+    except (BotoCoreError, ClientError):
+        return False
+    return any(tag["Key"] == "is_used" and tag["Value"] == "false" for tag in tags)
+
+
+def collect_orphan_objects(s3, prefix, max_pages, grace):
+    """
+    prefix 아래 오브젝트를 1000개 단위 페이지로 max_pages 만큼 스캔 (마지막 키를 캐시에 저장해 다음 실행에서 이어서 진행)
+    삭제 대상: grace 이전에 업로드 + UploadImage 에 등록되지 않음 + S3 태그 is_used=false (presigned 업로드 이미지만 해당)
+    반환값: (스캔 수, 삭제 수, 회수한 바이트, 실패 수)
+    """
+    cursor_key = OBJECT_CURSOR_KEY.format(prefix=prefix)
+    cursor = cache.get(cursor_key)
+    threshold = timezone.now() - grace
+    scanned = deleted = reclaimed = failed_cnt = 0
+
+    for _ in range(max_pages):
+        params = {"Bucket": AWS_S3_BUCKET_NAME, "Prefix": prefix, "MaxKeys": 1000}
+        if cursor:
+            params["StartAfter"] = cursor
+        response = s3.list_objects_v2(**params)
+        objects = response.get("Contents", [])
+        scanned += len(objects)
+
+        candidates = {obj["Key"]: obj["Size"] for obj in objects if obj["LastModified"] < threshold}
+        if candidates:
+            registered = set(
+                UploadImage.objects.filter(
+                    src__in=[f"https://{AWS_S3_CUSTOM_DOMAIN}/{key}" for key in candidates]
+                ).values_list("src", flat=True)
+            )
+            keys = [key for key in candidates if f"https://{AWS_S3_CUSTOM_DOMAIN}/{key}" not in registered]
+            with ThreadPoolExecutor(max_workers=settings.S3_TAGGING_MAX_WORKERS) as executor:
+                unused = list(executor.map(lambda key: _is_unused_tag(s3, key), keys))
+            keys = [key for key, is_unused in zip(keys, unused) if is_unused]
+            failed = set(delete_objects(s3, keys))
+            deleted += len(keys) - len(failed)
+            failed_cnt += len(failed)
+            reclaimed += sum(candidates[key] for key in keys if key not in failed)
+
+        if not response.get("IsTruncated"):
+            cursor = None
+            break
+        cursor = objects[-1]["Key"]
+        cache.set(cursor_key, cursor, None)
+
+    if cursor is None:
+        cache.delete(cursor_key)
+    return scanned, deleted, reclaimed, failed_cnt
+
+
+def collect_orphan_uploads(s3=None):
+    """
+    고아 업로드 정리 1회 실행 (UPLOAD_GC_* 설정 참고)
+    반환값: 결과 dict, 다른 실행이 진행 중이면 None
+    """
+    if not cache.add(GC_LOCK_KEY, 1, GC_LOCK_TIMEOUT):
+        return None
+    try:
+        s3 = s3 or get_s3_client()
+        result = {
+            "rows_reconciled": reconcile_upload_rows(s3, settings.UPLOAD_GC_ROW_BATCH_SIZE),
+            "scanned": 0, "deleted": 0, "reclaimed_bytes": 0, "failed": 0,
+        }
+        grace = timedelta(hours=settings.UPLOAD_GC_GRACE_HOURS)
+        for prefix in settings.UPLOAD_GC_PREFIXES:
+            scanned, deleted, reclaimed, failed = collect_orphan_objects(
+                s3, prefix, settings.UPLOAD_GC_MAX_PAGES, grace
+            )
+            result["scanned"] += scanned
+            result["deleted"] += deleted
+            result["reclaimed_bytes"] += reclaimed
+            result["failed"] += failed
+        return result
+    finally:
+        cache.delete(GC_LOCK_KEY)
@@ -6,5 +6,8 @@ app_name = "commons"
 
 urlpatterns = [
     # ---------- API---------- #
-    path("api/presigned-url/upload/", views.S3UploadPresignedUrlView.as_view(), name="presigned_url_for_upload")
+    path("api/presigned-url/upload/", views.S3UploadPresignedUrlView.as_view(), name="presigned_url_for_upload"),
+    path("api/presigned-url/upload/batch/", views.S3UploadPresignedUrlBatchView.as_view(), name="presigned_url_for_upload_batch"),
+    path("api/metrics/db/", views.db_connection_metrics, name="db_connection_metrics"),
+    path("metrics/", views.prometheus_metrics, name="prometheus_metrics"),
 ]
@@ -1,17 +1,15 @@
 from datetime import datetime
 import os
-import re
 import uuid
 
-import boto3
-from bs4 import BeautifulSoup
 
 from django.conf import settings
 from django.core.files.storage import default_storage, FileSystemStorage
 from django.core.files.base import ContentFile
 from django.contrib.auth import get_user_model
-from django.http import FileResponse
+from django.http import FileResponse, HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.crypto import constant_time_compare
 from django.utils import timezone
 
 from rest_framework import status
@@ -22,29 +20,55 @@ from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
 from spartagames.utils import std_response
-from spartagames.config import AWS_AUTH, AWS_S3_BUCKET_NAME, AWS_S3_REGION_NAME, AWS_S3_CUSTOM_DOMAIN, AWS_S3_BUCKET_IMAGES
+from spartagames.config import AWS_S3_BUCKET_NAME, AWS_S3_CUSTOM_DOMAIN, AWS_S3_BUCKET_IMAGES
+from .db.pool import connection_metrics, pool_metric_lines
+from .metrics import render as render_metrics
+from .quota import DailyQuotaThrottle
+from .storage import get_s3_client
+
+
+UPLOAD_EXTENSIONS = ['jpeg', 'png', 'gif']
+UPLOAD_TAGGING = 'is_used=false'
+UPLOAD_TAGGING_XML = (
+    '<Tagging><TagSet><Tag><Key>is_used</Key><Value>false</Value></Tag></TagSet></Tagging>'
+)
+INVALID_EXTENSION_MESSAGE = "지원하는 확장자가 아닙니다. 'jpeg', 'png', 'gif' 중에 해당되는 파일을 올려주십시오."
+
+
+class PresignedUrlThrottle(DailyQuotaThrottle):
+    """
+    presigned url 발급 일일 한도 (일괄 발급은 발급 개수만큼 차감)
+    """
+    scope = "presigned_url"
+    limit = settings.PRESIGNED_URL_DAILY_LIMIT
+
+    def get_amount(self, request, view):
+        extensions = request.data.get("extensions")
+        if isinstance(extensions, list):
+            return max(min(len(extensions), settings.PRESIGNED_URL_BATCH_MAX), 1)
+        return 1
+
+
+def _upload_object_key(base_path, extension):
+    time_data = timezone.now().strftime("%Y%m%d%H%M%S%f")
+    return f'{base_path}/{time_data}_{uuid.uuid4()}.{extension}'
 
 
 # 업로드 용 presigned url 발급
 def generate_presigned_url_for_upload(base_path, extension):
-    if extension in ['jpeg', 'png', 'gif']:
+    if extension in UPLOAD_EXTENSIONS:
         file_type = "image"
     else:
         return std_response(
-            message="지원하는 확장자가 아닙니다. 'jpeg', 'png', 'gif' 중에 해당되는 파일을 올려주십시오.",
+            message=INVALID_EXTENSION_MESSAGE,
             status="fail",
             error_code="CLIENT_FAIL",
             status_code=status.HTTP_400_BAD_REQUEST
         )
     
-    s3 = boto3.client(
-        's3',
-        aws_access_key_id=AWS_AUTH["aws_access_key_id"],
-        aws_secret_access_key=AWS_AUTH["aws_secret_access_key"],
-        region_name=AWS_S3_REGION_NAME,
-    )
-    time_data = timezone.now().strftime("%Y%m%d%H%M%S%f")
-    object_key = f'{base_path}/{time_data}_{uuid.uuid4()}.{extension}'
+    # 프로세스 공용 클라이언트 (서명에 필요한 자격 증명/서명기를 재사용, 네트워크 요청 없음)
+    s3 = get_s3_client()
+    object_key = _upload_object_key(base_path, extension)
     
     presigned_url = s3.generate_presigned_url(
         ClientMethod='put_object',
@@ -52,7 +76,7 @@ def generate_presigned_url_for_upload(base_path, extension):
             'Bucket': AWS_S3_BUCKET_NAME,
             'Key': object_key,
             'ContentType': f'{file_type}/*',
-            'Tagging': 'is_used=false',
+            'Tagging': UPLOAD_TAGGING,
             # 'ACL': 'public-read'  # presigned로 public 업로드 허용
         },
         ExpiresIn=600,  # 10분간 유효
@@ -62,9 +86,40 @@ def generate_presigned_url_for_upload(base_path, extension):
     return presigned_url, real_url
 
 
+# 업로드 용 presigned POST 발급 (브라우저 form 업로드, 파일 크기/타입을 정책으로 제한)
+def generate_presigned_post_for_upload(base_path, extension):
+    if extension not in UPLOAD_EXTENSIONS:
+        return std_response(
+            message=INVALID_EXTENSION_MESSAGE,
+            status="fail",
+            error_code="CLIENT_FAIL",
+            status_code=status.HTTP_400_BAD_REQUEST
+        )
+
+    object_key = _upload_object_key(base_path, extension)
+    presigned_post = get_s3_client().generate_presigned_post(
+        Bucket=AWS_S3_BUCKET_NAME,
+        Key=object_key,
+        Fields={
+            'Content-Type': f'image/{extension}',
+            'tagging': UPLOAD_TAGGING_XML,
+        },
+        Conditions=[
+            {'Content-Type': f'image/{extension}'},
+            {'tagging': UPLOAD_TAGGING_XML},
+            ['content-length-range', 1, settings.PRESIGNED_UPLOAD_MAX_SIZE],
+        ],
+        ExpiresIn=600,  # 10분간 유효
+    )
+
+    real_url = f'https://{AWS_S3_CUSTOM_DOMAIN}/{object_key}'
+    return presigned_post, real_url
+
+
 # 업로드 용 presigned url 응답
 class S3UploadPresignedUrlView(APIView):
     permission_classes = [IsAuthenticated]
+    throttle_classes = [PresignedUrlThrottle]
 
     def post(self, request):
         base_path = request.data.get("base_path")
@@ -85,6 +140,95 @@ class S3UploadPresignedUrlView(APIView):
         )
 
 
+# 업로드 용 presigned url 일괄 발급 (에디터에 이미지 여러 장을 한 번에 넣는 경우)
+class S3UploadPresignedUrlBatchView(APIView):
+    """
+    요청: {"base_path": "...", "extensions": ["png", "jpeg", ...], "method": "put" | "post"}
+    응답: [{"upload_url": ..., "url": ...}] (method=post 이면 upload_url 대신 {"url", "fields"} 형태의 upload_form)
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [PresignedUrlThrottle]
+
+    def post(self, request):
+        base_path = request.data.get("base_path")
+        extensions = request.data.get("extensions")
+        method = request.data.get("method", "put")
+
+        if not isinstance(extensions, list) or not extensions:
+            return std_response(
+                message="extensions 는 확장자 목록이어야 합니다.",
+                status="fail",
+                error_code="CLIENT_FAIL",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        if len(extensions) > settings.PRESIGNED_URL_BATCH_MAX:
+            return std_response(
+                message=f"한 번에 최대 {settings.PRESIGNED_URL_BATCH_MAX}개까지 발급할 수 있습니다.(현재 {len(extensions)}개)",
+                status="fail",
+                error_code="CLIENT_FAIL",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        if method not in ("put", "post"):
+            return std_response(
+                message="method 는 put 또는 post 중 하나여야 합니다.",
+                status="fail",
+                error_code="CLIENT_FAIL",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        if any(extension not in UPLOAD_EXTENSIONS for extension in extensions):
+            return std_response(
+                message=INVALID_EXTENSION_MESSAGE,
+                status="fail",
+                error_code="CLIENT_FAIL",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        results = []
+        for extension in extensions:
+            if method == "post":
+                presigned_post, real_url = generate_presigned_post_for_upload(base_path, extension)
+                results.append({'upload_form': presigned_post, 'url': real_url})
+            else:
+                presigned_url, real_url = generate_presigned_url_for_upload(base_path, extension)
+                results.append({'upload_url': presigned_url, 'url': real_url})
+
+        return std_response(
+            status="success",
+            data=results,
+            status_code=status.HTTP_200_OK
+        )
+
+
+
+# 관리자용 DB 커넥션/풀 사용 현황 (요청을 처리한 프로세스 기준)
+@api_view(['GET'])
+def db_connection_metrics(request):
+    if request.user.is_staff == False:
+        return std_response(
+            message="관리자 권한이 필요합니다.",
+            status="fail",
+            error_code="CLIENT_FAIL",
+            status_code=status.HTTP_403_FORBIDDEN
+        )
+    return std_response(
+        data=connection_metrics(),
+        status="success",
+        status_code=status.HTTP_200_OK
+    )
+
+
+
+# Prometheus 스크랩용 지표 (요청을 처리한 프로세스 기준, METRICS_TOKEN 이 없으면 비공개)
+def prometheus_metrics(request):
+    token = settings.METRICS_TOKEN
+    if not token or not constant_time_compare(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return HttpResponse(status=status.HTTP_403_FORBIDDEN)
+    return HttpResponse(
+        render_metrics(pool_metric_lines()),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 # 추후 필요할 경우 수정 예정
 class LocalImageUploadView(APIView):
     permission_classes = [IsAuthenticated]
@@ -104,15 +248,3 @@ class LocalImageUploadView(APIView):
         full_url = request.build_absolute_uri(image_url)
         return Response({'url': full_url})
 
-
-def extract_content_text(content):
-    raw_text = BeautifulSoup(content or "", "html.parser").get_text()
-    
-    # 이스케이프 문자 -> 공백으로 치환
-    clean_text = raw_text.replace('\xa0', ' ')
-    clean_text = re.sub(r'[\n\r\t]+', ' ', clean_text)
-    
-    # 여러 공백 -> 단일 공백
-    clean_text = re.sub(r'\s+', ' ', clean_text)
-    
-    return clean_text.strip()
@@ -0,0 +1,124 @@
+import asyncio
+import hashlib
+import re
+import time
+import weakref
+
+from django.conf import settings
+from django.core.cache import cache
+from openai import AsyncOpenAI
+
+from .models import GameCategory
+
+
+CATEGORY_VERSION_KEY = "games:category_version"
+CATEGORY_LIST_KEY = "games:category_list:{version}"
+CATEGORY_LIST_TIMEOUT = 60 * 60  # 관리자 페이지 등 API 외 경로로 바뀐 경우에도 1시간 뒤 반영
+RESPONSE_KEY = "games:chatbot:{version}:{digest}"
+
+# 이벤트 루프별 (AsyncOpenAI 클라이언트, 세마포어)
+# httpx 커넥션 풀과 asyncio.Semaphore 는 생성된 이벤트 루프에서만 사용할 수 있으므로 루프 단위로 재사용
+# ASGI(uvicorn 등)에서는 워커 당 루프가 하나라 클라이언트/세마포어가 워커 전체에서 공유되지만,
+# WSGI(gunicorn sync 워커, runserver)에서는 async view 를 요청마다 새 루프(async_to_sync)에서 실행하므로
+# 요청마다 클라이언트를 새로 만들고(커넥션 재사용 없음) CHATBOT_MAX_CONCURRENCY 도 요청 단위로만 적용됨
+# → 이 경우 동시 요청 수는 WSGI 워커/스레드 수로 제한되고, 루프가 끝나면 항목도 함께 사라짐 (WeakKeyDictionary)
+_loop_state = weakref.WeakKeyDictionary()
+
+
+def _get_loop_state():
+    loop = asyncio.get_running_loop()
+    state = _loop_state.get(loop)
+    if state is None:
+        client = AsyncOpenAI(
+            api_key=settings.OPEN_API_KEY,
+            base_url=settings.OPENAI_BASE_URL,
+            timeout=settings.CHATBOT_TIMEOUT,
+            max_retries=1,
+        )
+        state = (client, asyncio.Semaphore(settings.CHATBOT_MAX_CONCURRENCY))
+        _loop_state[loop] = state
+    return state
+
+
+def bump_category_version():
+    """
+    카테고리 추가/삭제 시 호출 → 카테고리 목록 캐시와 챗봇 응답 캐시를 한번에 무효화
+    """
+    try:
+        cache.incr(CATEGORY_VERSION_KEY)
+    except ValueError:
+        # 키가 없는 경우 (만료/축출) 이전 버전과 겹치지 않도록 현재 시각으로 초기화
+        cache.set(CATEGORY_VERSION_KEY, time.time_ns(), None)
+
+
+async def get_category_version():
+    version = await cache.aget(CATEGORY_VERSION_KEY)
+    if version is None:
+        await cache.aadd(CATEGORY_VERSION_KEY, time.time_ns(), None)
+        version = await cache.aget(CATEGORY_VERSION_KEY)
+    return version
+
+
+async def get_category_list(version):
+    key = CATEGORY_LIST_KEY.format(version=version)
+    categorylist = await cache.aget(key)
+    if categorylist is None:
+        categorylist = [name async for name in GameCategory.objects.values_list('name', flat=True)]
+        await cache.aset(key, categorylist, CATEGORY_LIST_TIMEOUT)
+    return categorylist
+
+
+def normalize_input(input_data):
+    """
+    캐시 키 용 입력 정규화 (앞뒤/연속 공백 제거, 대소문자 통일)
+    """
+    return " ".join(str(input_data).split()).casefold()
+
+
+def parse_category(gpt_response):
+    # 응답 형식: '카테고리: XXX' (이전 프롬프트의 '태그:' 형식도 허용)
+    about_category = re.split('카테고리:|태그:', gpt_response or '')[-1]
+    about_category = re.sub(
+        '[-=+,#/\?:^.@*\"※~ㆍ!』‘|\(\)\[\]`\'…》\”\“\’·]', '', about_category)
+    about_category = about_category.strip()
+    uncategorylist = ['없음', '']
+    if about_category in uncategorylist:
+        about_category = '없음'
+    return about_category
+
+
+async def classify_category(input_data):
+    """
+    입력 내용과 가장 관련 있는 카테고리 반환
+    같은 입력(정규화 기준) + 같은 카테고리 목록 버전이면 캐시된 결과를 그대로 반환
+    """
+    normalized = normalize_input(input_data)
+    version = await get_category_version()
+    key = RESPONSE_KEY.format(version=version, digest=hashlib.sha256(normalized.encode()).hexdigest())
+    about_category = await cache.aget(key)
+    if about_category is not None:
+        return about_category
+
+    categorylist = await get_category_list(version)
+
+    # GPT API와 통신을 통해 답장을 받아온다.(아래 형식을 따라야함)(추가 옵션은 문서를 참고)
+    instructions = f"""
+    내가 제한한 카테고리 목록 : {categorylist} 여기서만 이야기를 해줘, 이외에는 말하지마
+    받은 내용을 요약해서 내가 제한한 목록에서 제일 관련 있는 항목 한 개를 골라줘
+    결과 형식은 다른 말은 없이 꾸미지도 말고 딱! '카테고리:'라는 형식으로만 작성해줘
+    결과에 특수문자, 이모티콘 붙이지마
+    """
+    client, semaphore = _get_loop_state()
+    async with semaphore:
+        completion = await client.chat.completions.create(
+            model=settings.CHATBOT_MODEL,
+            messages=[
+                {"role": "system", "content": instructions},
+                {"role": "user", "content": f"받은 내용: {normalized}"},
+            ],
+        )
+
+    # 응답받은 데이터 처리
+    about_category = parse_category(completion.choices[0].message.content)
+    await cache.aset(key, about_category, settings.CHATBOT_CACHE_TIMEOUT)
+    return about_category
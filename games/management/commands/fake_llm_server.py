@@ -0,0 +1,77 @@
+import json
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+
+class FakeChatCompletionHandler(BaseHTTPRequestHandler):
+    """
+    OpenAI chat.completions 형식으로 응답하는 로컬 테스트 서버
+    시스템 프롬프트의 카테고리 목록 중 사용자 입력에 포함된 항목(없으면 첫번째)을 '카테고리: XXX' 로 응답
+    """
+    delay = 0.0
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_error(404)
+            return
+
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        messages = body.get("messages", [])
+        system = next((m["content"] for m in messages if m["role"] == "system"), "")
+        user = next((m["content"] for m in messages if m["role"] == "user"), "")
+
+        match = re.search(r"\[(.*?)\]", system)
+        categories = re.findall(r"'([^']*)'", match.group(1)) if match else []
+        category = next((x for x in categories if x.casefold() in user.casefold()), categories[0] if categories else "없음")
+
+        if self.delay:
+            time.sleep(self.delay)
+
+        payload = json.dumps({
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": f"카테고리: {category}"},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    """
+    챗봇 로컬 테스트용 가짜 LLM 서버
+    config.OPENAI_BASE_URL = "http://127.0.0.1:8765/v1" 로 설정 후 실행
+    예) python manage.py fake_llm_server --port 8765 --delay 0.5
+    """
+    help = "OpenAI chat.completions 호환 가짜 LLM 서버를 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--delay", type=float, default=0.0, help="응답 지연 (초)")
+
+    def handle(self, *args, **options):
+        handler = type("Handler", (FakeChatCompletionHandler,), {"delay": options["delay"]})
+        server = ThreadingHTTPServer((options["host"], options["port"]), handler)
+        self.stdout.write(f"Fake LLM server: http://{options['host']}:{options['port']}/v1")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
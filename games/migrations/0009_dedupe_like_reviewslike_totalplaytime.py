@@ -0,0 +1,60 @@
+# Generated by Django 4.2 on 2026-10-19 06:03
+
+from django.db import migrations
+from django.db.models import Count, Max, Min, Sum
+
+
+def dedupe_like(apps, schema_editor):
+    """
+    (user, game) 중복 즐겨찾기 제거. 가장 먼저 생성된 행만 남긴다.
+    """
+    Like = apps.get_model('games', 'Like')
+    dupes = Like.objects.values('user_id', 'game_id').annotate(cnt=Count('id'), keep_id=Min('id')).filter(cnt__gt=1)
+    for row in dupes:
+        Like.objects.filter(user_id=row['user_id'], game_id=row['game_id']).exclude(pk=row['keep_id']).delete()
+
+
+def dedupe_reviewslike(apps, schema_editor):
+    """
+    (review, user) 중복 좋아요/싫어요 제거. 가장 최근 상태(가장 큰 id)만 남긴다.
+    """
+    ReviewsLike = apps.get_model('games', 'ReviewsLike')
+    dupes = ReviewsLike.objects.values('review_id', 'user_id').annotate(cnt=Count('id'), keep_id=Max('id')).filter(cnt__gt=1)
+    for row in dupes:
+        ReviewsLike.objects.filter(review_id=row['review_id'], user_id=row['user_id']).exclude(pk=row['keep_id']).delete()
+
+
+def dedupe_totalplaytime(apps, schema_editor):
+    """
+    (user, game) 중복 누적 플레이 시간 병합. 합계와 최근 플레이 시각을 남길 행에 반영한다.
+    """
+    TotalPlayTime = apps.get_model('games', 'TotalPlayTime')
+    dupes = TotalPlayTime.objects.values('user_id', 'game_id').annotate(
+        cnt=Count('id'),
+        keep_id=Min('id'),
+        sum_totaltime=Sum('totaltime'),
+        max_latest_at=Max('latest_at'),
+    ).filter(cnt__gt=1)
+    for row in dupes:
+        TotalPlayTime.objects.filter(pk=row['keep_id']).update(
+            totaltime=row['sum_totaltime'] or 0,
+            latest_at=row['max_latest_at'],
+        )
+        TotalPlayTime.objects.filter(user_id=row['user_id'], game_id=row['game_id']).exclude(pk=row['keep_id']).delete()
+
+
+class Migration(migrations.Migration):
+    """
+    0010에서 추가하는 unique 제약 조건 이전에 기존 중복 데이터를 정리.
+    (PostgreSQL에서 같은 트랜잭션 안에서 행 수정 후 ALTER TABLE 시 pending trigger events 에러가 나므로 분리)
+    """
+
+    dependencies = [
+        ('games', '0008_alter_game_content_alter_review_content'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_like, migrations.RunPython.noop),
+        migrations.RunPython(dedupe_reviewslike, migrations.RunPython.noop),
+        migrations.RunPython(dedupe_totalplaytime, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2 on 2026-10-19 06:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0009_dedupe_like_reviewslike_totalplaytime'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['is_visible', 'register_state'], name='game_visible_state_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(condition=models.Q(('is_visible', True), ('register_state', 1)), fields=['-created_at'], name='game_public_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(condition=models.Q(('is_visible', True), ('register_state', 1)), fields=['-updated_at'], name='game_public_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(condition=models.Q(('is_visible', True), ('register_state', 1)), fields=['-star', '-created_at'], name='game_public_star_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('is_visible', True)), fields=['game', '-created_at'], name='review_game_visible_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='like',
+            constraint=models.UniqueConstraint(fields=('user', 'game'), name='unique_like_user_game'),
+        ),
+        migrations.AddConstraint(
+            model_name='reviewslike',
+            constraint=models.UniqueConstraint(fields=('review', 'user'), name='unique_reviewslike_review_user'),
+        ),
+        migrations.AddConstraint(
+            model_name='totalplaytime',
+            constraint=models.UniqueConstraint(fields=('user', 'game'), name='unique_totalplaytime_user_game'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2 on 2026-10-19 06:06
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    """
+    기존 Like / ReviewsLike 데이터로 카운터 초기값 채우기
+    """
+    Game = apps.get_model('games', 'Game')
+    Like = apps.get_model('games', 'Like')
+    Review = apps.get_model('games', 'Review')
+    ReviewsLike = apps.get_model('games', 'ReviewsLike')
+
+    like_cnt = Like.objects.filter(game=OuterRef('pk')).values('game').annotate(cnt=Count('id')).values('cnt')
+    Game.objects.update(like_cnt=Coalesce(Subquery(like_cnt), 0))
+
+    def reaction_cnt(is_like):
+        return ReviewsLike.objects.filter(review=OuterRef('pk'), is_like=is_like).values('review').annotate(
+            cnt=Count('id')).values('cnt')
+    Review.objects.update(
+        like_cnt=Coalesce(Subquery(reaction_cnt(1)), 0),
+        dislike_cnt=Coalesce(Subquery(reaction_cnt(2)), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0010_game_game_visible_state_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='like_cnt',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='dislike_cnt',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='like_cnt',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2 on 2026-10-19 06:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0011_game_like_cnt_review_like_cnt_dislike_cnt'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(condition=models.Q(('is_visible', True), ('register_state', 1)), fields=['-like_cnt', '-created_at'], name='game_public_like_cnt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(condition=models.Q(('is_visible', True), ('register_state', 1)), fields=['-review_cnt', '-created_at'], name='game_public_review_cnt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('is_visible', True)), fields=['game', '-like_cnt', '-created_at'], name='review_game_like_cnt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('is_visible', True)), fields=['game', '-dislike_cnt', '-created_at'], name='review_game_dislike_cnt_idx'),
+        ),
+    ]
@@ -1,21 +1,20 @@
 import os
-import re
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils import timezone
 
+from commons.content import parse_content
+from commons.counters import CounterFieldsMixin
 
-def validate_text_content(value):
-    text_only = re.sub(r'<[^>]+>', '', value)  # HTML 태그 제거한 순수 텍스트
-    tag_only = re.findall(r'<[^>]+>', value)   # HTML 태그 목록 추출
 
-    text_length = len(text_only)
-    tag_length = sum(len(tag) for tag in tag_only)
+def validate_text_content(value):
+    # 본문 파싱 결과(텍스트/태그 길이)는 content_text, 이미지 src 추출과 함께 한 번만 계산됨
+    parsed = parse_content(value)
 
     # 순수 텍스트 10만 자 제한
-    if text_length > 100000:    
+    if parsed.text_length > 100000:    
         raise ValidationError('게시글이 너무 깁니다. 10만 글자 이하로 작성해주세요.')
     
     # HTML 포함 시 50만 자 제한
@@ -23,7 +22,7 @@ def validate_text_content(value):
         raise ValidationError('게시글이 너무 깁니다.')
 
     # 태그 비율 70% 초과 시 차단
-    if tag_length / len(value) > 0.7:
+    if parsed.tag_length / len(value) > 0.7:
         raise ValidationError('HTML 태그가 지나치게 많습니다.')
 
 
@@ -35,7 +34,7 @@ class Chip(models.Model):
     name = models.CharField(max_length=50, unique=True)
 
 
-class Game(models.Model):
+class Game(CounterFieldsMixin, models.Model):
     # media 폴더에 업로드할 게임 zip 파일명 변경 및 위치 설정
     def upload_to_func(instance, filename):
         time_data = timezone.now().strftime("%Y%m%d%H%M%S%f")
@@ -63,10 +62,43 @@ class Game(models.Model):
     )
     is_visible = models.BooleanField(default=True)
     star = models.FloatField()
+    # 공개 리뷰 수 (리뷰 작성/삭제 시 F()로 갱신)
     review_cnt = models.IntegerField()
+    # 즐겨찾기 수 (Like 생성/삭제 시 F()로 갱신)
+    like_cnt = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    counter_fields = ("like_cnt", "review_cnt", "star")
+
+    class Meta:
+        indexes = [
+            # 관리자 통계/목록 (is_visible, register_state) 필터
+            models.Index(fields=["is_visible", "register_state"], name="game_visible_state_idx"),
+            # 공개 게임 목록 (is_visible=True, register_state=1) 정렬 기준별 부분 인덱스
+            models.Index(
+                fields=["-created_at"], name="game_public_created_idx",
+                condition=models.Q(is_visible=True, register_state=1),
+            ),
+            models.Index(
+                fields=["-updated_at"], name="game_public_updated_idx",
+                condition=models.Q(is_visible=True, register_state=1),
+            ),
+            models.Index(
+                fields=["-star", "-created_at"], name="game_public_star_idx",
+                condition=models.Q(is_visible=True, register_state=1),
+            ),
+            # 카운터 기반 랭킹 (Bookmark Top / Review Top / Daily Top)
+            models.Index(
+                fields=["-like_cnt", "-created_at"], name="game_public_like_cnt_idx",
+                condition=models.Q(is_visible=True, register_state=1),
+            ),
+            models.Index(
+                fields=["-review_cnt", "-created_at"], name="game_public_review_cnt_idx",
+                condition=models.Q(is_visible=True, register_state=1),
+            ),
+        ]
+
 
 class Like(models.Model):
     user = models.ForeignKey(
@@ -77,6 +109,11 @@ class Like(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "game"], name="unique_like_user_game"),
+        ]
+
 
 class View(models.Model):
     user = models.ForeignKey(
@@ -110,6 +147,11 @@ class TotalPlayTime(models.Model):
     latest_at = models.DateTimeField(null=True)
     totaltime = models.IntegerField(default=0)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "game"], name="unique_totalplaytime_user_game"),
+        ]
+
 
 # 기존 Comment 테이블
 # class Comment(models.Model):
@@ -128,7 +170,7 @@ class TotalPlayTime(models.Model):
     
 
 # Review로 바꿀 것
-class Review(models.Model):
+class Review(CounterFieldsMixin, models.Model):
     game = models.ForeignKey(
         Game, on_delete=models.CASCADE, related_name="reviews"
     )
@@ -139,9 +181,32 @@ class Review(models.Model):
     star = models.IntegerField(null=True)
     difficulty = models.IntegerField(null=True)
     is_visible = models.BooleanField(default=True)
+    # 좋아요/싫어요 수 (ReviewsLike 변경 시 F()로 갱신)
+    like_cnt = models.IntegerField(default=0)
+    dislike_cnt = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    counter_fields = ("like_cnt", "dislike_cnt")
+
+    class Meta:
+        indexes = [
+            # 게임별 공개 리뷰 최신순 조회
+            models.Index(
+                fields=["game", "-created_at"], name="review_game_visible_idx",
+                condition=models.Q(is_visible=True),
+            ),
+            # 게임별 공개 리뷰 좋아요순/싫어요순 조회
+            models.Index(
+                fields=["game", "-like_cnt", "-created_at"], name="review_game_like_cnt_idx",
+                condition=models.Q(is_visible=True),
+            ),
+            models.Index(
+                fields=["game", "-dislike_cnt", "-created_at"], name="review_game_dislike_cnt_idx",
+                condition=models.Q(is_visible=True),
+            ),
+        ]
+
 
 class ReviewsLike(models.Model):
     user = models.ForeignKey(
@@ -152,6 +217,11 @@ class ReviewsLike(models.Model):
     )
     is_like = models.IntegerField(default=0)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["review", "user"], name="unique_reviewslike_review_user"),
+        ]
+
 
 class Screenshot(models.Model):
     src = models.ImageField(
@@ -118,8 +118,8 @@ class GameDetailSerializer(serializers.ModelSerializer):
 class ReviewSerializer(serializers.ModelSerializer):
     author_data = serializers.SerializerMethodField()
     game_id = serializers.IntegerField(source='game.id', read_only=True)
-    like_count = serializers.SerializerMethodField()
-    dislike_count = serializers.SerializerMethodField()
+    like_count = serializers.IntegerField(source='like_cnt', read_only=True)
+    dislike_count = serializers.IntegerField(source='dislike_cnt', read_only=True)
     user_is_like = serializers.SerializerMethodField()
 
     class Meta:
@@ -137,12 +137,6 @@ class ReviewSerializer(serializers.ModelSerializer):
             "image": obj.author.image.url if obj.author.image else '',
         }
     
-    def get_like_count(self, obj):
-        return ReviewsLike.objects.filter(review=obj, is_like=1).count()
-
-    def get_dislike_count(self, obj):
-        return ReviewsLike.objects.filter(review=obj, is_like=2).count()
-
     def get_user_is_like(self, obj):
         # 현재 요청을 보낸 사용자 확인
         user = self.context.get('user', None)
@@ -1,7 +1,7 @@
 from datetime import timedelta
 from django.utils import timezone
 from celery import shared_task
-from django.db.models import Count, Q,Sum
+from django.db.models import Count, F, Q, Sum
 from .models import Game, Chip
 
 
@@ -23,9 +23,9 @@ def assign_chips_to_top_games():
         # 좋아요 수가 가장 많은 상위 4개 게임 가져오기
         top_games = Game.objects.annotate(
             score=(
-                Count('likes') * 0.4 +
-                Count('reviews', filter=Q(reviews__created_at__gte=timezone.now() - timedelta(days=1))) * 0.3 +
-                Count('views', filter=Q(views__created_at__gte=timezone.now() - timedelta(days=1))) * 0.3
+                F('like_cnt') * 0.4 +
+                Count('reviews', filter=Q(reviews__created_at__gte=timezone.now() - timedelta(days=1)), distinct=True) * 0.3 +
+                Count('views', filter=Q(views__created_at__gte=timezone.now() - timedelta(days=1)), distinct=True) * 0.3
             )
         ).filter(
             is_visible=True,
@@ -75,13 +75,11 @@ def assign_bookmark_top_chips():
         bookmark_chip, created = Chip.objects.get_or_create(name='Bookmark Top')
         
         # 최소 5개의 즐겨찾기를 가진 게임 중 즐겨찾기 수가 가장 많은 상위 4개 게임 가져오기
-        top_bookmarked_games = Game.objects.annotate(
-            bookmark_count=Count('likes')
-        ).filter(
-            bookmark_count__gte=5,
+        top_bookmarked_games = Game.objects.filter(
+            like_cnt__gte=5,
             is_visible=True,
             register_state=1
-        ).order_by('-bookmark_count', '-created_at')[:4]
+        ).order_by('-like_cnt', '-created_at')[:4]
         
         # 상위 4개 게임에 'Bookmark Top' 칩 할당 (중복 허용)
         for game in top_bookmarked_games:
@@ -144,13 +142,11 @@ def assign_review_top_chips():
             game.chip.remove(review_top_chip)
         
         # 총 리뷰 수가 최소 10개 이상인 게임 중 리뷰 수가 가장 많은 상위 4개 게임 가져오기
-        top_reviewed_games = Game.objects.annotate(
-            total_review_count=Count('reviews')
-        ).filter(
-            total_review_count__gte=10,
+        top_reviewed_games = Game.objects.filter(
+            review_cnt__gte=10,
             is_visible=True,
             register_state=1
-        ).order_by('-total_review_count', '-created_at')[:4]
+        ).order_by('-review_cnt', '-created_at')[:4]
         
         # 상위 4개 게임에 'Review Top' 칩 할당
         for game in top_reviewed_games:
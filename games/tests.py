@@ -1,3 +1,277 @@
-from django.test import TestCase
+import asyncio
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models.query import QuerySet
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from commons.content import clear_parse_cache
+
+from .chatbot import classify_category, parse_category
+from .management.commands.fake_llm_server import FakeChatCompletionHandler
+from .models import Game, GameCategory, Like, Review, ReviewsLike, validate_text_content
+
+
+class ValidateTextContentTest(TestCase):
+    def setUp(self):
+        clear_parse_cache()
+
+    def test_character_references(self):
+        # 숫자/이름 문자 참조가 있는 본문도 검증 통과
+        for content in ("<p>it&#39;s</p>", "<p>it&#x27;s</p>", "<p>a&#160;b&nbsp;c</p>"):
+            with self.subTest(content=content):
+                validate_text_content(content)
+
+    def test_limits(self):
+        with self.assertRaisesMessage(ValidationError, "HTML 태그가 지나치게 많습니다."):
+            validate_text_content("<p><b><i>&#39;</i></b></p>")
+        with self.assertRaisesMessage(ValidationError, "10만 글자 이하로"):
+            validate_text_content("&#39;" * 100001)
+
+
+class GameTestMixin:
+    def setUp(self):
+        cache.clear()
+        self.user = self.create_user("member@example.com", "member")
+        self.maker = self.create_user("maker@example.com", "maker")
+        self.game = Game.objects.create(
+            title="game", thumbnail="images/thumbnail/game.png", maker=self.maker,
+            content="<p>game</p>", gamefile="zips/game.zip", star=0, review_cnt=0,
+            is_visible=True, register_state=1,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_user(self, email, nickname):
+        return get_user_model().objects.create_user(
+            email=email, password="password1234!", nickname=nickname, login_type="DEFAULT", introduce="",
+        )
+
+    def counters(self, obj, *fields):
+        return tuple(type(obj).objects.values_list(*fields).get(pk=obj.pk))
+
+
+class GameLikeToggleTest(GameTestMixin, TestCase):
+    def like(self):
+        return self.client.post(reverse("games:game_like", kwargs={"game_id": self.game.pk}))
+
+    def test_toggle(self):
+        self.assertEqual(self.like().json()["message"], "즐겨찾기")
+        self.assertEqual(self.counters(self.game, "like_cnt"), (1,))
+        self.assertEqual(self.like().json()["message"], "즐겨찾기 취소")
+        self.assertEqual(self.counters(self.game, "like_cnt"), (0,))
+        self.assertFalse(Like.objects.exists())
+
+    def test_concurrent_duplicate(self):
+        self.like()
+        # 다른 요청이 삭제 시도 이후에 같은 즐겨찾기를 먼저 만든 경우: unique 제약 위반 → 카운터 증가도 롤백
+        with mock.patch.object(QuerySet, "delete", return_value=(0, {})):
+            response = self.like()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Like.objects.count(), 1)
+        self.assertEqual(self.counters(self.game, "like_cnt"), (1,))
+
+    def test_missing_game(self):
+        response = self.client.post(reverse("games:game_like", kwargs={"game_id": self.game.pk + 1}))
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(Like.objects.exists())
+
+
+class ReviewLikeToggleTest(GameTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.review = Review.objects.create(game=self.game, author=self.maker, content="review", star=5)
+
+    def react(self, action):
+        return self.client.post(
+            reverse("games:toggle_review_like", kwargs={"review_id": self.review.pk}), {"action": action}
+        )
+
+    def test_toggle(self):
+        # (동작, like_cnt, dislike_cnt, 남은 행의 is_like)
+        steps = [
+            ("like", 1, 0, [1]),
+            ("dislike", 0, 1, [2]),
+            ("dislike", 0, 0, []),
+            ("unknown", 0, 0, []),
+            ("like", 1, 0, [1]),
+            ("like", 0, 0, []),
+        ]
+        for action, like_cnt, dislike_cnt, rows in steps:
+            self.assertEqual(self.react(action).status_code, 200)
+            self.assertEqual(self.counters(self.review, "like_cnt", "dislike_cnt"), (like_cnt, dislike_cnt), action)
+            self.assertEqual(list(ReviewsLike.objects.values_list("is_like", flat=True)), rows, action)
+
+    def test_toggle_queries(self):
+        # 행 잠금 없이 삭제/전환/생성 중 하나 + 카운터 갱신 (SAVEPOINT/RELEASE 포함)
+        with self.assertNumQueries(8):
+            self.react("like")      # 삭제 0건 → 전환 0건 → 카운터 증가 + 생성
+        with self.assertNumQueries(5):
+            self.react("dislike")   # 삭제 0건 → 전환 + 카운터
+        with self.assertNumQueries(4):
+            self.react("dislike")   # 삭제 + 카운터
+        self.assertEqual(self.counters(self.review, "like_cnt", "dislike_cnt"), (0, 0))
+
+    def test_duplicate_row_rejected(self):
+        # 토글은 (review, user) unique 제약으로 반응 행을 하나로 유지함
+        self.react("like")
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            ReviewsLike.objects.create(user=self.user, review=self.review, is_like=2)
+        self.assertEqual(self.counters(self.review, "like_cnt", "dislike_cnt"), (1, 0))
+
+    def test_hidden_review(self):
+        Review.objects.filter(pk=self.review.pk).update(is_visible=False)
+        self.assertEqual(self.react("like").status_code, 404)
+        self.assertFalse(ReviewsLike.objects.exists())
+
+
+class ReviewCounterTest(GameTestMixin, TestCase):
+    def write(self, author, star):
+        self.client.force_authenticate(author)
+        return self.client.post(
+            reverse("games:reviews", kwargs={"game_id": self.game.pk}),
+            {"content": "review", "star": star, "difficulty": 1}, format="json",
+        )
+
+    def delete(self, review):
+        return self.client.delete(
+            reverse("games:review_detail", kwargs={"review_id": review.pk}), {"game_id": self.game.pk}, format="json",
+        )
+
+    def test_create_and_delete(self):
+        self.assertEqual(self.write(self.user, 5).status_code, 201)
+        self.assertEqual(self.write(self.maker, 2).status_code, 201)
+        self.assertEqual(self.counters(self.game, "review_cnt", "star"), (2, 3.5))
+
+        review = Review.objects.get(author=self.maker)
+        self.assertEqual(self.delete(review).status_code, 200)
+        self.assertEqual(self.counters(self.game, "review_cnt", "star"), (1, 5.0))
+        # 이미 숨긴 리뷰를 다시 삭제해도 한 번만 반영
+        self.assertEqual(self.delete(review).status_code, 404)
+        self.assertEqual(self.counters(self.game, "review_cnt", "star"), (1, 5.0))
+
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.delete(Review.objects.get(author=self.user)).status_code, 200)
+        self.assertEqual(self.counters(self.game, "review_cnt", "star"), (0, 0.0))
+
+    def test_save_keeps_counters(self):
+        # 카운터를 읽어 둔 인스턴스를 save() 해도 그 사이의 F() 갱신을 덮어쓰지 않음
+        stale = Game.objects.get(pk=self.game.pk)
+        self.client.post(reverse("games:game_like", kwargs={"game_id": self.game.pk}))
+        self.write(self.user, 4)
+        stale.title = "renamed"
+        stale.save()
+        self.assertEqual(
+            self.counters(self.game, "title", "like_cnt", "review_cnt", "star"), ("renamed", 1, 1, 4.0)
+        )
+
+
+class FakeLLM(FakeChatCompletionHandler):
+    """
+    fake_llm_server 핸들러에 요청 수 / 최대 동시 요청 수 기록 추가
+    """
+    lock = threading.Lock()
+    requests = 0
+    running = 0
+    max_running = 0
+
+    def do_POST(self):
+        cls = type(self)
+        with cls.lock:
+            cls.requests += 1
+            cls.running += 1
+            cls.max_running = max(cls.max_running, cls.running)
+        try:
+            super().do_POST()
+        finally:
+            with cls.lock:
+                cls.running -= 1
+
+
+class ChatbotTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeLLM)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.settings_override = override_settings(
+            OPENAI_BASE_URL=f"http://127.0.0.1:{cls.server.server_port}/v1", OPEN_API_KEY="test",
+        )
+        cls.settings_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        FakeLLM.requests = FakeLLM.running = FakeLLM.max_running = 0
+        FakeLLM.delay = 0.0
+        for name in ("액션", "퍼즐", "RPG"):
+            GameCategory.objects.create(name=name)
+        self.user = get_user_model().objects.create_user(
+            email="member@example.com", password="password1234!", nickname="member", login_type="DEFAULT", introduce="",
+        )
+        self.token = str(AccessToken.for_user(self.user))
+
+    async def ask(self, input_data):
+        return await self.async_client.post(
+            reverse("games:chatbot"), {"input_data": input_data},
+            content_type="application/json", headers={"Authorization": f"Bearer {self.token}"},
+        )
+
+    async def test_response_cache(self):
+        self.assertEqual(await classify_category("퍼즐 게임 추천해줘"), "퍼즐")
+        # 공백/대소문자만 다른 같은 질문은 업스트림에 보내지 않음
+        self.assertEqual(await classify_category("  퍼즐   게임 추천해줘 "), "퍼즐")
+        self.assertEqual(await classify_category("rpg 추천"), "RPG")
+        self.assertEqual(FakeLLM.requests, 2)
+
+    @override_settings(CHATBOT_MAX_CONCURRENCY=2)
+    async def test_concurrency_limit(self):
+        FakeLLM.delay = 0.2
+        started = time.monotonic()
+        results = await asyncio.gather(*(classify_category(f"액션 질문 {i}") for i in range(6)))
+        self.assertEqual(results, ["액션"] * 6)
+        self.assertEqual((FakeLLM.requests, FakeLLM.max_running), (6, 2))
+        self.assertGreaterEqual(time.monotonic() - started, 0.6)
+
+    @mock.patch("games.views.MAX_USES_PER_DAY", 2)
+    async def test_view_consumes_quota(self):
+        response = await self.ask("퍼즐 게임")
+        self.assertEqual((response.status_code, response.json()), (200, {"category": "퍼즐"}))
+        # 캐시된 응답도 사용량에 포함
+        self.assertEqual((await self.ask("퍼즐 게임")).status_code, 200)
+        response = await self.ask("퍼즐 게임")
+        self.assertEqual((response.status_code, response.json()), (400, {"error": "Daily usage limit reached"}))
+        self.assertEqual(FakeLLM.requests, 1)
+
+    async def test_view_rejects_bad_requests(self):
+        self.assertEqual((await self.async_client.post(reverse("games:chatbot"))).status_code, 401)
+        self.assertEqual((await self.ask("")).status_code, 400)
+        self.assertEqual(FakeLLM.requests, 0)
+
+    async def test_view_upstream_error(self):
+        with override_settings(OPENAI_BASE_URL="http://127.0.0.1:1/v1", CHATBOT_TIMEOUT=1):
+            response = await self.ask("퍼즐 게임")
+        self.assertEqual(response.status_code, 503)
+
+    def test_parse_category(self):
+        self.assertEqual(parse_category("카테고리: 액션"), "액션")
+        self.assertEqual(parse_category("태그: '퍼즐'."), "퍼즐")
+        self.assertEqual(parse_category("설명 문장... 카테고리: [RPG]!"), "RPG")
+        # 빈 응답 / 특수문자만 있는 응답 / 응답 없음(None) 은 '없음'
+        for bad in ("", "카테고리:", "카테고리: ...!!", None):
+            self.assertEqual(parse_category(bad), "없음")
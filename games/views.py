@@ -1,15 +1,18 @@
-import re
+import json
 
+from asgiref.sync import sync_to_async
 from django.core.files.storage import default_storage
-from django.http import Http404
+from django.http import Http404, HttpResponseNotAllowed, JsonResponse
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Count
+from django.db import IntegrityError, transaction
+from django.db.models import Q, F, Case, When, Value
 
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny  # 로그인 인증토큰
 from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed, NotAuthenticated
 from rest_framework.decorators import permission_classes
 
 from games.pagination import CategoryGamesPagination, ReviewPagination
@@ -26,7 +29,6 @@ from .models import (
     PlayLog,
     TotalPlayTime,
 )
-from accounts.models import BotCnt
 from .serializers import (
     GameListSerializer,
     GameDetailSerializer,
@@ -35,14 +37,17 @@ from .serializers import (
     CategorySerailizer,
 )
 
-from django.conf import settings
-from openai import OpenAI
+from openai import OpenAIError
 from django.utils import timezone
-from spartagames.utils import std_response
+from spartagames.utils import std_response, aauthenticate
+from commons.counters import adjust_counters
+from commons.quota import consume_quota
 from spartagames.pagination import ReviewCustomPagination
 import random
 from urllib.parse import urlencode
 from .utils import assign_chip_based_on_difficulty, validate_image, validate_zip_file
+from .chatbot import classify_category, bump_category_version
+from qnas.stats import invalidate_register_stats
 
 class GameListAPIView(APIView):
     """
@@ -235,6 +240,7 @@ class GameListAPIView(APIView):
             game = game,
             content = f"검수요청 (기록자: {request.user.email}, 제작자: {request.user.email})",
         )
+        invalidate_register_stats()
         
         return std_response(message="게임 등록이 완료되었습니다.", status="success", status_code=status.HTTP_200_OK)
         #return Response({"message": "게임업로드 성공했습니다"}, status=status.HTTP_200_OK)
@@ -502,6 +508,7 @@ class GameDetailAPIView(APIView):
                 game=game,
                 content=log_content,
             )
+        invalidate_register_stats()
         
         return std_response(message="게임 수정이 완료되었습니다.", status="success", status_code=status.HTTP_200_OK)
         #return Response({"message": "수정이 완료됐습니다"}, status=status.HTTP_200_OK)
@@ -518,6 +525,7 @@ class GameDetailAPIView(APIView):
         if game.maker == request.user or request.user.is_staff == True:
             game.is_visible = False
             game.save()
+            invalidate_register_stats()
             
             # 게임 삭제 시 게임 등록 로그에 데이터 추가
             game.logs_game.create(
@@ -571,22 +579,23 @@ class GameLikeAPIView(APIView):
                 error_code="CLIENT_FAIL",
                 status_code=status.HTTP_401_UNAUTHORIZED
             )
-        #game = get_object_or_404(Game, pk=game_id)
+        # (user, game) unique 제약 기반 토글: 삭제를 먼저 시도하고, 지운 행이 없으면 생성
+        with transaction.atomic():
+            deleted, _ = Like.objects.filter(user=request.user, game_id=game_id).delete()
+            if deleted:
+                adjust_counters(Game, game_id, like_cnt=-deleted)
+                return std_response(message="즐겨찾기 취소", status="success", status_code=status.HTTP_200_OK)
+
         try:
-            game=Game.objects.get(pk=game_id)
-        except Game.DoesNotExist:
-            return std_response(message="게임이 존재하지 않습니다.", status="error", error_code="SERVER_FAIL", status_code=status.HTTP_404_NOT_FOUND)
-        like_instance = Like.objects.filter(user=request.user, game=game).first()
-        if like_instance:
-            # 수정
-            like_instance.delete()
-            return std_response(message="즐겨찾기 취소", status="success", status_code=status.HTTP_200_OK)
-            #return Response({'message': "즐겨찾기 취소"}, status=status.HTTP_200_OK)
-        else:
-            # 생성
-            Like.objects.create(user=request.user, game=game)
-            return std_response(message="즐겨찾기", status="success", status_code=status.HTTP_200_OK)
-            #return Response({'message': "즐겨찾기"}, status=status.HTTP_200_OK)
+            with transaction.atomic():
+                # 카운터 증가가 게임 존재 확인을 겸함 (행 잠금으로 동시 요청 직렬화)
+                if not adjust_counters(Game, game_id, like_cnt=1):
+                    return std_response(message="게임이 존재하지 않습니다.", status="error", error_code="SERVER_FAIL", status_code=status.HTTP_404_NOT_FOUND)
+                Like.objects.create(user=request.user, game_id=game_id)
+        except IntegrityError:
+            # 동시 요청(더블클릭)으로 이미 생성된 경우 - 카운터 증가도 함께 롤백됨
+            pass
+        return std_response(message="즐겨찾기", status="success", status_code=status.HTTP_200_OK)
 
 
 # class GameStarAPIView(APIView):
@@ -640,13 +649,9 @@ class ReviewAPIView(APIView):
 
         # 정렬 조건 적용
         if order == 'likes':
-            reviews = reviews.annotate(
-                like_count=Count('reviews', filter=Q(reviews__is_like=1))
-            ).order_by('-like_count', '-created_at')
+            reviews = reviews.order_by('-like_cnt', '-created_at')
         elif order == 'dislikes':
-            reviews = reviews.annotate(
-                dislike_count=Count('reviews', filter=Q(reviews__is_like=2))
-            ).order_by('-dislike_count', '-created_at')
+            reviews = reviews.order_by('-dislike_cnt', '-created_at')
         else:
             reviews = reviews.order_by('-created_at')  # 최신순
 
@@ -752,14 +757,17 @@ class ReviewAPIView(APIView):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 error_code="CLIENT_FAIL"
             )
-        game.star = game.star + ((star - game.star) / (game.review_cnt + 1))
-        game.review_cnt = game.review_cnt + 1
-        game.save()
 
         serializer = ReviewSerializer(
             data=request.data, context={'user': request.user})
         if serializer.is_valid(raise_exception=True):
-            serializer.save(author=request.user, game=game)  # 데이터베이스에 저장
+            with transaction.atomic():
+                serializer.save(author=request.user, game=game)  # 데이터베이스에 저장
+                # 별점 평균/리뷰 수를 한 번의 UPDATE로 갱신 (동시 작성 시에도 누락 없음)
+                Game.objects.filter(pk=game.pk).update(
+                    star=F('star') + (star - F('star')) / (F('review_cnt') + 1),
+                    review_cnt=F('review_cnt') + 1,
+                )
             assign_chip_based_on_difficulty(game)
             # return Response(serializer.data, status=status.HTTP_201_CREATED)
             return std_response(
@@ -843,8 +851,9 @@ class ReviewDetailAPIView(APIView):
                     status_code=status.HTTP_404_NOT_FOUND,
                     error_code="CLIENT_FAIL"
                     )
-            game.star = game.star + ((star - request.data.get('pre_star')) / (game.review_cnt))
-            game.save()
+            Game.objects.filter(pk=game.pk, review_cnt__gt=0).update(
+                star=F('star') + float(star - request.data.get('pre_star')) / F('review_cnt')
+            )
             serializer = ReviewSerializer(
                 review, data=request.data, partial=True, context={'user': request.user})
             if serializer.is_valid(raise_exception=True):
@@ -902,15 +911,23 @@ class ReviewDetailAPIView(APIView):
                     status_code=status.HTTP_404_NOT_FOUND,
                     error_code="SERVER_FAIL"
                     )
-            if game.review_cnt > 1:
-                game.star = game.star + \
-                    ((game.star-review.star)/(game.review_cnt-1))
-            else:
-                game.star = 0
-            game.review_cnt = game.review_cnt-1
-            game.save()
-            review.is_visible = False
-            review.save()
+            with transaction.atomic():
+                # 동시 삭제 요청 시 한 번만 반영되도록 조건부 UPDATE
+                if not Review.objects.filter(pk=review.pk, is_visible=True).update(
+                        is_visible=False, updated_at=timezone.now()):
+                    return std_response(
+                        message="리뷰가 존재하지 않습니다.",
+                        status="fail",
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        error_code="SERVER_FAIL"
+                    )
+                Game.objects.filter(pk=game.pk).update(
+                    star=Case(
+                        When(review_cnt__gt=1, then=F('star') + (F('star') - review.star) / (F('review_cnt') - 1)),
+                        default=Value(0.0),
+                    ),
+                    review_cnt=F('review_cnt') - 1,
+                )
             assign_chip_based_on_difficulty(review.game)
             # return Response({"message": "삭제를 완료했습니다"}, status=status.HTTP_200_OK)
             return std_response(
@@ -934,43 +951,49 @@ def toggle_review_like(request, review_id):
     리뷰에 좋아요/싫어요 동작
     """
     user = request.user
-    try:
-        # 리뷰가 존재하고, is_visible이 True인 경우에만 가져옴
-        # review = get_object_or_404(Review, pk=review_id, is_visible=True)
-        review = Review.objects.get(pk=review_id,is_visible=True)
-    except:
-        # 리뷰가 없을 경우 사용자에게 메시지와 함께 404 응답 반환
-        # return Response({"message": "리뷰가 존재하지 않습니다."}, status=status.HTTP_404_NOT_FOUND)
-        return std_response(
-            message="리뷰가 존재하지 않습니다.",
-            status="fail",
-            status_code=status.HTTP_404_NOT_FOUND,
-            error_code="SERVER_FAIL"
-        )
-    # ReviewsLike 객체를 가져오거나 새로 생성
-    # get_or_create 리턴: review_like - ReviewsLike 객체(행), _ - 행 생성 여부
-    review_like, _ = ReviewsLike.objects.get_or_create(
-        user=user, review=review)
-
-    # 요청에서 받은 'action'에 따라 상태 변경
     action = request.data.get('action', None)
-    if action == 'like':
-        if review_like.is_like != 1:  # 현재 상태가 'like'가 아니면 'like'로 변경
-            review_like.is_like = 1
-        else:
-            # 이미 'like' 상태일 경우 'no state'로 전환
-            review_like.is_like = 0
-    elif action == 'dislike':
-        if review_like.is_like != 2:  # 현재 상태가 'dislike'가 아니면 'dislike'로 변경
-            review_like.is_like = 2
-        else:
-            # 이미 'dislike' 상태일 경우 'no state'로 전환
-            review_like.is_like = 0
+    target = {'like': 1, 'dislike': 2}.get(action)
+    counter_fields = {1: 'like_cnt', 2: 'dislike_cnt'}
+
+    # 리뷰가 존재하고, is_visible이 True인 경우에만 반영
+    # (review, user) unique 제약으로 행은 하나만 존재, 'no state'(0)는 행 삭제로 표현
+    reactions = ReviewsLike.objects.filter(user=user, review_id=review_id, review__is_visible=True)
+    if target is None:
+        # 알 수 없는 동작은 현재 상태를 그대로 유지
+        if not Review.objects.filter(pk=review_id, is_visible=True).exists():
+            # 리뷰가 없을 경우 사용자에게 메시지와 함께 404 응답 반환
+            return std_response(message="리뷰가 존재하지 않습니다.", status="fail", status_code=status.HTTP_404_NOT_FOUND, error_code="SERVER_FAIL")
+        is_like = reactions.values_list('is_like', flat=True).first() or 0
+    else:
+        # 삭제 → 전환 → 생성 순으로 시도 (행 잠금 없이 영향받은 행 수로 판단)
+        is_like = None
+        with transaction.atomic():
+            # 이미 같은 상태일 경우 'no state'로 전환
+            deleted, _ = reactions.filter(is_like=target).delete()
+            if deleted:
+                adjust_counters(Review, review_id, **{counter_fields[target]: -deleted})
+                is_like = 0
+            # 반대 상태일 경우 전환
+            elif reactions.update(is_like=target):
+                adjust_counters(Review, review_id, **{counter_fields[target]: 1, counter_fields[3 - target]: -1})
+                is_like = target
+
+        if is_like is None:
+            is_like = target
+            field = counter_fields[target]
+            try:
+                with transaction.atomic():
+                    # 카운터 증가가 리뷰 존재 확인을 겸함
+                    if not Review.objects.filter(pk=review_id, is_visible=True).update(**{field: F(field) + 1}):
+                        return std_response(message="리뷰가 존재하지 않습니다.", status="fail", status_code=status.HTTP_404_NOT_FOUND, error_code="SERVER_FAIL")
+                    ReviewsLike.objects.create(user=user, review_id=review_id, is_like=target)
+            except IntegrityError:
+                # 동시 요청(더블클릭)으로 이미 생성된 경우 - 카운터 증가도 함께 롤백됨
+                pass
 
-    review_like.save()  # 변경 사항 저장
     # return Response({"message": f"리뷰(id: {review_id})에 {review_like.is_like} 동작을 수행했습니다."}, status=status.HTTP_200_OK)
     return std_response(
-        message=f"리뷰(id: {review_id})에 {review_like.is_like} 동작을 수행했습니다.",
+        message=f"리뷰(id: {review_id})에 {is_like} 동작을 수행했습니다.",
         status="success",
         status_code=status.HTTP_200_OK
     )
@@ -1007,6 +1030,7 @@ class CategoryAPIView(APIView):
         serializer = CategorySerailizer(data=request.data)
         if serializer.is_valid(raise_exception=True):
             serializer.save()
+            bump_category_version()  # 챗봇 카테고리 목록/응답 캐시 무효화
             category=request.data.get("name")
             # return Response({"message": f"태그({category})를 추가했습니다"}, status=status.HTTP_200_OK)
             return std_response(
@@ -1035,6 +1059,7 @@ class CategoryAPIView(APIView):
                 error_code="SERVER_FAIL"
                 )
         category.delete()
+        bump_category_version()  # 챗봇 카테고리 목록/응답 캐시 무효화
         # return Response({"message": "삭제를 완료했습니다"}, status=status.HTTP_200_OK)
         return std_response(
             message="삭제를 완료했습니다",
@@ -1147,53 +1172,47 @@ class GamePlaytimeAPIView(APIView):
             return std_response(message="게임이 존재하지 않습니다.",status="fail",  status_code=status.HTTP_404_NOT_FOUND, error_code="SERVER_FAIL")
 
 
-CLIENT = OpenAI(api_key=settings.OPEN_API_KEY)
 MAX_USES_PER_DAY = 10  # 하루 당 질문 10개로 제한기준
 
-# chatbot API
-
-@api_view(['POST'])
-@permission_classes([IsAuthenticated])
-def ChatbotAPIView(request):
-    user = request.user
-    today = timezone.now().date()
-
-    usage, created = BotCnt.objects.get_or_create(user=user, date=today)
 
-    if usage.count >= MAX_USES_PER_DAY:
-        return Response({"error": "Daily usage limit reached"}, status=status.HTTP_400_BAD_REQUEST)
+# chatbot API
+# LLM 응답을 기다리는 동안 워커를 점유하지 않도록 async view 로 처리 (ASGI 서버에서 실행)
+# DRF APIView 는 async 를 지원하지 않으므로 인증/파싱을 직접 처리하고 응답 형식은 기존과 동일하게 유지
 
-    usage.count += 1
-    usage.save()
+async def ChatbotAPIView(request):
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
 
-    input_data = request.data.get('input_data')
-    categorylist = list(GameCategory.objects.values_list('name', flat=True))
+    try:
+        user = await aauthenticate(request)
+    except AuthenticationFailed as e:
+        detail = e.detail if isinstance(e.detail, dict) else {"detail": e.detail}
+        return JsonResponse(detail, status=status.HTTP_401_UNAUTHORIZED)
+    if user is None:
+        return JsonResponse({"detail": str(NotAuthenticated.default_detail)}, status=status.HTTP_401_UNAUTHORIZED)
+
+    if request.content_type == 'application/json':
+        try:
+            input_data = json.loads(request.body or b'{}').get('input_data')
+        except (ValueError, AttributeError):
+            return JsonResponse({"error": "Invalid JSON body"}, status=status.HTTP_400_BAD_REQUEST)
+    else:
+        input_data = request.POST.get('input_data')
+    if not input_data:
+        return JsonResponse({"error": "input_data is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+    # 유저별 일일 사용량 확인 + 증가 (원자적)
+    if not await sync_to_async(consume_quota)("chatbot", user.pk, MAX_USES_PER_DAY):
+        return JsonResponse({"error": "Daily usage limit reached"}, status=status.HTTP_400_BAD_REQUEST)
 
-    # GPT API와 통신을 통해 답장을 받아온다.(아래 형식을 따라야함)(추가 옵션은 문서를 참고)
-    instructions = f"""
-    내가 제한한 카테고리 목록 : {categorylist} 여기서만 이야기를 해줘, 이외에는 말하지마
-    받은 내용을 요약해서 내가 제한한 목록에서 제일 관련 있는 항목 한 개를 골라줘
-    결과 형식은 다른 말은 없이 꾸미지도 말고 딱! '카테고리:'라는 형식으로만 작성해줘
-    결과에 특수문자, 이모티콘 붙이지마
-    """
-    completion = CLIENT.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[
-            {"role": "system", "content": instructions},
-            {"role": "user", "content": f"받은 내용: {input_data}"},
-        ],
-    )
+    try:
+        about_category = await classify_category(input_data)
+    except OpenAIError:
+        return JsonResponse({"error": "Chatbot is temporarily unavailable"}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return JsonResponse({"category": about_category}, status=status.HTTP_200_OK)
 
-    # 응답받은 데이터 처리
-    gpt_response = completion.choices[0].message.content
-    about_category = gpt_response.split('태그:')[1]
-    about_category = re.sub(
-        '[-=+,#/\?:^.@*\"※~ㆍ!』‘|\(\)\[\]`\'…》\”\“\’·]', '', about_category)
-    about_category = about_category.strip()
-    uncategorylist = ['없음', '']
-    if about_category in uncategorylist:
-        about_category = '없음'
-    return Response({"category": about_category}, status=status.HTTP_200_OK)
+# Django 4.2 의 csrf_exempt/require_POST 데코레이터는 async view 를 감싸지 못하므로 속성으로 지정 (토큰 인증이므로 CSRF 불필요)
+ChatbotAPIView.csrf_exempt = True
 
 
 # ---------- Web ---------- #
@@ -0,0 +1,137 @@
+import logging
+from collections import Counter, defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from commons.images import delete_uploader_images
+from games.models import Game, Like, Review, ReviewsLike
+from spartagames.config import ADMIN_STAFF_EMAIL, ADMIN_USER_EMAIL
+from teambuildings.models import TeamBuildPost, TeamBuildPostComment
+from teambuildings.recommendations import refresh_post_buckets
+from .models import DeleteUsers, GameRegisterLog
+
+
+logger = logging.getLogger(__name__)
+
+HARD_DELETE_LOCK_KEY = "qnas:hard_delete:lock"
+HARD_DELETE_LOCK_TIMEOUT = 60 * 60
+
+# 회원 당 행이 많이 쌓이는 테이블 (모델, 회원 FK)
+# 회원 트랜잭션 밖에서 미리 나누어 삭제 (삭제해도 카운터에 영향 없음, 중간에 실패해도 다음 실행에서 이어서 삭제)
+BULK_CHILD_TABLES = (
+    ("games.View", "user"),
+    ("games.PlayLog", "user"),
+)
+
+
+def delete_in_chunks(queryset, chunk_size):
+    """
+    pk 를 chunk_size 개씩 조회하여 삭제 (청크마다 별도 트랜잭션)
+    연관 모델/시그널이 없는 모델은 Django 가 객체를 불러오지 않고 DELETE 문 하나로 삭제
+    반환값: 삭제된 행 수
+    """
+    model = queryset.model
+    deleted = 0
+    while True:
+        pks = list(queryset.order_by().values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            return deleted
+        deleted += model.objects.filter(pk__in=pks).delete()[0]
+
+
+def decrement_counters(model, field, counts):
+    """
+    {pk: 감소량} 만큼 카운터를 F()로 감소 (감소량이 같은 행끼리 UPDATE 1번)
+    """
+    pks_by_amount = defaultdict(list)
+    for pk, amount in counts.items():
+        pks_by_amount[amount].append(pk)
+    for amount, pks in pks_by_amount.items():
+        model.objects.filter(pk__in=pks).update(**{field: F(field) - amount})
+
+
+def hard_delete(user, admin_staff, admin_user, chunk_size):
+    """
+    탈퇴 회원 1명 완전 삭제
+    - 게임/리뷰는 관리자 계정으로 이관 (이관 로그 포함)
+    - 함께 삭제되는 좋아요/리뷰 반응/댓글 만큼 비정규화 카운터 감소
+    게임/리뷰 이관부터 회원 삭제까지 하나의 트랜잭션으로 처리
+    """
+    for label, field in BULK_CHILD_TABLES:
+        delete_in_chunks(apps.get_model(label).objects.filter(**{field: user}), chunk_size)
+
+    with transaction.atomic():
+        # 게임 이관 처리
+        game_ids = list(Game.objects.filter(maker=user).values_list("pk", flat=True))
+        if game_ids:
+            GameRegisterLog.objects.bulk_create([
+                GameRegisterLog(
+                    recoder=admin_staff,
+                    maker=admin_user,
+                    game_id=game_id,
+                    content=f"제작자 {user.nickname}의 게임 데이터를 관리자 계정으로 이관"
+                )
+                for game_id in game_ids
+            ])
+            Game.objects.filter(pk__in=game_ids).update(maker=admin_user)
+
+        # 리뷰 이관 처리
+        Review.objects.filter(author=user).update(author=admin_user)
+
+        # 회원과 함께 삭제되는 데이터의 카운터 감소
+        decrement_counters(Game, "like_cnt", Counter(
+            Like.objects.filter(user=user).values_list("game_id", flat=True)
+        ))
+        for is_like, field in ((1, "like_cnt"), (2, "dislike_cnt")):
+            decrement_counters(Review, field, Counter(
+                ReviewsLike.objects.filter(user=user, is_like=is_like).values_list("review_id", flat=True)
+            ))
+        decrement_counters(TeamBuildPost, "comment_cnt", Counter(
+            TeamBuildPostComment.objects.filter(author=user, is_visible=True)
+            .exclude(post__author=user).values_list("post_id", flat=True)
+        ))
+
+        # 팀빌딩 추천 목록에서 삭제될 게시글 제외 (커밋 이후)
+        for post in TeamBuildPost.objects.filter(author=user).only("pk", "purpose", "duration"):
+            refresh_post_buckets(post)
+        delete_uploader_images(user)
+
+        # 남은 연관 데이터는 위에서 대부분 정리되어 cascade 로 삭제
+        user.delete()
+
+
+def hard_delete_withdrawn_users(withdrawn_before):
+    """
+    withdrawn_before 이전에 탈퇴한 회원을 HARD_DELETE_BATCH_SIZE 명까지 삭제
+    회원 단위로 커밋되므로 중간에 실패하거나 중단되면 다음 실행에서 남은 회원부터 이어서 처리
+    반환값: (삭제 수, 실패 수), 다른 실행이 진행 중이면 None
+    """
+    if not cache.add(HARD_DELETE_LOCK_KEY, 1, HARD_DELETE_LOCK_TIMEOUT):
+        return None
+    try:
+        User = get_user_model()
+        admin_staff = User.objects.get(email=ADMIN_STAFF_EMAIL)
+        admin_user = User.objects.get(email=ADMIN_USER_EMAIL)
+
+        user_ids = list(dict.fromkeys(
+            DeleteUsers.objects.filter(created_at__lte=withdrawn_before)
+            .exclude(user__in=[admin_staff, admin_user])
+            .order_by("pk").values_list("user_id", flat=True)
+        ))[:settings.HARD_DELETE_BATCH_SIZE]
+
+        deleted = failed = 0
+        for user in User.objects.filter(pk__in=user_ids).only("pk", "nickname"):
+            try:
+                hard_delete(user, admin_staff, admin_user, settings.HARD_DELETE_CHUNK_SIZE)
+                deleted += 1
+            except Exception:
+                logger.exception("hard delete failed (user %s)", user.pk)
+                failed += 1
+        return deleted, failed
+    finally:
+        cache.delete(HARD_DELETE_LOCK_KEY)
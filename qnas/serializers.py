@@ -39,5 +39,8 @@ class GameRegisterListSerializer(serializers.ModelSerializer):
         return [{"id": category.id, "name": category.name,} for category in obj.category.all()]
     
     def get_game_register_logs(self, obj):
-        # 로그 리스트를 반환
-        return [{"created_at": log.created_at, "content": log.content} for log in obj.logs_game.filter(game=obj).order_by("-created_at")][:2]
\ No newline at end of file
+        # 최근 로그 2개를 반환 (game_register_list 의 Prefetch(to_attr="latest_register_logs") 캐시 사용)
+        logs = getattr(obj, "latest_register_logs", None)
+        if logs is None:
+            logs = obj.logs_game.order_by("-created_at", "-pk")[:2]
+        return [{"created_at": log.created_at, "content": log.content} for log in logs]
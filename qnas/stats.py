@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from games.models import Game
+
+
+REGISTER_STATS_KEY = "qnas:register_stats"
+
+# 응답 키: register_state 값
+REGISTER_STATES = {
+    "state_ready": 0,
+    "state_ok": 1,
+    "state_deny": 2,
+}
+
+
+def _state_counts():
+    # 등록 상태별 개수를 조건부 집계로 한 번에 계산 (COUNT(*) FILTER / SUM(CASE ...))
+    return {
+        name: Count("pk", filter=Q(register_state=state))
+        for name, state in REGISTER_STATES.items()
+    }
+
+
+def compute_register_stats():
+    """
+    관리자용 게임 등록 통계 (삭제되지 않은 게임 기준)
+    - 전체: 등록 상태별 개수 (쿼리 1번)
+    - categories: 카테고리별 등록 상태 개수 (쿼리 1번)
+    - daily: 최근 REGISTER_STATS_DAYS 일 동안 업로드된 게임의 일자별 등록 상태 개수 (쿼리 1번)
+    """
+    rows = Game.objects.filter(is_visible=True)
+    data = rows.aggregate(**_state_counts())
+
+    data["categories"] = list(
+        rows.filter(category__isnull=False)
+        .values("category__id", "category__name")
+        .annotate(**_state_counts())
+        .order_by("category__id")
+    )
+    for row in data["categories"]:
+        row["id"] = row.pop("category__id")
+        row["name"] = row.pop("category__name")
+
+    since = timezone.localdate() - timedelta(days=settings.REGISTER_STATS_DAYS - 1)
+    data["daily"] = [
+        {**row, "date": row["date"].isoformat()}
+        for row in rows.annotate(date=TruncDate("created_at"))
+        .filter(date__gte=since)
+        .values("date")
+        .annotate(**_state_counts())
+        .order_by("date")
+    ]
+    return data
+
+
+def get_register_stats():
+    """
+    캐시된 등록 통계 (없으면 계산하여 REGISTER_STATS_CACHE_TIMEOUT 동안 캐시)
+    게임 업로드/수정/삭제, 승인/반려 시 invalidate_register_stats() 로 무효화
+    """
+    data = cache.get(REGISTER_STATS_KEY)
+    if data is None:
+        data = compute_register_stats()
+        cache.set(REGISTER_STATS_KEY, data, settings.REGISTER_STATS_CACHE_TIMEOUT)
+    return data
+
+
+def invalidate_register_stats():
+    """
+    커밋 전에 다른 요청이 이전 값을 다시 캐시할 수 있으므로 커밋 이후에도 한 번 더 삭제
+    """
+    cache.delete(REGISTER_STATS_KEY)
+    transaction.on_commit(lambda: cache.delete(REGISTER_STATS_KEY))
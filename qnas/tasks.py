@@ -2,12 +2,9 @@ from datetime import timedelta
 
 from celery import shared_task
 
-from django.contrib.auth import get_user_model
-from django.db.models import Count, Q, Sum
 from django.utils import timezone
 
-from spartagames.config import ADMIN_STAFF_EMAIL, ADMIN_USER_EMAIL
-from .models import DeleteUsers, GameRegisterLog
+from .hard_delete import hard_delete_withdrawn_users
 
 
 @shared_task
@@ -15,39 +12,14 @@ def hard_delete_user():
     """
     매일 오전 6시에 실행
     유예기간: 탈퇴 버튼을 누른 시점으로부터 이틀 뒤 (ex: 3월 5일에 탈퇴했다면 3월 7일 오전 6시에 삭제)
+    회원 단위 트랜잭션으로 게임/리뷰 일괄 이관 + 카운터 감소 + 삭제 (qnas.hard_delete 참고)
     """
     try:
-        rows = DeleteUsers.objects.filter(created_at__lte=timezone.now()-timedelta(days=2))
-        # 관리자 계정
-        admin_staff = get_user_model().objects.get(email=ADMIN_STAFF_EMAIL)
-        # 관리자 계정 (게임 이관용, 일반 유저 취급)
-        admin_user = get_user_model().objects.get(email=ADMIN_USER_EMAIL)
-        
-        for row in rows:
-            user = row.user
-            
-            # 게임 이관 처리
-            games = user.games.all()
-            for game in games:
-                # 이관 로그 추가
-                GameRegisterLog.objects.create(
-                    recoder=admin_staff,
-                    maker=admin_user,
-                    game=game,
-                    content=f"제작자 {user.nickname}의 게임 데이터를 관리자 계정으로 이관"
-                )
-                game.maker = admin_user
-                game.save()
-
-            # 리뷰 이관 처리
-            reviews = user.reviews.all()
-            for review in reviews:
-                review.author = admin_user
-                review.save()
-            
-            user.delete()
-        
-        return f"유저 완전 삭제 프로세스 완료"
+        result = hard_delete_withdrawn_users(timezone.now()-timedelta(days=2))
+        if result is None:
+            return "유저 완전 삭제 프로세스가 이미 실행 중입니다."
+        deleted, failed = result
+        return f"유저 완전 삭제 프로세스 완료 (삭제: {deleted}, 실패: {failed})"
     except Exception as e:
         # 예외 발생 시 로그 남기기 (추가적인 로깅 설정 필요 시 설정)
-        return f"Error in assigning '' : {str(e)}"
+        return f"Error in hard deleting users : {str(e)}"
\ No newline at end of file
@@ -1,3 +1,184 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from commons.counters import reconcile_all
+from games.models import Game, GameCategory, Like, PlayLog, Review, ReviewsLike, View
+from spartagames.config import ADMIN_STAFF_EMAIL, ADMIN_USER_EMAIL
+from teambuildings.models import TeamBuildPost, TeamBuildPostComment
+from .hard_delete import hard_delete_withdrawn_users
+from .models import DeleteUsers, GameRegisterLog
+from .stats import get_register_stats, invalidate_register_stats
+
+
+@override_settings(HARD_DELETE_CHUNK_SIZE=2)
+class HardDeleteTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+
+        def create_user(email, nickname):
+            return User.objects.create_user(
+                email=email, password="password1234!", nickname=nickname, login_type="DEFAULT", introduce="",
+            )
+
+        self.admin_staff = create_user(ADMIN_STAFF_EMAIL, "staff")
+        self.admin_user = create_user(ADMIN_USER_EMAIL, "admin")
+        self.other = create_user("other@example.com", "other")
+        self.withdrawn = create_user("withdrawn@example.com", "withdrawn")
+
+        self.own_game = self.create_game(self.withdrawn)
+        self.other_game = self.create_game(self.other)
+        self.other_review = Review.objects.create(game=self.own_game, author=self.other, content="review")
+        self.own_review = Review.objects.create(game=self.other_game, author=self.withdrawn, content="review")
+        self.other_post = TeamBuildPost.objects.create(
+            author=self.other, title="post", thumbnail="images/thumbnail/teambuildings/teambuilding_default.png",
+            purpose="PORTFOLIO", duration="3M", meeting_type="ONLINE", deadline=timezone.now().date(),
+            contact="contact@example.com", content="<p>post</p>",
+        )
+
+        Like.objects.create(user=self.withdrawn, game=self.other_game)
+        ReviewsLike.objects.create(user=self.withdrawn, review=self.other_review, is_like=2)
+        TeamBuildPostComment.objects.create(post=self.other_post, author=self.withdrawn, content="comment")
+        for _ in range(5):
+            View.objects.create(user=self.withdrawn, game=self.other_game)
+            PlayLog.objects.create(user=self.withdrawn, game=self.other_game, playtime=10)
+        reconcile_all()
+
+        self.withdrawn.is_active = False
+        self.withdrawn.save()
+        DeleteUsers.objects.create(user=self.withdrawn)
+
+    def create_game(self, maker):
+        return Game.objects.create(
+            title="game", thumbnail="images/thumbnail/game.png", maker=maker,
+            content="<p>game</p>", gamefile="zips/game.zip", star=0, review_cnt=0,
+        )
+
+    def run_hard_delete(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return hard_delete_withdrawn_users(timezone.now() + timedelta(minutes=1))
+
+    def test_hard_delete(self):
+        self.assertEqual(self.run_hard_delete(), (1, 0))
+
+        self.assertFalse(get_user_model().objects.filter(pk=self.withdrawn.pk).exists())
+        self.assertFalse(DeleteUsers.objects.exists())
+        self.assertFalse(View.objects.exists() or PlayLog.objects.exists() or Like.objects.exists())
+
+        # 게임/리뷰 이관 + 이관 로그
+        self.assertEqual(Game.objects.get(pk=self.own_game.pk).maker, self.admin_user)
+        self.assertEqual(Review.objects.get(pk=self.own_review.pk).author, self.admin_user)
+        log = GameRegisterLog.objects.get(game=self.own_game)
+        self.assertEqual((log.recoder, log.maker), (self.admin_staff, self.admin_user))
+
+        # 카운터가 실제 값과 일치 (보정할 행이 없음)
+        self.assertEqual(Game.objects.get(pk=self.other_game.pk).like_cnt, 0)
+        self.assertEqual(Review.objects.get(pk=self.other_review.pk).dislike_cnt, 0)
+        self.assertEqual(TeamBuildPost.objects.get(pk=self.other_post.pk).comment_cnt, 0)
+        self.assertFalse(any(reconcile_all().values()))
+
+    def test_resume_after_failure(self):
+        with mock.patch("qnas.hard_delete.delete_uploader_images", side_effect=RuntimeError("boom")), \
+                self.assertLogs("qnas.hard_delete", "ERROR") as logs:
+            self.assertEqual(self.run_hard_delete(), (0, 1))
+        self.assertIn(f"hard delete failed (user {self.withdrawn.pk})", logs.output[0])
+        self.assertIn("RuntimeError: boom", logs.output[0])
+
+        # 회원 트랜잭션은 롤백, 큰 테이블의 청크 삭제는 유지
+        self.assertTrue(DeleteUsers.objects.exists())
+        self.assertEqual(Game.objects.get(pk=self.own_game.pk).maker, self.withdrawn)
+        self.assertEqual(Game.objects.get(pk=self.other_game.pk).like_cnt, 1)
+        self.assertFalse(View.objects.exists())
+
+        self.assertEqual(self.run_hard_delete(), (1, 0))
+        self.assertFalse(any(reconcile_all().values()))
+
+
+class RegisterStatsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.maker = get_user_model().objects.create_user(
+            email="maker@example.com", password="password1234!", nickname="maker", login_type="DEFAULT", introduce="",
+        )
+        action = GameCategory.objects.create(name="Action")
+        puzzle = GameCategory.objects.create(name="Puzzle")
+        for state, category in ((0, action), (0, puzzle), (1, action), (2, action)):
+            game = Game.objects.create(
+                title="game", thumbnail="images/thumbnail/game.png", maker=self.maker,
+                content="<p>game</p>", gamefile="zips/game.zip", star=0, review_cnt=0, register_state=state,
+            )
+            game.category.set([category])
+        Game.objects.create(
+            title="deleted", thumbnail="images/thumbnail/game.png", maker=self.maker,
+            content="<p>game</p>", gamefile="zips/game.zip", star=0, review_cnt=0, is_visible=False,
+        )
+
+    def test_stats(self):
+        with self.assertNumQueries(3):
+            data = get_register_stats()
+        self.assertEqual((data["state_ready"], data["state_ok"], data["state_deny"]), (2, 1, 1))
+        self.assertEqual(
+            [(row["name"], row["state_ready"], row["state_ok"], row["state_deny"]) for row in data["categories"]],
+            [("Action", 1, 1, 1), ("Puzzle", 1, 0, 0)],
+        )
+        self.assertEqual(data["daily"], [{
+            "date": timezone.localdate().isoformat(), "state_ready": 2, "state_ok": 1, "state_deny": 1,
+        }])
+
+    def test_cache_invalidation(self):
+        get_register_stats()
+        Game.objects.filter(register_state=0).update(register_state=1)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_register_stats()["state_ready"], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_register_stats()
+        self.assertEqual(get_register_stats()["state_ready"], 0)
+
+
+class GameRegisterListTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.staff = User.objects.create_user(
+            email="admin@example.com", password="password1234!", nickname="admin", login_type="DEFAULT", introduce="",
+            is_staff=True,
+        )
+        self.category = GameCategory.objects.create(name="Action")
+        self.client = APIClient()
+        self.client.force_authenticate(self.staff)
+
+    def create_games(self, count):
+        for i in range(count):
+            game = Game.objects.create(
+                title=f"game{i}", thumbnail="images/thumbnail/game.png", maker=self.staff,
+                content="<p>game</p>", gamefile="zips/game.zip", star=0, review_cnt=0,
+            )
+            game.category.set([self.category])
+            for n in range(3):
+                GameRegisterLog.objects.create(recoder=self.staff, maker=self.staff, game=game, content=f"log{n}")
+
+    def get_list(self):
+        response = self.client.get(reverse("game_register_list"))
+        self.assertEqual(response.status_code, 200)
+        return response.json()["data"]
+
+    def test_constant_queries(self):
+        self.create_games(1)
+        with self.assertNumQueries(4) as first:
+            self.get_list()
+        self.create_games(4)
+        with self.assertNumQueries(len(first.captured_queries)):
+            data = self.get_list()
+
+        self.assertEqual(len(data), 5)
+        for row in data:
+            self.assertEqual(row["maker_data"], {"id": self.staff.id, "nickname": "admin"})
+            self.assertEqual(row["category_data"], [{"id": self.category.id, "name": "Action"}])
+            self.assertEqual([log["content"] for log in row["game_register_logs"]], ["log2", "log1"])
@@ -3,12 +3,9 @@ import os
 import re
 import zipfile
 
-import boto3
-
 from django.conf import settings
 from django.core.files.storage import FileSystemStorage
-from django.db.models import Q
-from django.http import FileResponse
+from django.db.models import Prefetch, Q
 from django.shortcuts import render, get_object_or_404
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -26,9 +23,11 @@ from .serializers import (
     CategorySerializer,
     GameRegisterListSerializer,
 )
+from .stats import get_register_stats, invalidate_register_stats
 from games.models import (
     Game,
 )
+from commons.storage import get_s3_client, stream_s3_object
 
 from spartagames.utils import std_response
 from rest_framework import status
@@ -158,17 +157,9 @@ def get_stats(request):
             status_code=status.HTTP_403_FORBIDDEN
         )
     
-    rows = Game.objects.filter(is_visible=True)
-
-    # 응답 데이터 구성
-    data = {
-        "state_ready": rows.filter(register_state=0).count(),
-        "state_ok": rows.filter(register_state=1).count(),
-        "state_deny": rows.filter(register_state=2).count(),
-    }
-    
+    # 등록 상태별/카테고리별/일자별 통계 (조건부 집계, 짧은 시간 캐시)
     return std_response(
-        data=data,
+        data=get_register_stats(),
         status="success",
         status_code=status.HTTP_200_OK
     )
@@ -203,7 +194,16 @@ def game_register_list(request):
     if keyword_q:
         query &= Q(title__icontains=keyword_q) | Q(maker__nickname__icontains=keyword_q)
     
-    rows = Game.objects.filter(query).distinct()
+    # 제작자/카테고리/최근 로그 2개를 페이지 단위로 함께 조회 (게임 수와 관계없이 쿼리 수 고정)
+    # 슬라이스한 Prefetch 는 ROW_NUMBER() 윈도우 함수 쿼리 1번으로 게임별 최근 로그만 조회
+    rows = Game.objects.filter(query).distinct().select_related("maker").prefetch_related(
+        "category",
+        Prefetch(
+            "logs_game",
+            queryset=GameRegisterLog.objects.order_by("-created_at", "-pk")[:2],
+            to_attr="latest_register_logs",
+        ),
+    )
 
     # 페이지네이션
     paginator = GameRegisterListPagination()
@@ -277,12 +277,7 @@ def game_register(request, game_id):
     # ~/<업로드시각>_<압축파일명>.zip 에서 '<업로드시각>_<압축파일명>' 추출
     game_folder = path.split('/')[-1].split('.')[0]
 
-    s3 = boto3.client(
-        's3',
-        aws_access_key_id=config.AWS_AUTH["aws_access_key_id"],
-        aws_secret_access_key=config.AWS_AUTH["aws_secret_access_key"],
-        region_name='ap-northeast-2'
-    )
+    s3 = get_s3_client()
     
     # S3에서 zip 파일을 읽어옴
     zip_resp = s3.get_object(Bucket=config.AWS_S3_BUCKET_NAME, Key=path)
@@ -406,6 +401,7 @@ def game_register(request, game_id):
     row.gamepath = f'https://{settings.AWS_S3_CUSTOM_DOMAIN}/media/games/{game_folder}'
     row.register_state = 1
     row.save()
+    invalidate_register_stats()
 
     # 알맞은 HTTP Response 리턴
     # return Response({"message": f"등록을 성공했습니다. (게시물 id: {game_id})"}, status=status.HTTP_200_OK)
@@ -453,6 +449,7 @@ def game_register_deny(request, game_id):
         )
     game.register_state = 2
     game.save()
+    invalidate_register_stats()
     
     # 등록 거부 사유 로그 추가
     GameRegisterLog.objects.create(
@@ -471,8 +468,9 @@ def game_register_deny(request, game_id):
     )
 
 
-# FileResponse 이므로 std_response로 변경하지 않음
-@api_view(['POST'])
+# 파일 스트리밍 응답이므로 std_response로 변경하지 않음
+# GET 은 Range 헤더로 이어받기 할 때 사용
+@api_view(['GET', 'POST'])
 # @permission_classes([IsAuthenticated])
 def game_dzip(request, game_id):
     # 관리자 여부 확인
@@ -494,24 +492,14 @@ def game_dzip(request, game_id):
         )
     zip_path = "media/" + row.gamefile.name
     zip_name = os.path.basename(zip_path)
-    s3_client = boto3.client(
-        's3',
-        aws_access_key_id=config.AWS_AUTH["aws_access_key_id"],
-        aws_secret_access_key=config.AWS_AUTH["aws_secret_access_key"],
-        region_name='ap-northeast-2'
-    )
-    s3_response = s3_client.get_object(Bucket=config.AWS_S3_BUCKET_NAME, Key=zip_path)
-    file_stream = s3_response['Body'].read()
 
-    # 메모리 스트림을 FileResponse로 반환
-    response = FileResponse(io.BytesIO(file_stream), content_type='application/zip')
-
-    # 'Content-Disposition' value 값(HTTP Response 헤더값)을 설정
-    # 파일 이름을 zip_name 으로 다운로드 폴더에 받겠다는 뜻
-    response['Content-Disposition'] = f'attachment; filename="{zip_name}"'
-
-    # FileResponse 객체를 리턴
-    return response
+    # S3 오브젝트를 청크 단위로 스트리밍 (빌드 파일 크기와 무관하게 메모리 사용량 일정, Range 요청으로 이어받기 가능)
+    return stream_s3_object(
+        zip_path,
+        filename=zip_name,
+        content_type='application/zip',
+        range_header=request.headers.get('Range'),
+    )
 
 
 # 게임 등록 거부 사유 불러오는 API
@@ -79,6 +79,8 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'commons.profiling.ProfilingMiddleware',  # 요청별 처리 시간/쿼리 수 측정 (commons.profiling)
+    'commons.db.routers.ReplicaRoutingMiddleware',  # 읽기 쿼리 복제본 라우팅 (요청 단위)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -138,17 +140,47 @@ WSGI_APPLICATION = 'spartagames.wsgi.application'
 #         'NAME': BASE_DIR / 'db.sqlite3',
 #     }
 # }
+# DB 커넥션 (commons.db)
+DB_CONN_MAX_AGE = 60                # 요청이 끝나도 커넥션을 유지할 시간 (초, Celery 워커도 태스크 전후로 같은 기준 적용)
+DB_POOL_ENABLED = False             # ASGI/스레드 워커로 실행할 때 True → 프로세스 내 커넥션 풀 사용 (요청마다 풀에 반납)
+DB_POOL_MAX_SIZE = 10               # 프로세스 당 최대 커넥션 수
+DB_POOL_TIMEOUT = 10                # 커넥션이 모두 사용 중일 때 반납을 기다리는 시간 (초)
+DB_POOL_HEALTH_CHECK_IDLE = 30      # 이 시간 이상 쉬던 커넥션은 빌려주기 전에 확인 (초)
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'commons.db.postgresql' if DB_POOL_ENABLED else 'django.db.backends.postgresql',
         'HOST': config.DATABASES["host"],
         'PORT': config.DATABASES["port"],
         'NAME': config.DATABASES["database"],
         'USER': config.DATABASES["user"],
         'PASSWORD': config.DATABASES["password"],
+        'CONN_MAX_AGE': 0 if DB_POOL_ENABLED else DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': True,     # 유지된 커넥션을 요청 시작 시 재사용하기 전에 확인 (끊긴 커넥션으로 인한 500 방지)
     }
 }
 
+# 읽기 전용 복제본 (commons.db.routers.ReplicaRouter)
+# config.DATABASE_REPLICAS: config.DATABASES 와 같은 형식의 접속 정보 목록 (생략한 항목은 primary 와 동일)
+# 로컬 확인: DATABASES 에 'replica_0'(SQLite/PostgreSQL) 을 추가하고 REPLICA_DATABASES = ['replica_0'] 로 설정
+for _index, _replica in enumerate(getattr(config, "DATABASE_REPLICAS", [])):
+    DATABASES[f'replica_{_index}'] = {
+        **DATABASES['default'],
+        **{key.upper(): value for key, value in _replica.items() if key != "database"},
+        'NAME': _replica.get("database", DATABASES['default']['NAME']),
+        'TEST': {'MIRROR': 'default'},  # 테스트에서는 primary 테스트 DB 사용
+    }
+REPLICA_DATABASES = [alias for alias in DATABASES if alias.startswith('replica_')]
+DATABASE_ROUTERS = ['commons.db.routers.ReplicaRouter']
+REPLICA_STICKY_SECONDS = 10         # 데이터를 변경한 유저의 읽기를 primary 로 보내는 시간 (초, 복제 지연보다 길게)
+REPLICA_PRIMARY_PATHS = ['/admin/']  # 항상 primary 에서 읽는 경로 (세션 로그인 관리자 페이지)
+
+# 요청 프로파일링 (commons.profiling, 지표: GET /commons/metrics/)
+PROFILING_ENABLED = True
+PROFILING_SAMPLE_RATE = 0.05            # 쿼리 수/쿼리 시간/직렬화 시간을 측정할 요청 비율 (처리 시간/상태 코드는 모든 요청)
+PROFILING_N_PLUS_ONE_THRESHOLD = 10     # 같은 형태의 쿼리가 이 횟수 이상 반복되면 N+1 의심으로 기록
+METRICS_TOKEN = getattr(config, "METRICS_TOKEN", None)  # 지표 스크랩 토큰 (Authorization: Bearer <토큰>, 없으면 비공개)
+
 # Celery 브로커로 Django 데이터베이스 사용
 CELERY_BROKER_URL = 'redis://127.0.0.1:6379/0'
 CELERY_RESULT_BACKEND = 'django-db'
@@ -188,8 +220,103 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'accounts.tasks.routine_email_by_token',
         'schedule': crontab(day_of_month=1, hour=6, minute=0, month_of_year='*/3'),
     },
+    'reconcile-counters-daily': {
+        'task': 'commons.tasks.reconcile_counters',
+        'schedule': crontab(hour=3, minute=30),  # 칩 할당 태스크(03:40~) 이전에 보정
+    },
+    'collect-orphan-uploads-hourly': {
+        'task': 'commons.tasks.collect_orphan_uploads',
+        'schedule': crontab(minute=20),
+    },
+    'dispatch-emails': {
+        'task': 'accounts.tasks.dispatch_emails',
+        'schedule': timedelta(minutes=5),  # 발송 태스크가 유실되었거나 재시도가 끝난 이메일 발송
+    },
 }
 
+# Cache (Redis, Celery 브로커와 같은 인스턴스의 다른 DB 사용)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': getattr(config, 'REDIS_CACHE_URL', 'redis://127.0.0.1:6379/1'),
+        'KEY_PREFIX': 'spartagames',
+    }
+}
+
+# Chatbot (OpenAI)
+# OPENAI_BASE_URL 을 지정하면 해당 서버로 요청 (로컬 테스트: python manage.py fake_llm_server)
+OPENAI_BASE_URL = getattr(config, 'OPENAI_BASE_URL', None)
+CHATBOT_MODEL = 'gpt-3.5-turbo'
+CHATBOT_MAX_CONCURRENCY = 8         # 워커(이벤트 루프) 당 동시에 보내는 업스트림 요청 수 (ASGI 에서만 의미 있음, games/chatbot.py 참고)
+CHATBOT_TIMEOUT = 20                # 업스트림 요청 타임아웃 (초)
+CHATBOT_CACHE_TIMEOUT = 60 * 60 * 24  # 동일 질문 응답 캐시 (초)
+
+# 게시글/프로필 본문 검색용 텍스트 추출
+# 이 길이(문자 수)보다 긴 본문은 저장 요청에서 추출하지 않고 Celery 태스크로 넘김
+CONTENT_TEXT_SYNC_MAX_LENGTH = 100 * 1024
+
+# S3 클라이언트 (commons.storage.get_s3_client, 프로세스 당 1개 공유)
+S3_MAX_POOL_CONNECTIONS = 32        # 커넥션 풀 크기 (S3_TAGGING_MAX_WORKERS 이상)
+S3_CONNECT_TIMEOUT = 5              # 초
+S3_READ_TIMEOUT = 60                # 초
+S3_STREAM_CHUNK_SIZE = 1024 * 1024  # 파일 다운로드 스트리밍 청크 크기 (바이트)
+
+# 에디터 이미지 presigned 업로드
+PRESIGNED_URL_BATCH_MAX = 20                # 일괄 발급 1회 최대 개수
+PRESIGNED_URL_DAILY_LIMIT = 1000            # 유저 당 하루 발급 개수
+PRESIGNED_UPLOAD_MAX_SIZE = 10 * 1024 * 1024  # presigned POST 업로드 최대 크기 (바이트)
+
+# 에디터 이미지 S3 태깅 (Celery 태스크 당 병렬 요청 수)
+S3_TAGGING_MAX_WORKERS = 8
+
+# 고아 업로드 정리 (commons.tasks.collect_orphan_uploads)
+UPLOAD_GC_PREFIXES = ['images/']     # 스캔할 S3 prefix (presigned 업로드 이미지 경로)
+UPLOAD_GC_GRACE_HOURS = 24          # 업로드 후 이 시간 안에는 (작성 중일 수 있으므로) 삭제하지 않음
+UPLOAD_GC_MAX_PAGES = 5             # 1회 실행 당 prefix 별 스캔 페이지 수 (페이지 당 1000개)
+UPLOAD_GC_ROW_BATCH_SIZE = 1000     # 1회 실행 당 확인할 UploadImage 행 수
+
+# 소셜 로그인 제공자 요청 (accounts.oauth, 프로세스 당 requests.Session 1개 공유)
+# 로컬 테스트 시 SOCIAL_LOGIN_ENDPOINTS 의 주소를 가짜 제공자 서버로 변경
+SOCIAL_LOGIN_ENDPOINTS = {
+    'google_discovery': 'https://accounts.google.com/.well-known/openid-configuration',
+    'naver_token': 'https://nid.naver.com/oauth2.0/token',
+    'naver_profile': 'https://openapi.naver.com/v1/nid/me',
+    'kakao_token': 'https://kauth.kakao.com/oauth/token',
+    'kakao_profile': 'https://kapi.kakao.com/v2/user/me',
+    'discord_token': 'https://discord.com/api/oauth2/token',
+    'discord_profile': 'https://discordapp.com/api/users/@me',
+}
+SOCIAL_LOGIN_CONNECT_TIMEOUT = 3    # 초
+SOCIAL_LOGIN_READ_TIMEOUT = 10      # 초
+SOCIAL_LOGIN_RETRIES = 2            # 연결 실패/5xx 재시도 횟수 (토큰 발급 POST 는 연결 실패만 재시도)
+SOCIAL_LOGIN_POOL_SIZE = 10         # 제공자(호스트) 당 유지할 커넥션 수
+SOCIAL_LOGIN_METADATA_TIMEOUT = 60 * 60 * 6  # 구글 OpenID 설정/공개키(JWKS) 캐시 (초)
+
+# 이메일 발송 (accounts.mail, Celery 태스크에서 발송)
+# 로컬 테스트: EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend', EMAIL_FILE_PATH = '/tmp/emails'
+# 또는 'django.core.mail.backends.smtp.EmailBackend' + EMAIL_HOST/EMAIL_PORT
+EMAIL_BACKEND = 'accounts.mail.GmailAPIBackend'
+DEFAULT_FROM_EMAIL = 'sparta.games.master@gmail.com'
+EMAIL_DISPATCH_BATCH_SIZE = 50      # 배치(연결 1개) 당 발송 수
+EMAIL_DISPATCH_MAX_ATTEMPTS = 5     # 이메일 당 최대 발송 시도 횟수 (초과 시 경고 로그를 남기고 대기열에서 삭제)
+EMAIL_DISPATCH_MAX_AGE = 60 * 5     # 대기열 이메일 유효 시간 (초, 지나면 발송하지 않고 삭제, 비밀 값 보관 시간, 인증 번호 유효 시간과 같게)
+EMAIL_DISPATCH_LEASE = 60 * 2       # 발송 워커가 가져간 이메일의 점유 시간 (초, 워커가 죽으면 지난 뒤 다른 워커가 재시도)
+
+# 이메일 인증 번호 (accounts.verification, 캐시에 해시 저장)
+EMAIL_VERIFICATION_TTL = 60 * 5             # 유효 시간 (초)
+EMAIL_VERIFICATION_MAX_ATTEMPTS = 5         # 인증 번호 당 최대 불일치 횟수 (초과 시 재발급 필요)
+
+# JWT 인증 유저 스냅샷 캐시 (accounts.authentication, 유저 저장/삭제 시 무효화)
+USER_SNAPSHOT_TIMEOUT = 60 * 10     # 초
+
+# 탈퇴 회원 완전 삭제 (qnas.tasks.hard_delete_user)
+HARD_DELETE_BATCH_SIZE = 200        # 1회 실행 당 삭제할 회원 수 (남은 회원은 다음 실행에서 처리)
+HARD_DELETE_CHUNK_SIZE = 5000       # 조회/플레이 기록 등 큰 테이블 삭제 단위 (행 수)
+
+# 관리자용 게임 등록 통계 캐시 (qnas.stats, 업로드/수정/삭제/승인/반려 시 무효화)
+REGISTER_STATS_CACHE_TIMEOUT = 60   # 초
+REGISTER_STATS_DAYS = 30            # 일자별 통계 기간 (일)
+
 # Auth User Model - Custom
 AUTH_USER_MODEL = 'accounts.User'
 
@@ -238,7 +365,7 @@ SITE_ID = 2
 # DRF Auth setting - default: JWT
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.CachedJWTAuthentication",
     ],
     'DEFAULT_PAGINATION_CLASS': 'spartagames.pagination.CustomPagination',
     'PAGE_SIZE': 20,
@@ -301,21 +428,52 @@ ACCOUNT_EMAIL_REQUIRED = True  # 이메일을 필수로 요구
 ACCOUNT_USERNAME_REQUIRED = False  # username 필드를 사용하지 않음
 ACCOUNT_AUTHENTICATION_METHOD = 'email'  # 이메일을 로그인에 사용
 
-LOGGING = {
-    'version': 1,
-    'disable_existing_loggers': False,
-    'handlers': {
+# 로그 파일 디렉터리 (소스 트리 밖 경로 지정, ex. /var/log/spartagames)
+# 지정하지 않으면 (로컬 개발/테스트) 파일 대신 콘솔로 출력
+LOG_DIR = getattr(config, 'LOG_DIR', None)
+
+if LOG_DIR:
+    Path(LOG_DIR).mkdir(parents=True, exist_ok=True)
+    LOG_HANDLERS = {
         'file': {
             'level': 'ERROR',
             'class': 'logging.FileHandler',
-            'filename': BASE_DIR / 'django_error.log',
+            'filename': Path(LOG_DIR) / 'django_error.log',
         },
-    },
+        'profiling': {
+            'level': 'INFO',
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': Path(LOG_DIR) / 'profiling.log',
+            'maxBytes': 1024 * 1024 * 50,
+            'backupCount': 5,
+        },
+    }
+else:
+    LOG_HANDLERS = {
+        'file': {
+            'level': 'ERROR',
+            'class': 'logging.StreamHandler',
+        },
+        'profiling': {
+            'level': 'INFO',
+            'class': 'logging.StreamHandler',
+        },
+    }
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': LOG_HANDLERS,
     'loggers': {
         'django.request': {
             'handlers': ['file'],
             'level': 'ERROR',
             'propagate': True,
         },
+        'commons.profiling': {
+            'handlers': ['profiling'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
 }
\ No newline at end of file
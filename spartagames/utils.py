@@ -1,5 +1,7 @@
+from asgiref.sync import sync_to_async
 from rest_framework import status
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
 def std_response(
     data=None,
@@ -17,3 +19,16 @@ def std_response(
         "error_code": error_code
     }
     return Response(response, status=status_code)
+
+
+async def aauthenticate(request):
+    """
+    DRF APIView 를 쓰지 않는 async view 에서 DEFAULT_AUTHENTICATION_CLASSES 로 인증
+    반환값: 인증된 user 또는 None (토큰이 잘못된 경우 AuthenticationFailed 발생)
+    """
+    for authentication_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        result = await sync_to_async(authentication_class().authenticate)(request)
+        if result is not None:
+            request.user = result[0]
+            return result[0]
+    return None
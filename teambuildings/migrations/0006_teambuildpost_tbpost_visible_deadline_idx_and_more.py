@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-19 06:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teambuildings', '0005_teambuildpost_content_text_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='teambuildpost',
+            index=models.Index(fields=['is_visible', 'deadline', '-create_dt'], name='tbpost_visible_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teambuildpost',
+            index=models.Index(condition=models.Q(('is_visible', True)), fields=['-create_dt'], name='tbpost_visible_created_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2 on 2026-10-19 06:09
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_cnt(apps, schema_editor):
+    """
+    기존 공개 댓글 수로 comment_cnt 초기값 채우기
+    """
+    TeamBuildPost = apps.get_model('teambuildings', 'TeamBuildPost')
+    TeamBuildPostComment = apps.get_model('teambuildings', 'TeamBuildPostComment')
+    comment_cnt = TeamBuildPostComment.objects.filter(post=OuterRef('pk'), is_visible=True).values('post').annotate(
+        cnt=Count('id')).values('cnt')
+    TeamBuildPost.objects.update(comment_cnt=Coalesce(Subquery(comment_cnt), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teambuildings', '0006_teambuildpost_tbpost_visible_deadline_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teambuildpost',
+            name='comment_cnt',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_comment_cnt, migrations.RunPython.noop),
+    ]
@@ -4,7 +4,8 @@ from django.db import models
 from django.conf import settings
 from django.utils import timezone
 
-from commons.views import extract_content_text
+from commons.content import ContentTextMixin
+from commons.counters import CounterFieldsMixin
 from games.models import validate_text_content, GameCategory
 
 
@@ -55,7 +56,7 @@ class Role(models.Model):
     name = models.CharField(max_length=50, unique=True)
 
 
-class TeamBuildPost(models.Model):
+class TeamBuildPost(ContentTextMixin, CounterFieldsMixin, models.Model):
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="team_build_post")
     want_roles = models.ManyToManyField(
         Role, related_name="team_build_post"
@@ -70,22 +71,32 @@ class TeamBuildPost(models.Model):
     content = models.TextField(validators=[validate_text_content])
     content_text = models.TextField(verbose_name="only text of content", null=True, blank=True)
     is_visible = models.BooleanField(default=True)
+    # 공개 댓글 수 (댓글 작성/삭제 시 F()로 갱신)
+    comment_cnt = models.IntegerField(default=0)
     create_dt = models.DateTimeField(auto_now_add=True)
     update_dt = models.DateTimeField(auto_now=True)
 
+    counter_fields = ("comment_cnt",)
+
+    class Meta:
+        indexes = [
+            # 목록/추천: is_visible + 마감일 필터, 최신순 정렬
+            models.Index(fields=["is_visible", "deadline", "-create_dt"], name="tbpost_visible_deadline_idx"),
+            models.Index(
+                fields=["-create_dt"], name="tbpost_visible_created_idx",
+                condition=models.Q(is_visible=True),
+            ),
+        ]
+
     @property
     def status_chip(self):
         return "모집마감" if self.deadline < timezone.now().date() else "모집중"
 
     def __str__(self):
         return f"{self.title} ({self.status_chip})"
-    
-    def save(self, *args, **kwargs):
-        self.content_text = extract_content_text(self.content)
-        super().save(*args, **kwargs)
 
 
-class TeamBuildProfile(models.Model):
+class TeamBuildProfile(ContentTextMixin, models.Model):
     CAREER_CHOICES = [
         ("STUDENT", "대학생"),
         ("JOBSEEKER", "취준생"),
@@ -121,10 +132,6 @@ class TeamBuildProfile(models.Model):
 
     def __str__(self):
         return f"{self.title} - {self.author.nickname}"
-    
-    def save(self, *args, **kwargs):
-        self.content_text = extract_content_text(self.content)
-        super().save(*args, **kwargs)
 
 
 class TeamBuildPostComment(models.Model):
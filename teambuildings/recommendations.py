@@ -0,0 +1,113 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .models import TeamBuildPost
+from .utils import get_valid_duration_keys
+
+
+RECOMMEND_SIZE = 4
+BUCKET_SIZE = 12  # 버킷 당 보관 개수 (마감으로 빠지는 글을 고려해 여유있게 보관)
+BUCKET_TIMEOUT = 60 * 60 * 24  # 날짜가 바뀌어 마감된 글은 읽을 때 걸러내고, 하루 뒤에는 다시 생성
+BUCKET_KEY = "teambuildings:recommend:{role_id}:{purpose}:{duration}"
+CLOSING_KEY = "teambuildings:recommend:closing"  # 마감 임박 (버킷 조건 없음)
+
+
+def bucket_key(bucket):
+    """
+    bucket: (role_id, purpose, duration) 또는 None(마감 임박)
+    """
+    if bucket is None:
+        return CLOSING_KEY
+    role_id, purpose, duration = bucket
+    return BUCKET_KEY.format(role_id=role_id, purpose=purpose, duration=duration)
+
+
+def post_buckets(post):
+    """
+    게시글이 속한 추천 버킷 목록 (모집 역할 별 1개)
+    """
+    role_ids = post.want_roles.values_list("pk", flat=True)
+    return {(role_id, post.purpose, post.duration) for role_id in role_ids}
+
+
+def build_bucket(bucket):
+    """
+    버킷에 들어갈 모집중인 게시글 목록 [(id, 마감일, 작성시각), ...]
+    - 맞춤 버킷: 마감일순 (같은 마감일은 최신순) / 마감 임박: 마감일순
+    """
+    posts = TeamBuildPost.objects.filter(is_visible=True, deadline__gte=timezone.now().date())
+    if bucket is None:
+        posts = posts.order_by("deadline", "pk")
+    else:
+        role_id, purpose, duration = bucket
+        posts = posts.filter(want_roles=role_id, purpose=purpose, duration=duration).order_by("deadline", "-create_dt")
+    return [
+        (pk, deadline.isoformat(), create_dt.timestamp())
+        for pk, deadline, create_dt in posts.values_list("pk", "deadline", "create_dt")[:BUCKET_SIZE]
+    ]
+
+
+def refresh_buckets(buckets):
+    cache.set_many({bucket_key(bucket): build_bucket(bucket) for bucket in buckets}, BUCKET_TIMEOUT)
+
+
+def refresh_post_buckets(post, old_buckets=()):
+    """
+    게시글 작성/수정/마감/삭제 시 호출 → 커밋 이후 관련 버킷과 마감 임박 목록을 다시 생성
+    old_buckets: 수정 전 게시글이 속해있던 버킷 (역할/목적/기간이 바뀐 경우 이전 버킷에서도 빠지도록)
+    """
+    buckets = post_buckets(post) | set(old_buckets) | {None}
+    transaction.on_commit(lambda: refresh_buckets(buckets))
+
+
+def get_recommended_posts(profile=None):
+    """
+    추천 게시글 4개
+    - 프로필이 있으면 (내 역할, 목적, 가능 기간 이하) 버킷의 마감 임박 글 → 부족하면 전체 마감 임박 글로 채움
+    - 프로필이 없으면 마감 임박 4개
+    캐시 조회 1번 + 게시글 in_bulk 조회 (캐시에 없는 버킷만 다시 생성)
+    """
+    buckets = [None]
+    if profile is not None:
+        buckets += [
+            (profile.my_role_id, profile.purpose, duration)
+            for duration in get_valid_duration_keys(profile.duration)
+        ]
+    keys = {bucket_key(bucket): bucket for bucket in buckets}
+    cached = cache.get_many(keys)
+
+    today = timezone.now().date().isoformat()
+    entries = {}
+    rebuilt = {}
+    for key, bucket in keys.items():
+        rows = cached.get(key)
+        if rows is not None:
+            valid = [row for row in rows if row[1] >= today]
+            # 꽉 찬 버킷에서 마감된 글이 빠져 부족해진 경우에만 다시 생성
+            if len(valid) < RECOMMEND_SIZE and len(rows) == BUCKET_SIZE:
+                rows = None
+            else:
+                rows = valid
+        if rows is None:
+            rows = rebuilt[key] = build_bucket(bucket)
+        entries[bucket] = rows
+    if rebuilt:
+        cache.set_many(rebuilt, BUCKET_TIMEOUT)
+
+    matched = {}
+    for bucket in buckets[1:]:
+        for pk, deadline, create_ts in entries[bucket]:
+            matched[pk] = (deadline, -create_ts)
+    ids = sorted(matched, key=matched.get)[:RECOMMEND_SIZE]
+    for pk, deadline, create_ts in entries[None]:
+        if len(ids) >= RECOMMEND_SIZE:
+            break
+        if pk not in matched:
+            ids.append(pk)
+
+    # 캐시 갱신 전(커밋 직후 등)에 삭제/마감된 글은 제외
+    posts = TeamBuildPost.objects.filter(
+        is_visible=True, deadline__gte=today,
+    ).select_related("author").prefetch_related("want_roles").in_bulk(ids)
+    return [posts[pk] for pk in ids if pk in posts]
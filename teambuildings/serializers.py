@@ -13,9 +13,9 @@ class TeamBuildPostSerializer(serializers.ModelSerializer):
         fields = (
             'id', 'title', 'author_data', 'purpose',
             'duration', 'deadline', 'is_visible',
-            'status_chip', 'want_roles', 'thumbnail', 'content'
+            'status_chip', 'want_roles', 'thumbnail', 'content', 'comment_cnt',
         )
-        read_only_fields = ['id', 'author_data', 'is_visible', 'create_dt', 'update_dt', 'status_chip']
+        read_only_fields = ['id', 'author_data', 'is_visible', 'create_dt', 'update_dt', 'status_chip', 'comment_cnt']
 
     def get_author_data(self, obj):
         return {
@@ -25,7 +25,8 @@ class TeamBuildPostSerializer(serializers.ModelSerializer):
         }
     
     def get_want_roles(self, obj):
-        roles = list(obj.want_roles.values_list('name', flat=True))
+        # prefetch_related('want_roles') 캐시 사용
+        roles = [role.name for role in obj.want_roles.all()]
         if len(roles) <= 3:
             return roles
         return roles[:3] + [f"+{len(roles) - 3}"]
@@ -58,7 +59,7 @@ class TeamBuildPostDetailSerializer(serializers.ModelSerializer):
         }
     
     def get_want_roles(self, obj):
-        return list(obj.want_roles.values_list("name", flat=True))
+        return [role.name for role in obj.want_roles.all()]
     
     def get_thumbnail_basic(self, obj):
         default_path = "images/thumbnail/teambuildings/teambuilding_default.png"
@@ -90,7 +91,8 @@ class RecommendedTeamBuildPostSerializer(serializers.ModelSerializer):
         }
     
     def get_want_roles(self, obj):
-        roles = list(obj.want_roles.values_list('name', flat=True))
+        # prefetch_related('want_roles') 캐시 사용
+        roles = [role.name for role in obj.want_roles.all()]
         if len(roles) <= 4:
             return roles
         return roles[:4] + [f"+{len(roles) - 4}"]
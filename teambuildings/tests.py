@@ -1,3 +1,242 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from commons.images import register_content_images, sync_content_images
+from commons.models import UploadImage
+from games.models import GameCategory
+from .models import TeamBuildPost, TeamBuildProfile, Role
+
+
+class TeamBuildQueryCountTest(TestCase):
+    """
+    목록/상세 API 쿼리 수 고정 (게시글/프로필 수에 비례해서 늘어나지 않아야 함)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.roles = [Role.objects.create(name=f"role_{i}") for i in range(5)]
+        cls.genres = [GameCategory.objects.create(name=f"genre_{i}") for i in range(3)]
+        cls.users = [
+            User.objects.create_user(
+                email=f"user{i}@example.com", password="password1234!",
+                nickname=f"user{i}", login_type="DEFAULT", introduce="",
+            )
+            for i in range(4)
+        ]
+        cls.user = cls.users[0]
+
+    def setUp(self):
+        cache.clear()
+
+    def create_posts(self, count):
+        today = timezone.now().date()
+        for i in range(count):
+            post = TeamBuildPost.objects.create(
+                author=self.users[i % len(self.users)],
+                title=f"post {i}",
+                thumbnail="images/thumbnail/teambuildings/teambuilding_default.png",
+                purpose="PORTFOLIO",
+                duration="3M",
+                meeting_type="ONLINE",
+                deadline=today + timedelta(days=i + 1),
+                contact="contact@example.com",
+                content="<p>content</p>",
+            )
+            post.want_roles.set(self.roles[: (i % 5) + 1])
+
+    def create_profiles(self):
+        for user in self.users:
+            profile = TeamBuildProfile.objects.create(
+                author=user,
+                career="STUDENT",
+                my_role=self.roles[0],
+                purpose="PORTFOLIO",
+                duration="3M",
+                meeting_type="ONLINE",
+                contact="contact@example.com",
+                title=f"profile {user.pk}",
+                content="<p>content</p>",
+            )
+            profile.game_genre.set(self.genres)
+
+    def test_post_list_anonymous(self):
+        self.create_posts(16)
+        client = APIClient()
+        client.get(reverse("teambuildings:teambuild_post_list"))  # 추천 버킷 캐시 생성
+        # count, 게시글(+author), want_roles, 추천 in_bulk(+author), 추천 want_roles
+        with self.assertNumQueries(5):
+            response = client.get(reverse("teambuildings:teambuild_post_list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["data"]["team_build_posts"]), 12)
+        self.assertEqual(len(response.data["data"]["recommended_posts"]), 4)
+
+    def test_post_list_with_profile(self):
+        self.create_posts(16)
+        self.create_profiles()
+        client = APIClient()
+        client.force_authenticate(self.user)
+        client.get(reverse("teambuildings:teambuild_post_list"))  # 추천 버킷 캐시 생성
+        # 위 5개 + 프로필(+my_role)
+        with self.assertNumQueries(6):
+            response = client.get(reverse("teambuildings:teambuild_post_list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["data"]["is_profile"])
+        # 맞춤 추천(my_role 포함 게시글) 마감일순
+        expected = list(
+            TeamBuildPost.objects.filter(want_roles=self.roles[0]).order_by("deadline").values_list("pk", flat=True)[:4]
+        )
+        self.assertEqual([x["id"] for x in response.data["data"]["recommended_posts"]], expected)
+
+    def test_recommendation_same_deadline_newest_first(self):
+        self.create_posts(6)
+        self.create_profiles()
+        # 마지막 두 게시글을 가장 이른 마감일로 (버킷 갱신은 게시글 수정 API 를 거치지 않으므로 캐시 생성 전에 변경)
+        TeamBuildPost.objects.filter(title__in=["post 4", "post 5"]).update(deadline=timezone.now().date())
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get(reverse("teambuildings:teambuild_post_list"))
+        titles = [x["title"] for x in response.data["data"]["recommended_posts"]]
+        self.assertEqual(titles, ["post 5", "post 4", "post 0", "post 1"])
+
+    def test_recommendation_refreshed_on_close(self):
+        self.create_posts(5)
+        client = APIClient()
+        closing = [x["id"] for x in client.get(reverse("teambuildings:teambuild_post_list")).data["data"]["recommended_posts"]]
+        post = TeamBuildPost.objects.get(pk=closing[0])
+
+        author_client = APIClient()
+        author_client.force_authenticate(post.author)
+        with self.captureOnCommitCallbacks(execute=True):
+            author_client.patch(reverse("teambuildings:teambuild_post_detail", args=[post.pk]))
+
+        response = client.get(reverse("teambuildings:teambuild_post_list"))
+        recommended = [x["id"] for x in response.data["data"]["recommended_posts"]]
+        self.assertNotIn(post.pk, recommended)
+        self.assertEqual(recommended[:3], closing[1:])
+
+    def test_post_detail(self):
+        self.create_posts(1)
+        post = TeamBuildPost.objects.get()
+        client = APIClient()
+        # 게시글(+author), want_roles
+        with self.assertNumQueries(2):
+            response = client.get(reverse("teambuildings:teambuild_post_detail", args=[post.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["data"]["want_roles"]), 1)
+
+    def test_profile_list(self):
+        self.create_profiles()
+        client = APIClient()
+        # count, 프로필(+author, my_role), game_genre
+        with self.assertNumQueries(3):
+            response = client.get(reverse("teambuildings:createteamprofile"))
+        self.assertEqual(response.status_code, 200)
+
+
+class ContentTextTest(TestCase):
+    """
+    content 가 바뀐 경우에만 content_text 재추출
+    """
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(
+            email="author@example.com", password="password1234!",
+            nickname="author", login_type="DEFAULT", introduce="",
+        )
+        self.post = TeamBuildPost.objects.create(
+            author=user,
+            title="post",
+            thumbnail="images/thumbnail/teambuildings/teambuilding_default.png",
+            purpose="PORTFOLIO",
+            duration="3M",
+            meeting_type="ONLINE",
+            deadline=timezone.now().date(),
+            contact="contact@example.com",
+            content="<p>첫&nbsp;내용</p>",
+        )
+
+    def test_extract_on_create(self):
+        self.assertEqual(TeamBuildPost.objects.get().content_text, "첫 내용")
+
+    def test_skip_when_content_unchanged(self):
+        post = TeamBuildPost.objects.get()
+        post.deadline = timezone.now().date() - timedelta(days=1)
+        with mock.patch("commons.content.extract_content_text") as extract:
+            post.save()
+        extract.assert_not_called()
+        self.assertEqual(TeamBuildPost.objects.get().content_text, "첫 내용")
+
+    def test_extract_when_content_changed(self):
+        post = TeamBuildPost.objects.get()
+        post.content = "<p>바뀐 <b>내용</b></p>"
+        post.save()
+        self.assertEqual(TeamBuildPost.objects.get().content_text, "바뀐 내용")
+
+    def test_large_content_deferred_to_task(self):
+        post = TeamBuildPost.objects.get()
+        post.content = "<p>긴 내용</p>"
+        with self.settings(CONTENT_TEXT_SYNC_MAX_LENGTH=5), \
+                mock.patch("commons.tasks.update_content_text.delay") as delay, \
+                self.captureOnCommitCallbacks(execute=True):
+            post.save()
+        delay.assert_called_once_with("teambuildings.TeamBuildPost", post.pk)
+        # 태스크 실행 전까지는 이전 텍스트 유지
+        self.assertEqual(TeamBuildPost.objects.get().content_text, "첫 내용")
+
+
+class ContentImagesTest(TestCase):
+    """
+    본문 이미지 등록/정리는 쿼리 수가 이미지 수와 무관하고, S3 처리는 커밋 이후 태스크로 넘김
+    """
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="author@example.com", password="password1234!",
+            nickname="author", login_type="DEFAULT", introduce="",
+        )
+        self.post = TeamBuildPost.objects.create(
+            author=self.user,
+            title="post",
+            thumbnail="images/thumbnail/teambuildings/teambuilding_default.png",
+            purpose="PORTFOLIO",
+            duration="3M",
+            meeting_type="ONLINE",
+            deadline=timezone.now().date(),
+            contact="contact@example.com",
+            content="<p>content</p>",
+        )
+        # content type 캐시는 프로세스 단위라 다른 테스트 실행 여부에 따라 조회 쿼리가 달라지므로 미리 채워 둠
+        ContentType.objects.get_for_model(TeamBuildPost)
+
+    def srcs(self, names):
+        return [f"https://images.example.com/screenshot/teambuildings/{name}.png" for name in names]
+
+    def test_register_and_sync(self):
+        with mock.patch("commons.tasks.tag_s3_objects.delay") as tag, \
+                self.captureOnCommitCallbacks(execute=True):
+            # bulk_create
+            with self.assertNumQueries(1):
+                register_content_images(self.post, self.user, self.srcs(range(20)) + self.srcs([0]))
+        tag.assert_called_once_with([f"screenshot/teambuildings/{i}.png" for i in range(20)])
+        self.assertEqual(UploadImage.objects.count(), 20)
 
-# Create your tests here.
+        with mock.patch("commons.tasks.tag_s3_objects.delay") as tag, \
+                mock.patch("commons.tasks.delete_s3_objects.delay") as delete, \
+                self.captureOnCommitCallbacks(execute=True):
+            # 기존 src 조회 + 삭제 + bulk_create
+            with self.assertNumQueries(3):
+                sync_content_images(self.post, self.user, self.srcs(range(10, 25)))
+        self.assertEqual(sorted(delete.call_args.args[0]), sorted(f"screenshot/teambuildings/{i}.png" for i in range(10)))
+        tag.assert_called_once_with([f"screenshot/teambuildings/{i}.png" for i in range(20, 25)])
+        self.assertEqual(
+            set(UploadImage.objects.values_list("src", flat=True)), set(self.srcs(range(10, 25)))
+        )
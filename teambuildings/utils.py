@@ -1,7 +1,7 @@
-from bs4 import BeautifulSoup
 import json
 from urllib.parse import urljoin, urlparse
 
+from commons.content import parse_content
 from .models import Role
 
 
@@ -36,18 +36,14 @@ def is_absolute_url(url):
 
 
 def extract_srcs(html_text, base_url):
-    soup = BeautifulSoup(html_text, 'html.parser')
-    imgs = soup.find_all('img')
-    
+    # content_text 추출 시 파싱한 결과 재사용
     results = []
 
-    for img in imgs:
-        src = img.get('src')
-        if src:
-            if is_absolute_url(src):
-                results.append(src)
-            else:
-                results.append(urljoin(base_url, src))
+    for src in parse_content(html_text).srcs:
+        if is_absolute_url(src):
+            results.append(src)
+        else:
+            results.append(urljoin(base_url, src))
     
     return results
 
@@ -2,17 +2,14 @@ from datetime import datetime, timedelta
 import json
 import os
 import requests  # S3 사용
-from urllib.parse import urlparse
-
-import boto3
 
 from django.utils import timezone
+from django.db import transaction
 from django.db.models import Q, Case, When, Value, IntegerField
 from django.core.files.storage import default_storage
 from django.core.files.images import ImageFile
 from django.core.files.base import ContentFile  # S3 사용
 from django.contrib.auth import get_user_model
-from django.contrib.contenttypes.models import ContentType
 
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
@@ -35,13 +32,15 @@ from .serializers import (
     TeamBuildProfileSerializer,
 )
 from .utils import validate_want_roles, validate_choice, extract_srcs, parse_links, get_valid_duration_keys
+from .recommendations import get_recommended_posts, post_buckets, refresh_post_buckets
 
 from games.models import GameCategory
 from games.utils import validate_image
 
-from spartagames.config import AWS_AUTH, AWS_S3_BUCKET_NAME, AWS_S3_REGION_NAME, AWS_S3_CUSTOM_DOMAIN, AWS_S3_BUCKET_IMAGES
+from spartagames.config import AWS_S3_CUSTOM_DOMAIN, AWS_S3_BUCKET_IMAGES
 from spartagames.utils import std_response
-from commons.models import UploadImage
+from commons.counters import adjust_counters
+from commons.images import register_content_images, sync_content_images, delete_content_images
 
 
 @api_view(["GET"])
@@ -109,53 +108,20 @@ class TeamBuildPostAPIView(APIView):
     def get(self, request):
         today = timezone.now().date()
 
-        teambuildposts = TeamBuildPost.objects.filter(is_visible=True).annotate(
+        teambuildposts = TeamBuildPost.objects.filter(is_visible=True).select_related('author').prefetch_related('want_roles').annotate(
             is_open_priority=Case(
                 When(deadline__gte=today, then=Value(0)),
                 default= Value(1),
                 output_field=IntegerField()
             )
         ).order_by('is_open_priority', '-create_dt')
-        # 마감하지 않은 것만 추천하도록 조건 추가
-        recommendedposts = TeamBuildPost.objects.filter(is_visible=True, deadline__gte=timezone.now().date())
-
         # 추천게시글/마감임박 게시글
-        if not request.user.is_authenticated:
-            # 비회원 유저 : 마감 임박 4개
-            recommendedposts = recommendedposts.order_by('deadline')[:4]
-        else:
-            # 유저 프로필 존재 여부 확인
-            profile = TeamBuildProfile.objects.filter(author=request.user).first()
-            
-            if profile:
-                # 프로필 존재하면 직업 필터
-                my_role = profile.my_role
-                purpose = profile.purpose
-                duration = profile.duration
-
-                valid_duration = get_valid_duration_keys(duration)
-
-                _qs = recommendedposts.filter(
-                    want_roles=my_role,
-                    purpose=purpose,
-                    duration__in=valid_duration,
-                ).order_by('-create_dt')[:4]
-                
-                # 맞춤 팀빌딩 모집글 개수가 4개 미만인 경우, 마감 임박 글을 추가하도록 수정
-                curr_cnt = _qs.count()
-                if curr_cnt < 4:
-                    # 마감 임박 팀빌딩 모집글 리스트
-                    # 맞춤 팀빌딩 모집글에 있는 경우 제외 (.exclude(pk__in=[row.pk for row in _qs]))
-                    # 마감 임박 팀빌딩 모집글 리스트는 본래 마감기한 순으로 정렬됨 (.order_by('deadline'))
-                    # (4 - 맞춤 팀빌딩 모집글 개수) 개수만큼 가져옴 ([:4 - curr_cnt])
-                    _extra_qs = recommendedposts.exclude(pk__in=[row.pk for row in _qs]).order_by('deadline')[:4 - curr_cnt]
-                    # 최종적으로 4개로 제한 (이중 체크)
-                    recommendedposts = (_qs | _extra_qs)[:4]
-                else:
-                    recommendedposts = _qs
-            else:
-                # 유저 프로필이 없으면 마감 임박 4개
-                recommendedposts = recommendedposts.order_by('deadline')[:4]
+        # 비회원 또는 프로필이 없는 유저 : 마감 임박 4개
+        # 프로필이 있는 유저 : 맞춤 팀빌딩 모집글 (4개 미만이면 마감 임박 글로 채움)
+        profile = None
+        if request.user.is_authenticated:
+            profile = TeamBuildProfile.objects.select_related('my_role').filter(author=request.user).first()
+        recommendedposts = get_recommended_posts(profile)
 
         if request.query_params.get('status_chip') == "open":
             teambuildposts = teambuildposts.filter(
@@ -230,10 +196,8 @@ class TeamBuildPostAPIView(APIView):
         # 추천 게시글 직렬화
         recommended_serializer = RecommendedTeamBuildPostSerializer(recommendedposts, many=True)
 
-        # 프로필 존재 여부
-        profile_exists = False
-        if request.user.is_authenticated:
-            profile_exists = TeamBuildProfile.objects.filter(author=request.user).exists()
+        # 프로필 존재 여부 (추천 게시글 조회 시 가져온 프로필 재사용)
+        profile_exists = profile is not None
 
         data = {
             "team_build_posts": response_data["results"],
@@ -345,41 +309,11 @@ class TeamBuildPostAPIView(APIView):
 
         # 역할 추가
         post.want_roles.set(Role.objects.filter(name__in=want_roles))
+        refresh_post_buckets(post)
 
-        # S3 클라이언트 불러오기
-        s3 = boto3.client(
-            's3',
-            aws_access_key_id=AWS_AUTH["aws_access_key_id"],
-            aws_secret_access_key=AWS_AUTH["aws_secret_access_key"],
-            region_name=AWS_S3_REGION_NAME,
-        )
-
-        # content 에서 img src 파싱
+        # content 에서 img src 파싱 → 이미지 등록 (S3 태깅은 백그라운드)
         srcs = extract_srcs(post.content, base_url=f"{AWS_S3_BUCKET_IMAGES}/screenshot/teambuildings")
-        for src in srcs:
-            # DB 등록
-            UploadImage.objects.create(
-                content_type=ContentType.objects.get_for_model(post),
-                content_id=post.id,
-                uploader=user,
-                src=src,
-                is_used=True
-            )
-            
-            # S3 태깅하기
-            s3_file_key = urlparse(src).path.lstrip('/')
-            s3.put_object_tagging(
-                Bucket=AWS_S3_BUCKET_NAME,
-                Key=s3_file_key,
-                Tagging={
-                    'TagSet': [
-                        {
-                            'Key': 'is_used',
-                            'Value': 'true'
-                        }
-                    ]
-                }
-            )
+        register_content_images(post, user, srcs)
 
         return std_response(
             data={"post_id": post.pk},
@@ -405,7 +339,8 @@ def teambuild_post_search(request):
         )
 
     # 검색 키워드에 맞춰 필터링 및 최신순 정렬
-    teambuild_posts = TeamBuildPost.objects.filter(query).distinct().order_by('-create_dt')
+    teambuild_posts = TeamBuildPost.objects.filter(query).select_related('author').prefetch_related(
+        'want_roles').distinct().order_by('-create_dt')
 
     # '모집중' 체크박스 체크 시
     if request.query_params.get('status_chip') == "open":
@@ -507,7 +442,7 @@ class TeamBuildPostDetailAPIView(APIView):
 
     def get_object(self, post_id):
         try:
-            return TeamBuildPost.objects.get(id=post_id, is_visible=True)
+            return TeamBuildPost.objects.select_related('author').get(id=post_id, is_visible=True)
         except TeamBuildPost.DoesNotExist:
             return std_response(
                 message="해당 팀빌딩 게시글을 찾을 수 없습니다.",
@@ -545,6 +480,8 @@ class TeamBuildPostDetailAPIView(APIView):
                 error_code="CLIENT_FAIL",
                 status_code=status.HTTP_403_FORBIDDEN
             )
+        # 수정 전 추천 버킷 (역할/목적/기간 변경 시 이전 버킷도 갱신)
+        old_buckets = post_buckets(post)
         
         data = request.data
         changes = []
@@ -561,57 +498,9 @@ class TeamBuildPostDetailAPIView(APIView):
             changes.append("content")
             post.content = content
         
-            # content 에서 img src 파싱
-            old_srcs = [x.src for x in UploadImage.objects.filter(content_type=ContentType.objects.get_for_model(post), content_id=post.id, is_used=True)]
+            # content 에서 img src 파싱 → 사라진 이미지 삭제, 추가된 이미지 등록 (S3 처리는 백그라운드)
             new_srcs = extract_srcs(post.content, base_url=f"{AWS_S3_BUCKET_IMAGES}/screenshot/teambuildings")
-            
-            # S3 클라이언트 불러오기
-            s3 = boto3.client(
-                's3',
-                aws_access_key_id=AWS_AUTH["aws_access_key_id"],
-                aws_secret_access_key=AWS_AUTH["aws_secret_access_key"],
-                region_name=AWS_S3_REGION_NAME,
-            )
-            
-            # 수정 이후 사라진 이미지에 대해, DB 데이터 삭제 및 S3 오브젝트 삭제 처리
-            delete_srcs = set(old_srcs) - set(new_srcs)
-            if delete_srcs:
-                # DB 데이터 삭제
-                for src in delete_srcs:
-                    obj = UploadImage.objects.get(src=src)
-                    obj.delete()
-                # S3 오브젝트 삭제
-                s3.delete_objects(
-                    Bucket=AWS_S3_BUCKET_NAME,
-                    Delete={
-                        'Objects': [{'Key': urlparse(x).path.lstrip('/')} for x in delete_srcs]
-                    }
-                )
-                
-            # 수정 이후 추가된 이미지에 대해 UploadImage에 데이터 추가 및 S3 오브젝트 태깅
-            add_srcs = set(new_srcs) - set(old_srcs)
-            if add_srcs:
-                # DB 데이터 추가
-                _add_file_data = [
-                    UploadImage(
-                        content_type=ContentType.objects.get_for_model(post),
-                        content_id=post.id,
-                        uploader=request.user,
-                        src=x,
-                        is_used=True
-                    ) for x in add_srcs
-                ]
-                UploadImage.objects.bulk_create(_add_file_data)
-                # S3 오브젝트 태깅
-                for src in add_srcs:
-                    s3_file_key = urlparse(src).path.lstrip('/')
-                    s3.put_object_tagging(
-                        Bucket=AWS_S3_BUCKET_NAME,
-                        Key=s3_file_key,
-                        Tagging={
-                            'TagSet': [{'Key': 'is_used', 'Value': 'true'}]
-                        }
-                    )
+            sync_content_images(post, request.user, new_srcs)
 
         # contact
         contact = data.get("contact", post.contact)
@@ -686,6 +575,7 @@ class TeamBuildPostDetailAPIView(APIView):
         # 변경사항이 있으면 저장
         if changes:
             post.save()
+            refresh_post_buckets(post, old_buckets)
 
         return std_response(
             data={
@@ -713,33 +603,13 @@ class TeamBuildPostDetailAPIView(APIView):
                 status_code=status.HTTP_403_FORBIDDEN
             )
 
-        # 게시물이 삭제됨에 따라 사용된 모든 이미지에 대해, DB 데이터 삭제 및 S3 오브젝트 삭제 처리
-        rows = UploadImage.objects.filter(content_type=ContentType.objects.get_for_model(post), content_id=post.id, is_used=True)
-        srcs = [x.src for x in rows]
-        
-        if rows and srcs:
-            # DB 데이터 삭제
-            rows.delete()
-            
-            # S3 오브젝트 삭제
-            # S3 클라이언트 불러오기
-            s3 = boto3.client(
-                's3',
-                aws_access_key_id=AWS_AUTH["aws_access_key_id"],
-                aws_secret_access_key=AWS_AUTH["aws_secret_access_key"],
-                region_name=AWS_S3_REGION_NAME,
-            )
-            # 삭제
-            s3.delete_objects(
-                Bucket=AWS_S3_BUCKET_NAME,
-                Delete={
-                    'Objects': [{'Key': urlparse(x).path.lstrip('/')} for x in srcs]
-                }
-            )
+        # 게시물이 삭제됨에 따라 사용된 모든 이미지에 대해, DB 데이터 삭제 및 S3 오브젝트 삭제 처리 (S3 는 백그라운드)
+        delete_content_images(post)
 
         # 팀빌딩 게시글 소프트 삭제
         post.is_visible = False
         post.save()
+        refresh_post_buckets(post)
         
         return std_response(
             message="팀빌딩 게시글이 삭제되었습니다.",
@@ -768,6 +638,7 @@ class TeamBuildPostDetailAPIView(APIView):
 
         post.deadline = new_deadline
         post.save()
+        refresh_post_buckets(post)
 
         return std_response(
             message="팀빌딩 게시글이 마감되었습니다.",
@@ -842,7 +713,9 @@ class TeamBuildPostCommentAPIView(APIView):
         serializer = TeamBuildPostCommentSerializer(data=request.data)
         
         if serializer.is_valid(raise_exception=True):
-            serializer.save(author=request.user, post=post)  # 데이터베이스에 저장
+            with transaction.atomic():
+                serializer.save(author=request.user, post=post)  # 데이터베이스에 저장
+                adjust_counters(TeamBuildPost, post.pk, comment_cnt=1)
             return std_response(
                 data=serializer.data,
                 status="success",
@@ -962,8 +835,11 @@ class TeamBuildPostCommentDetailAPIView(APIView):
                     error_code="SERVER_FAIL"
                 )
             
-            comment.is_visible = False
-            comment.save()
+            with transaction.atomic():
+                # 동시 삭제 요청 시 한 번만 반영되도록 조건부 UPDATE
+                if TeamBuildPostComment.objects.filter(pk=comment.pk, is_visible=True).update(
+                        is_visible=False, update_dt=timezone.now()):
+                    adjust_counters(TeamBuildPost, post.pk, comment_cnt=-1)
 
             return std_response(
                 message="댓글 삭제를 완료했습니다",
@@ -985,7 +861,8 @@ class CreateTeamBuildProfileAPIView(APIView):
     # 팀빌딩 프로필 목록 호출
     def get(self, request):
         # profiles = TeamBuildProfile.objects.order_by('-create_dt')
-        profiles = TeamBuildProfile.objects.order_by('-update_dt')
+        profiles = TeamBuildProfile.objects.select_related('author', 'my_role').prefetch_related(
+            'game_genre').order_by('-update_dt')
 
         # 필터: career
         career_list = request.query_params.getlist('career')
@@ -1167,38 +1044,9 @@ class CreateTeamBuildProfileAPIView(APIView):
         )
         profile.game_genre.set(game_genres)
 
-        # S3 클라이언트 불러오기
-        s3 = boto3.client(
-            's3',
-            aws_access_key_id=AWS_AUTH["aws_access_key_id"],
-            aws_secret_access_key=AWS_AUTH["aws_secret_access_key"],
-            region_name=AWS_S3_REGION_NAME,
-        )
-
-        # content 에서 img src 파싱
+        # content 에서 img src 파싱 → 이미지 등록 (S3 태깅은 백그라운드)
         srcs = extract_srcs(profile.content, base_url=f"{AWS_S3_BUCKET_IMAGES}/screenshot/teambuildings")
-        for src in srcs:
-            UploadImage.objects.create(
-                content_type=ContentType.objects.get_for_model(profile),
-                content_id=profile.id,
-                uploader=author,
-                src=src,
-                is_used=True
-            )
-
-            s3_file_key = urlparse(src).path.lstrip('/')
-            s3.put_object_tagging(
-                Bucket=AWS_S3_BUCKET_NAME,
-                Key=s3_file_key,
-                Tagging={
-                    'TagSet': [
-                        {
-                            'Key': 'is_used',
-                            'Value': 'true'
-                        }
-                    ]
-                }
-            )
+        register_content_images(profile, author, srcs)
 
         return std_response(
             data={"profile_id": profile.id},
@@ -1224,7 +1072,8 @@ def teambuild_profile_search(request):
 
     # 검색 키워드에 맞춰 필터링 및 최신순 정렬
     # teambuild_profiles = TeamBuildProfile.objects.filter(query).distinct().order_by('-create_dt')
-    teambuild_profiles = TeamBuildProfile.objects.filter(query).distinct().order_by('-update_dt')
+    teambuild_profiles = TeamBuildProfile.objects.filter(query).select_related(
+        'author', 'my_role').prefetch_related('game_genre').distinct().order_by('-update_dt')
 
     # 필터 '현재 상태'(career) 유효성 검사 및 필터링
     career_list = request.query_params.getlist('career')
@@ -1335,7 +1184,7 @@ class TeamBuildProfileAPIView(APIView):
                 status_code=status.HTTP_404_NOT_FOUND
             )
         try:
-            profile = TeamBuildProfile.objects.get(author=user)
+            profile = TeamBuildProfile.objects.select_related('author', 'my_role').get(author=user)
         except TeamBuildProfile.DoesNotExist:
             return std_response(
                 message="아직 생성하지 않은 유저입니다.",
@@ -1408,57 +1257,9 @@ class TeamBuildProfileAPIView(APIView):
         profile.portfolio = portfolio
         
         # 이미지 처리
-        # content 에서 img src 파싱
-        old_srcs = [x.src for x in UploadImage.objects.filter(content_type=ContentType.objects.get_for_model(profile), content_id=profile.id, is_used=True)]
+        # content 에서 img src 파싱 → 사라진 이미지 삭제, 추가된 이미지 등록 (S3 처리는 백그라운드)
         new_srcs = extract_srcs(profile.content, base_url=f"{AWS_S3_BUCKET_IMAGES}/screenshot/teambuildings")
-        
-        # S3 클라이언트 불러오기
-        s3 = boto3.client(
-            's3',
-            aws_access_key_id=AWS_AUTH["aws_access_key_id"],
-            aws_secret_access_key=AWS_AUTH["aws_secret_access_key"],
-            region_name=AWS_S3_REGION_NAME,
-        )
-        
-        # 수정 이후 사라진 이미지에 대해, DB 데이터 삭제 및 S3 오브젝트 삭제 처리
-        delete_srcs = set(old_srcs) - set(new_srcs)
-        if delete_srcs:
-            # DB 데이터 삭제
-            for src in delete_srcs:
-                obj = UploadImage.objects.get(src=src)
-                obj.delete()
-            # S3 오브젝트 삭제
-            s3.delete_objects(
-                Bucket=AWS_S3_BUCKET_NAME,
-                Delete={
-                    'Objects': [{'Key': urlparse(x).path.lstrip('/')} for x in delete_srcs]
-                }
-            )
-        
-        # 수정 이후 추가된 이미지에 대해 UploadImage에 데이터 추가 및 S3 오브젝트 태깅
-        add_srcs = set(new_srcs) - set(old_srcs)
-        if add_srcs:
-            # DB 데이터 추가
-            _add_file_data = [
-                UploadImage(
-                    content_type=ContentType.objects.get_for_model(profile),
-                    content_id=profile.id,
-                    uploader=request.user,
-                    src=x,
-                    is_used=True
-                ) for x in add_srcs
-            ]
-            UploadImage.objects.bulk_create(_add_file_data)
-            # S3 오브젝트 태깅
-            for src in set(new_srcs) - set(old_srcs):
-                s3_file_key = urlparse(src).path.lstrip('/')
-                s3.put_object_tagging(
-                    Bucket=AWS_S3_BUCKET_NAME,
-                    Key=s3_file_key,
-                    Tagging={
-                        'TagSet': [{'Key': 'is_used', 'Value': 'true'}]
-                    }
-                )
+        sync_content_images(profile, request.user, new_srcs)
 
         profile.save()
 
@@ -1489,29 +1290,8 @@ class TeamBuildProfileAPIView(APIView):
                 status_code=status.HTTP_403_FORBIDDEN
             )
 
-        # 게시물이 삭제됨에 따라 사용된 모든 이미지에 대해, DB 데이터 삭제 및 S3 오브젝트 삭제 처리
-        rows = UploadImage.objects.filter(content_type=ContentType.objects.get_for_model(profile), content_id=profile.id, is_used=True)
-        srcs = [x.src for x in rows]
-        
-        if rows and srcs:
-            # DB 데이터 삭제
-            rows.delete()
-            
-            # S3 오브젝트 삭제
-            # S3 클라이언트 불러오기
-            s3 = boto3.client(
-                's3',
-                aws_access_key_id=AWS_AUTH["aws_access_key_id"],
-                aws_secret_access_key=AWS_AUTH["aws_secret_access_key"],
-                region_name=AWS_S3_REGION_NAME,
-            )
-            # 삭제
-            s3.delete_objects(
-                Bucket=AWS_S3_BUCKET_NAME,
-                Delete={
-                    'Objects': [{'Key': urlparse(x).path.lstrip('/')} for x in srcs]
-                }
-            )
+        # 게시물이 삭제됨에 따라 사용된 모든 이미지에 대해, DB 데이터 삭제 및 S3 오브젝트 삭제 처리 (S3 는 백그라운드)
+        delete_content_images(profile)
 
         # 팀빌딩 프로필 완전 삭제
         profile.delete()
@@ -1,3 +1,54 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
 
-# Create your tests here.
+from games.models import GameCategory
+
+
+class OwnProfileTest(TestCase):
+    """
+    본인 페이지는 인증 단계에서 불러온 유저를 재사용 (회원 재조회 없음)
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            email="member@example.com", nickname="member1", password="password1234!",
+            login_type="DEFAULT", introduce="hello",
+        )
+        self.user.game_category.add(GameCategory.objects.create(name="Action"))
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        # 유저 스냅샷 캐시
+        self.client.get(reverse("users:my_games", kwargs={"user_id": self.user.pk}))
+
+    def test_profile(self):
+        # 스냅샷에 없는 컬럼 조회 + 관심 카테고리
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("users:profile", kwargs={"user_id": self.user.pk}))
+        data = response.json()["data"]
+        self.assertEqual(
+            (data["email"], data["login_type"], data["introduce"], data["game_category"]),
+            ("member@example.com", "DEFAULT", "hello", ["Action"]),
+        )
+
+    def test_update_profile_and_password(self):
+        response = self.client.put(
+            reverse("users:profile", kwargs={"user_id": self.user.pk}),
+            {"nickname": "member2", "introduce": "changed", "game_category": "Action"},
+        )
+        self.assertEqual(response.status_code, 202)
+        self.user.refresh_from_db()
+        self.assertEqual((self.user.nickname, self.user.introduce), ("member2", "changed"))
+
+        response = self.client.put(
+            reverse("users:change_password", kwargs={"user_id": self.user.pk}),
+            {"password": "password1234!", "new_password": "password5678!", "new_password_check": "password5678!"},
+        )
+        self.assertEqual(response.status_code, 202, response.content)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("password5678!"))
+        self.assertEqual(self.user.introduce, "changed")
@@ -15,7 +15,8 @@ from spartagames.pagination import CustomPagination
 
 from .serializers import MyGameListSerializer
 
-from accounts.models import EmailVerification
+from accounts.authentication import get_active_user
+from accounts.verification import CODE_VALID, check_code, discard_code, verification_failed_response
 from games.models import (
     Game,
     GameCategory,
@@ -36,7 +37,7 @@ class ProfileAPIView(APIView):
 
     def get(self, request, user_id):
         try:
-            user = get_user_model().objects.get(pk=user_id, is_active=True)
+            user = get_active_user(request, user_id, fields=("login_type", "is_maker", "introduce"))
         except get_user_model().DoesNotExist:
             return std_response(
                 message="회원정보가 존재하지 않습니다.",
@@ -74,7 +75,7 @@ class ProfileAPIView(APIView):
     def put(self, request, user_id):
         # check_password = self.request.data.get("password")
         try:
-            user = get_user_model().objects.get(pk=user_id, is_active=True)
+            user = get_active_user(request, user_id, fields=("is_maker", "introduce"))
         except get_user_model().DoesNotExist:
             return std_response(
                 message="회원정보가 존재하지 않습니다.",
@@ -193,7 +194,7 @@ class ProfileAPIView(APIView):
     def delete(self, request, user_id):
         # check_password = self.request.data.get("password")
         try:
-            user = get_user_model().objects.get(pk=user_id, is_active=True)
+            user = get_active_user(request, user_id)
         except get_user_model().DoesNotExist:
             return std_response(
                 message="회원정보가 존재하지 않습니다.",
@@ -264,7 +265,7 @@ def change_password(request, user_id):
     PASSWORD_PATTERN = re.compile(r'^(?=.*[a-zA-Z])(?=.*\d)(?=.*[~`!@#$%^&*()_\-+={}\[\]|\\:;"\'<>,.?/]).{8,32}$')
 
     try:
-        user = get_user_model().objects.get(pk=user_id, is_active=True)
+        user = get_active_user(request, user_id, fields=("login_type", "password"))
     except get_user_model().DoesNotExist:
         return std_response(
             message="회원정보가 존재하지 않습니다.",
@@ -342,37 +343,15 @@ def password_verify_code(request):
     email = request.data.get('email')
     code = request.data.get('code')
 
-    try:
-        verification = EmailVerification.objects.get(email=email)
-    except EmailVerification.DoesNotExist:
-        return std_response(
-            message=f"유효하지 않은 이메일입니다.",
-            status="error",
-            error_code="CLIENT_FAIL",
-            status_code=status.HTTP_400_BAD_REQUEST
-        )
-
-    if verification.is_expired():
-        return std_response(
-            message="인증 번호가 만료되었습니다.",
-            status="fail",
-            error_code="CLIENT_FAIL",
-            status_code=status.HTTP_400_BAD_REQUEST
-        )
+    result = check_code(email, code)
+    if result != CODE_VALID:
+        return verification_failed_response(result)
 
-    if verification.verification_code == code:
-        return std_response(
-            message=f"이메일 인증이 완료되었습니다.",
-            status="success",
-            status_code=status.HTTP_200_OK
-        )
-    else:
-        return std_response(
-            message="잘못된 인증 번호입니다",
-            status="fail",
-            error_code="CLIENT_FAIL",
-            status_code=status.HTTP_400_BAD_REQUEST
-        )
+    return std_response(
+        message=f"이메일 인증이 완료되었습니다.",
+        status="success",
+        status_code=status.HTTP_200_OK
+    )
 
 
 @api_view(["PUT"])
@@ -397,31 +376,9 @@ def reset_password(request):
             status_code=status.HTTP_403_FORBIDDEN
         )
 
-    try:
-        verification = EmailVerification.objects.get(email=email)
-    except EmailVerification.DoesNotExist:
-        return std_response(
-            message=f"유효하지 않은 이메일입니다.",
-            status="error",
-            error_code="CLIENT_FAIL",
-            status_code=status.HTTP_400_BAD_REQUEST
-        )
-
-    if verification.is_expired():
-        return std_response(
-            message="인증 번호가 만료되었습니다.",
-            status="fail",
-            error_code="CLIENT_FAIL",
-            status_code=status.HTTP_400_BAD_REQUEST
-        )
-
-    if verification.verification_code != code:
-        return std_response(
-            message="잘못된 인증 번호입니다",
-            status="fail",
-            error_code="CLIENT_FAIL",
-            status_code=status.HTTP_400_BAD_REQUEST
-        )
+    result = check_code(email, code)
+    if result != CODE_VALID:
+        return verification_failed_response(result)
     
     # new password 유효성 검사
     if not PASSWORD_PATTERN.match(new_password):
@@ -441,8 +398,8 @@ def reset_password(request):
 
     user.set_password(new_password)
     user.save()
-    # 기존 이메일 인증 데이터 삭제
-    EmailVerification.objects.filter(email=email).delete()
+    # 사용한 인증 번호 삭제
+    discard_code(email)
     
     return std_response(
         message=f"비밀번호 수정 완료 (회원 아이디: {user.nickname})",
@@ -454,7 +411,7 @@ def reset_password(request):
 @api_view(["GET"])
 def my_games(request, user_id):
     try:
-        user = get_user_model().objects.get(pk=user_id, is_active=True)
+        user = get_active_user(request, user_id)
     except get_user_model().DoesNotExist:
         return std_response(
             message="회원정보가 존재하지 않습니다.",
@@ -521,7 +478,7 @@ def my_games(request, user_id):
 @api_view(["GET"])
 def like_games(request, user_id):
     try:
-        user = get_user_model().objects.get(pk=user_id, is_active=True)
+        user = get_active_user(request, user_id)
     except get_user_model().DoesNotExist:
         return std_response(
             message="회원정보가 존재하지 않습니다.",
@@ -591,7 +548,7 @@ def like_games(request, user_id):
 @api_view(["GET"])
 def gamepacks(request, user_id):
     try:
-        user = get_user_model().objects.get(pk=user_id, is_active=True)
+        user = get_active_user(request, user_id)
     except get_user_model().DoesNotExist:
         return std_response(
             message="회원정보가 존재하지 않습니다.",
@@ -647,7 +604,7 @@ def gamepacks(request, user_id):
 @api_view(["GET"])
 def recently_played_games(request, user_id):
     try:
-        user = get_user_model().objects.get(pk=user_id, is_active=True)
+        user = get_active_user(request, user_id)
     except get_user_model().DoesNotExist:
         return std_response(
             message="회원정보가 존재하지 않습니다.",